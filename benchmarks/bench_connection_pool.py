@@ -0,0 +1,84 @@
+"""
+Connection Pool Benchmark
+=========================
+Compares the old "open a connection per call" mode against the pooled,
+per-thread persistent connections used by get_db_connection.
+
+Run from the project root:
+    python -m benchmarks.bench_connection_pool
+    python -m benchmarks.bench_connection_pool --calls 5000 --threads 4
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+from database import db_connection
+from database.initialize_db import create_tables
+from repositories.course_repo import CourseRepository
+
+
+def _seed(course_count=50):
+    with db_connection.get_db_connection() as conn:
+        conn.executemany(
+            "INSERT INTO courses (code, name, description, credits, semester, max_students) "
+            "VALUES (?, ?, ?, 3, 'Fall 2025', 30)",
+            [(f"BEN{i:03d}", f"Benchmark Course {i}", "Seed row") for i in range(course_count)]
+        )
+
+
+def _run_calls(calls, threads):
+    """Issues 'calls' small repository reads split across 'threads' threads."""
+    repo = CourseRepository()
+    per_thread = calls // threads
+
+    def worker():
+        for i in range(per_thread):
+            repo.get_by_id((i % 50) + 1)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start, per_thread * threads
+
+
+def run(calls=2000, threads=1):
+    tmp_dir = tempfile.mkdtemp(prefix="sms_bench_")
+    db_path = os.path.join(tmp_dir, "bench.db")
+    results = {}
+
+    try:
+        db_connection.configure_pool(db_path=db_path)
+        create_tables()
+        _seed()
+
+        for label, enabled in (("per-call connections", False), ("pooled connections", True)):
+            db_connection.configure_pool(enabled=enabled)
+            elapsed, total = _run_calls(calls, threads)
+            results[label] = elapsed
+            print(f"{label:<22} {total:>7} calls  {elapsed * 1000:9.1f} ms  "
+                  f"{elapsed / total * 1_000_000:8.1f} us/call")
+
+        speedup = results["per-call connections"] / results["pooled connections"]
+        print(f"Speedup: {speedup:.1f}x")
+        return results
+    finally:
+        db_connection.close_pool()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pooled vs per-call SQLite connections.")
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=1)
+    args = parser.parse_args()
+    run(args.calls, args.threads)
+
+
+if __name__ == "__main__":
+    main()
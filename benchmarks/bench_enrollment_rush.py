@@ -0,0 +1,176 @@
+"""
+Registration Rush Benchmark
+===========================
+Simulates registration opening: many students, hammering a handful of popular
+courses at the same time from many threads. Each mode runs on a fresh copy
+of a generated campus:
+
+- direct: every request calls StudentService.enroll_course on its own thread
+  (its own connection, its own write transaction)
+- queued: every request goes through EnrollmentQueue (one writer, batched commits)
+
+Reported per mode: sustained requests/second, request latency (p50 / p95),
+seats admitted vs refused, failures (e.g. 'database is locked') and whether
+any course ended up over capacity.
+
+Run from the project root:
+    python -m benchmarks.bench_enrollment_rush
+    python -m benchmarks.bench_enrollment_rush --students 1000 --courses 5 --seats 60 --threads 32
+"""
+import argparse
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+
+from benchmarks.bench_services import get_fixture
+from database import db_connection
+from services.enrollment_queue import EnrollmentQueue
+from services.student_service import StudentService
+
+
+def prepare(db_path, courses, seats, students, seed):
+    """
+    Opens registration for the 'courses' largest courses: their rosters are emptied
+    and capacity set to 'seats'. Returns (course_ids, user_ids) for 'students' students.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        course_ids = [row[0] for row in conn.execute(
+            "SELECT id FROM courses ORDER BY enrolled_count DESC, id LIMIT ?", (courses,))]
+        marks = ", ".join("?" * len(course_ids))
+        conn.execute(f"DELETE FROM enrollments WHERE course_id IN ({marks})", course_ids)
+        conn.execute(f"UPDATE courses SET max_students = ? WHERE id IN ({marks})", [seats] + course_ids)
+        user_ids = [row[0] for row in conn.execute(
+            "SELECT user_id FROM students ORDER BY id LIMIT ?", (students,))]
+        conn.commit()
+    finally:
+        conn.close()
+
+    rng = random.Random(seed)
+    rng.shuffle(user_ids)
+    return course_ids, user_ids
+
+
+def over_capacity(db_path, course_ids):
+    """Courses holding more enrolled students than seats (must be 0)."""
+    conn = sqlite3.connect(db_path)
+    try:
+        marks = ", ".join("?" * len(course_ids))
+        return conn.execute(f"""
+            SELECT COUNT(*) FROM courses c
+            WHERE c.id IN ({marks}) AND c.max_students < (
+                SELECT COUNT(*) FROM enrollments e WHERE e.course_id = c.id AND e.status = 'enrolled')
+        """, course_ids).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def rush(enroll, requests, threads):
+    """Runs every (user_id, course_id) request through 'enroll' from 'threads' threads."""
+    pending = iter(requests)
+    pending_lock = threading.Lock()
+    latencies, outcomes = [], {"admitted": 0, "refused": 0, "failed": 0}
+    results_lock = threading.Lock()
+
+    def worker():
+        try:
+            while True:
+                with pending_lock:
+                    request = next(pending, None)
+                if request is None:
+                    return
+                start = time.perf_counter()
+                try:
+                    enroll(*request)
+                    outcome = "admitted"
+                except Exception as e:
+                    outcome = "refused" if "full" in str(e) or "Already" in str(e) else "failed"
+                elapsed = time.perf_counter() - start
+                with results_lock:
+                    latencies.append(elapsed)
+                    outcomes[outcome] += 1
+        finally:
+            db_connection.release_thread_connection()
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    return time.perf_counter() - start, sorted(latencies), outcomes
+
+
+def run(size="small", students=600, courses=5, seats=40, threads=16, seed=7):
+    source = get_fixture(size)
+    results = {}
+
+    print(f"{students} students x 2 requests on {courses} courses with {seats} seats each, "
+          f"{threads} threads")
+    print(f"{'mode':<8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'admitted':>10}"
+          f"{'refused':>9}{'failed':>8}{'over cap':>10}")
+
+    for mode in ("direct", "queued"):
+        tmp_dir = tempfile.mkdtemp(prefix="sms_rush_")
+        db_path = os.path.join(tmp_dir, "rush.db")
+        shutil.copy(source, db_path)
+        queue = None
+        try:
+            course_ids, user_ids = prepare(db_path, courses, seats, students, seed)
+            rng = random.Random(seed)
+            # Everyone tries for two of the popular courses
+            requests = [(user_id, course_id) for user_id in user_ids
+                        for course_id in rng.sample(course_ids, min(2, len(course_ids)))]
+
+            # One connection per requesting thread plus the writer
+            db_connection.configure_pool(db_path=db_path, max_size=threads + 2)
+            if mode == "direct":
+                enroll = StudentService().enroll_course
+            else:
+                queue = EnrollmentQueue()
+                enroll = queue.enroll
+
+            elapsed, latencies, outcomes = rush(enroll, requests, threads)
+            if queue is not None:
+                queue.shutdown()
+            db_connection.close_pool()
+
+            stats = {
+                "requests_per_s": round(len(requests) / elapsed, 1),
+                "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2),
+                "p95_ms": round(latencies[int(0.95 * (len(latencies) - 1))] * 1000, 2),
+                "over_capacity": over_capacity(db_path, course_ids),
+                **outcomes,
+            }
+            if queue is not None:
+                stats["avg_batch"] = queue.metrics()["avg_batch"]
+            results[mode] = stats
+            print(f"{mode:<8}{stats['requests_per_s']:>10.1f}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+                  f"{stats['admitted']:>10}{stats['refused']:>9}{stats['failed']:>8}{stats['over_capacity']:>10}")
+        finally:
+            db_connection.close_pool()
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    if "avg_batch" in results.get("queued", {}):
+        print(f"\nqueued: {results['queued']['avg_batch']} requests per transaction on average")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark enrollment under a registration rush.")
+    parser.add_argument("--size", default="small")
+    parser.add_argument("--students", type=int, default=600)
+    parser.add_argument("--courses", type=int, default=5)
+    parser.add_argument("--seats", type=int, default=40)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    run(args.size, args.students, args.courses, args.seats, args.threads, args.seed)
+
+
+if __name__ == "__main__":
+    main()
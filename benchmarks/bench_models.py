@@ -0,0 +1,127 @@
+"""
+Model Hydration Benchmark
+=========================
+Measures the cost of turning database rows into model objects, the work
+behind every grading queue and catalog page.
+
+For each model, N rows from a generated campus are hydrated two ways:
+- validated: row -> constructor, which runs every setter (how from_row used to work)
+- trusted:   from_row(), which fills the slots directly (rows from our DB)
+
+Reported per model: microseconds per object and bytes retained per object.
+
+Run from the project root:
+    python -m benchmarks.bench_models
+    python -m benchmarks.bench_models --rows 10000 --size medium
+"""
+import argparse
+import gc
+import itertools
+import sqlite3
+import time
+import tracemalloc
+
+from benchmarks.bench_services import get_fixture
+from models.assignment import Assignment
+from models.course import Course
+from models.grade import Grade
+from models.notification import Notification
+from models.submission import Submission
+
+# model -> (source query, row -> constructor kwargs)
+MODELS = {
+    Course: (
+        "SELECT * FROM courses",
+        lambda r: dict(id=r["id"], code=r["code"], name=r["name"], description=r["description"],
+                       credits=r["credits"], semester=r["semester"], max_students=r["max_students"],
+                       instructor_id=r["instructor_id"]),
+    ),
+    Assignment: (
+        "SELECT * FROM assignments",
+        lambda r: dict(id=r["id"], course_id=r["course_id"], title=r["title"], description=r["description"],
+                       type=r["type"], due_date=r["due_date"], max_score=r["max_score"]),
+    ),
+    Submission: (
+        "SELECT s.*, g.grade_value, g.feedback FROM submissions s LEFT JOIN grades g ON g.submission_id = s.id",
+        lambda r: dict(id=r["id"], assignment_id=r["assignment_id"], student_id=r["student_id"],
+                       content=r["content"], submitted_at=r["submitted_at"], grade=r["grade_value"],
+                       feedback=r["feedback"], status="graded" if r["grade_value"] else "submitted"),
+    ),
+    Grade: (
+        "SELECT * FROM grades",
+        lambda r: dict(id=r["id"], submission_id=r["submission_id"], grade_value=r["grade_value"],
+                       feedback=r["feedback"]),
+    ),
+    Notification: (
+        "SELECT * FROM notifications",
+        lambda r: dict(id=r["id"], user_id=r["user_id"], announcement_id=r["announcement_id"],
+                       read_flag=r["read_flag"], sent_at=r["sent_at"]),
+    ),
+}
+
+
+def load_rows(db_path, sql, count):
+    """'count' sqlite3.Row objects, repeating the table's rows if it is smaller."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        rows = conn.execute(f"{sql} LIMIT ?", (count,)).fetchall()
+    finally:
+        conn.close()
+    if not rows:
+        return []
+    return list(itertools.islice(itertools.cycle(rows), count))
+
+
+def measure(build, items, repeats):
+    """Best-of-'repeats' time per object (us) and memory retained per object (bytes)."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        objects = [build(item) for item in items]
+        best = min(best, time.perf_counter() - start)
+        del objects
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(item) for item in items]
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del objects
+
+    return best / len(items) * 1e6, retained / len(items)
+
+
+def run(rows=10_000, size="medium", repeats=5):
+    db_path = get_fixture(size)
+    results = {}
+
+    print(f"{'model':<14}{'validated us':>14}{'trusted us':>12}{'speedup':>9}{'bytes/obj':>11}")
+    for model, (sql, to_kwargs) in MODELS.items():
+        source = load_rows(db_path, sql, rows)
+        if not source:
+            continue
+        validated_us, _ = measure(lambda r: model(**to_kwargs(r)), source, repeats)
+        trusted_us, size_bytes = measure(model.from_row, source, repeats)
+        results[model.__name__] = {
+            "validated_us": round(validated_us, 3),
+            "trusted_us": round(trusted_us, 3),
+            "bytes_per_object": round(size_bytes),
+        }
+        print(f"{model.__name__:<14}{validated_us:>14.2f}{trusted_us:>12.2f}"
+              f"{validated_us / trusted_us:>8.1f}x{size_bytes:>11.0f}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark model hydration from database rows.")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--size", default="medium")
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    run(args.rows, args.size, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
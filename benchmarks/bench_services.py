@@ -0,0 +1,239 @@
+"""
+Service-Level Benchmark Suite
+=============================
+Times every public read path against generated campuses of increasing size
+and records latency plus the number of SQL statements each call issues.
+
+- Fixtures come from database.generate_campus and are cached between runs.
+- Results are written as JSON (--output) and can be diffed against a stored
+  baseline (--baseline). A path regresses when its query count grows or its
+  median latency grows by more than --tolerance (and by at least --min-delta-ms,
+  so sub-millisecond noise on fast paths is ignored). Regressions exit with code 1.
+
+Run from the project root:
+    python -m benchmarks.bench_services
+    python -m benchmarks.bench_services --sizes small medium large --output report.json
+    python -m benchmarks.bench_services --baseline benchmarks/baseline.json
+    python -m benchmarks.bench_services --save-baseline benchmarks/baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date
+
+from core.cache import ServiceCache
+from core.query_recorder import QueryRecorder
+from database import db_connection
+from database.generate_campus import generate_campus
+from database.initialize_db import create_tables
+
+from repositories.notification_repo import NotificationRepository
+from services.assignment_service import AssignmentService
+from services.course_service import CourseService
+from services.instructor_service import InstructorService
+from services.student_service import StudentService
+
+DEFAULT_CACHE_DIR = os.path.join(tempfile.gettempdir(), "sms_bench")
+DEFAULT_SEED = 42
+
+
+# ---------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------
+def get_fixture(size, seed=DEFAULT_SEED, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Returns the path of a generated campus database, building it on first use.
+    Fixtures are keyed by day as well, so upcoming deadlines stay upcoming.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    today = date.today()
+    path = os.path.join(cache_dir, f"campus_{size}_{seed}_{today.isoformat()}.db")
+    if not os.path.exists(path):
+        print(f"Generating '{size}' fixture -> {path}")
+        generate_campus(path, size, seed, base_date=today, overwrite=True)
+    else:
+        # Cached fixtures may predate the latest migration
+        create_tables(path)
+    return path
+
+
+class BenchContext:
+    """Services plus representative users picked from the fixture."""
+
+    def __init__(self, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            # The student with the most coursework and the instructor with the most sections
+            self.student_user_id, self.student_profile_id = conn.execute("""
+                SELECT s.user_id, s.id FROM students s
+                JOIN submissions sub ON sub.student_id = s.id
+                GROUP BY s.id ORDER BY COUNT(*) DESC, s.id LIMIT 1
+            """).fetchone()
+            self.instructor_user_id = conn.execute("""
+                SELECT i.user_id FROM instructors i
+                JOIN courses c ON c.instructor_id = i.id
+                GROUP BY i.id ORDER BY COUNT(*) DESC, i.id LIMIT 1
+            """).fetchone()[0]
+        finally:
+            conn.close()
+
+        self.student_service = StudentService()
+        self.assignment_service = AssignmentService()
+        self.course_service = CourseService()
+        self.instructor_service = InstructorService()
+        self.notification_repo = NotificationRepository()
+
+
+# ---------------------------------------------------------
+# Benchmarked Paths
+# ---------------------------------------------------------
+PATHS = {
+    "StudentService.get_dashboard_overview":
+        lambda ctx: ctx.student_service.get_dashboard_overview(ctx.student_user_id),
+    "StudentService.get_my_courses":
+        lambda ctx: ctx.student_service.get_my_courses(ctx.student_user_id),
+    "StudentService.get_student_grades":
+        lambda ctx: ctx.student_service.get_student_grades(ctx.student_user_id),
+    "StudentService.get_upcoming_deadlines":
+        lambda ctx: ctx.student_service.get_upcoming_deadlines(ctx.student_profile_id),
+    "AssignmentService.get_student_assignments":
+        lambda ctx: ctx.assignment_service.get_student_assignments(ctx.student_user_id),
+    "CourseService.get_all_courses_with_details":
+        lambda ctx: ctx.course_service.get_all_courses_with_details(),
+    "CourseService.get_catalog_page":
+        lambda ctx: ctx.course_service.get_catalog_page(ctx.student_user_id),
+    "CourseService.get_catalog_page[search]":
+        lambda ctx: ctx.course_service.get_catalog_page(ctx.student_user_id, "intro prog"),
+    "InstructorService.get_dashboard_data":
+        lambda ctx: ctx.instructor_service.get_dashboard_data(ctx.instructor_user_id),
+    "NotificationRepository.get_dashboard_notifications":
+        lambda ctx: ctx.notification_repo.get_dashboard_notifications(ctx.student_user_id),
+}
+
+
+def measure(func, ctx, repeats):
+    """Runs one warm-up call, then 'repeats' timed calls. Returns latency and query stats."""
+    func(ctx)
+
+    timings = []
+    with QueryRecorder() as recorder:
+        for _ in range(repeats):
+            start = time.perf_counter()
+            func(ctx)
+            timings.append((time.perf_counter() - start) * 1000)
+
+    timings.sort()
+    p95_index = min(len(timings) - 1, int(round(0.95 * (len(timings) - 1))))
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[p95_index], 3),
+        "min_ms": round(timings[0], 3),
+        "queries": recorder.count // repeats,
+    }
+
+
+def run(sizes, repeats=5, seed=DEFAULT_SEED, paths=None, cache_dir=DEFAULT_CACHE_DIR):
+    selected = {name: PATHS[name] for name in (paths or PATHS)}
+    report = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "profile": db_connection.DB_PROFILE,
+            "seed": seed,
+            "repeats": repeats,
+        },
+        "results": {},
+    }
+
+    try:
+        for size in sizes:
+            db_connection.configure_pool(db_path=get_fixture(size, seed, cache_dir))
+            # Cached reads from the previous size must not leak into this one
+            ServiceCache.clear()
+            ctx = BenchContext(db_connection.DB_PATH)
+            report["results"][size] = {}
+
+            for name, func in selected.items():
+                stats = measure(func, ctx, repeats)
+                report["results"][size][name] = stats
+                print(f"[{size:<6}] {name:<52} {stats['median_ms']:>10.2f} ms  "
+                      f"p95 {stats['p95_ms']:>10.2f} ms  {stats['queries']:>6} queries")
+    finally:
+        db_connection.close_pool()
+
+    return report
+
+
+# ---------------------------------------------------------
+# Baseline Comparison
+# ---------------------------------------------------------
+def compare(report, baseline, tolerance=0.25, min_delta_ms=0.5):
+    """
+    Diffs a report against a baseline report. A latency increase counts only
+    when it exceeds both 'tolerance' (relative) and 'min_delta_ms' (absolute).
+    Returns a list of human-readable regression messages (empty = no regressions).
+    """
+    regressions = []
+    for size, paths in report["results"].items():
+        for name, current in paths.items():
+            previous = baseline.get("results", {}).get(size, {}).get(name)
+            if not previous:
+                continue
+
+            if current["queries"] > previous["queries"]:
+                regressions.append(
+                    f"[{size}] {name}: queries {previous['queries']} -> {current['queries']}"
+                )
+            delta_ms = current["median_ms"] - previous["median_ms"]
+            if delta_ms > previous["median_ms"] * tolerance and delta_ms >= min_delta_ms:
+                regressions.append(
+                    f"[{size}] {name}: median {previous['median_ms']:.2f} ms -> {current['median_ms']:.2f} ms"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark service read paths.")
+    parser.add_argument("--sizes", nargs="+", default=["small", "medium"])
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--paths", nargs="+", choices=list(PATHS), default=None)
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--output", help="Write the JSON report to this file.")
+    parser.add_argument("--baseline", help="Compare against this JSON report.")
+    parser.add_argument("--save-baseline", help="Write the report as the new baseline.")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative latency increase before flagging (default 0.25).")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5,
+                        help="Ignore latency increases smaller than this many ms (default 0.5).")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.repeats, args.seed, args.paths, args.cache_dir)
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, "w") as f:
+                json.dump(report, f, indent=2)
+            print(f"Report written to {path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance, args.min_delta_ms)
+        if regressions:
+            print("\nPerformance regressions:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
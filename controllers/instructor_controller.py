@@ -12,6 +12,17 @@ class InstructorController(BaseController):
     Coordinates between faculty profiles, courses, and grading.
     """
 
+    def _instructor_profile_id(self, user):
+        """
+        Instructor Profile ID of the logged-in user. Resolved once at login;
+        only looked up again if the session was started without it.
+        """
+        profile_id = Session.instructor_id_for(user.id)
+        if profile_id is None:
+            profile = self.get_service(InstructorService).get_instructor_profile(user.id)
+            profile_id = profile.instructor_profile_id if profile else None
+        return profile_id
+
     def load_dashboard_data(self, callback):
         """
         Fetches the instructor profile and their assigned courses.
@@ -24,7 +35,7 @@ class InstructorController(BaseController):
         def task():
             return self.get_service(InstructorService).get_dashboard_data(user.id)
 
-        self.run_async(task, callback)
+        self.run_async(task, callback, key=("instructor_dashboard", user.id))
 
     def load_course_editor_data(self, course_id, callback):
         """
@@ -53,14 +64,13 @@ class InstructorController(BaseController):
 
         def task():
             # 1. Resolve User ID -> Instructor Profile ID
-            inst_service = self.get_service(InstructorService)
-            profile = inst_service.get_instructor_profile(user.id)
-            if not profile: 
+            instructor_id = self._instructor_profile_id(user)
+            if not instructor_id: 
                  raise ValueError("Instructor profile not found.")
 
             # 2. Call Service
             service = self.get_service(AssignmentService)
-            return service.delete_assignment(profile.instructor_profile_id, assignment_id)
+            return service.delete_assignment(instructor_id, assignment_id)
 
         self.run_async(task, callback)
 
@@ -77,15 +87,14 @@ class InstructorController(BaseController):
             service = self.get_service(AssignmentService)
             
             # 2. Get Instructor Profile ID (Required for permission checks)
-            inst_service = self.get_service(InstructorService)
-            profile = inst_service.get_instructor_profile(user.id)
+            instructor_id = self._instructor_profile_id(user)
             
-            if not profile:
+            if not instructor_id:
                 raise ValueError("Instructor profile not found.")
 
             # 3. Call the Service logic we fixed earlier
             return service.grade_assignment(
-                instructor_id=profile.instructor_profile_id,
+                instructor_id=instructor_id,
                 submission_id=submission_id,
                 grade_value=float(grade_value),
                 feedback=feedback
@@ -105,14 +114,13 @@ class InstructorController(BaseController):
         if not user: return
 
         def task():
-            # 1. Get Instructor Profile
-            inst_service = self.get_service(InstructorService)
-            profile = inst_service.get_instructor_profile(user.id)
-            if not profile: return []
+            # 1. Get Instructor Profile ID
+            instructor_id = self._instructor_profile_id(user)
+            if not instructor_id: return []
 
             # 2. Get Courses
             course_service = self.get_service(CourseService)
-            return course_service.get_courses_by_instructor(profile.instructor_profile_id)
+            return course_service.get_courses_by_instructor(instructor_id)
 
         self.run_async(task, callback)
 
@@ -124,16 +132,15 @@ class InstructorController(BaseController):
             if not user: return
 
             def task():
-                # 1. Get Profile
-                inst_service = self.get_service(InstructorService)
-                profile = inst_service.get_instructor_profile(user.id)
-                if not profile: return False
+                # 1. Get Profile ID
+                instructor_id = self._instructor_profile_id(user)
+                if not instructor_id: return False
 
                 # 2. Create Announcement
                 ann_service = AnnouncementService() 
                 
                 return ann_service.create_announcement(
-                    instructor_id=profile.instructor_profile_id,
+                    instructor_id=instructor_id,
                     course_id=course_id,
                     title=title,
                     message=message
@@ -143,25 +150,32 @@ class InstructorController(BaseController):
 
     def claim_teaching_rights(self, course_id, callback):
         """Matches the name called in CampusManagerView."""
+        user = Session.current_user
+        if not user: return
+
         def task():
             # 1. Get the internal instructor profile ID
-            inst_svc = self.get_service(InstructorService)
-            profile = inst_svc.get_instructor_profile(Session.current_user.id)
+            instructor_id = self._instructor_profile_id(user)
+            if not instructor_id:
+                raise ValueError("Instructor profile not found.")
             
             # 2. Use the course service to update the database
             course_svc = self.get_service(CourseService)
             # Ensure we use the profile_id for the courses table
-            return course_svc.assign_instructor(int(course_id), profile.instructor_profile_id)
+            return course_svc.assign_instructor(int(course_id), instructor_id)
         
         self.run_async(task, callback)
 
-    def load_unassigned_courses(self, callback):
-        """Fetches courses with no instructor and returns them to the view."""
+    def load_unassigned_courses(self, callback, cursor=None):
+        """
+        Fetches one page of courses with no instructor and returns it to the view.
+        Pass the previous page's 'next_cursor' to load the next one.
+        """
         def task():
             service = self.get_service(CourseService)
-            return service.get_unassigned_courses()
+            return service.get_unassigned_courses(cursor)
         
-        self.run_async(task, callback)
+        self.run_async(task, callback, key=("unassigned_courses", cursor))
     def create_new_course(self, code, name, callback):
         def task():
             course_svc = self.get_service(CourseService)
@@ -199,17 +213,16 @@ class InstructorController(BaseController):
             if not user: return
 
             def task():
-                # 1. Get the specialized Instructor Profile 
-                inst_service = self.get_service(InstructorService)
-                profile = inst_service.get_instructor_profile(user.id)
+                # 1. Get the specialized Instructor Profile ID
+                instructor_id = self._instructor_profile_id(user)
                 
-                if not profile:
+                if not instructor_id:
                     return False
 
                 # 2. Call AssignmentService with the correct PROFILE ID
                 service = self.get_service(AssignmentService)
                 return service.create_assignment(
-                    instructor_id=profile.instructor_profile_id, #
+                    instructor_id=instructor_id,
                     course_id=course_id,
                     title=assignment_data['title'],
                     description=assignment_data['description'],
@@ -220,13 +233,16 @@ class InstructorController(BaseController):
 
             self.run_async(task, callback)
 
-    def load_assignment_submissions(self, assignment_id, callback):
-            """Fetches the list of students who submitted work for an assignment."""
+    def load_assignment_submissions(self, assignment_id, callback, cursor=None):
+            """
+            Fetches one page of the students who submitted work for an assignment.
+            Pass the previous page's 'next_cursor' to load the next one.
+            """
             def task():
                 service = self.get_service(AssignmentService)
-                return service.submission_repo.get_grading_queue(assignment_id)
+                return service.get_grading_queue(assignment_id, cursor)
             
-            self.run_async(task, callback)
+            self.run_async(task, callback, key=("grading_queue", assignment_id, cursor))
 
     def get_course_details(self, course_id, callback):
         """Fetches course data for the Editor View."""
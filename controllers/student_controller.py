@@ -6,6 +6,10 @@ from services.course_service import CourseService
 from services.assignment_service import AssignmentService
 from services.announcement_service import AnnouncementService
 from services.notification_service import NotificationService 
+from services.enrollment_queue import EnrollmentQueue
+
+# Keyed loads that show seats or the student's enrollments; stale after any enrollment write
+ENROLLMENT_LOADS = ("catalog", "student_dashboard", "student_courses")
 
 class StudentController(BaseController):
     
@@ -17,6 +21,7 @@ class StudentController(BaseController):
         """
         user = Session.current_user
         if not user: return self.navigate("login")
+        student_profile_id = Session.student_profile_id
 
         def fetch_task():
             student_service = self.get_service(StudentService)
@@ -32,7 +37,7 @@ class StudentController(BaseController):
             # 2. Get Stats (Courses, GPA, etc.)
             # If your service doesn't have these exact methods, return defaults (0 or [])
             try:
-                courses = student_service.get_my_courses(user.id)
+                courses = student_service.get_my_courses(user.id, student_profile_id)
                 gpa = student_service.calculate_gpa(student_id) 
                 deadlines = student_service.get_upcoming_deadlines(student_id)
             except Exception:
@@ -52,22 +57,35 @@ class StudentController(BaseController):
                 "upcoming_deadlines": deadlines
             }
 
-        self.run_async(fetch_task, update_view_callback)
+        self.run_async(fetch_task, update_view_callback, key=("student_dashboard", user.id))
 
     def load_my_courses(self, update_view_callback):
         user = Session.current_user
         if user:
-            self.run_async(lambda: self.get_service(StudentService).get_my_courses(user.id), update_view_callback)
+            student_profile_id = Session.student_profile_id
+            self.run_async(lambda: self.get_service(StudentService).get_my_courses(user.id, student_profile_id),
+                           update_view_callback,
+                           key=("student_courses", user.id))
 
     # --- NOTIFICATIONS LOGIC 
-    def load_notifications(self, callback):
-        """Fetches list of notifications for the Notifications View."""
+    def load_notifications(self, callback, cursor=None):
+        """
+        Fetches one page of notifications for the Notifications View.
+        Pass the previous page's 'next_cursor' to load the next one.
+        """
         user = Session.current_user
         if not user: return
 
         def task():
-            return self.get_service(NotificationService).get_dashboard_notifications(user.id)
+            return self.get_service(NotificationService).get_notifications_page(user.id, cursor)
         
+        self.run_async(task, callback, key=("notifications", user.id, cursor))
+
+    def load_announcement(self, announcement_id, callback):
+        """Fetches one full announcement (e.g. when a notification is opened)."""
+        def task():
+            return self.get_service(AnnouncementService).get_announcement_details(announcement_id)
+
         self.run_async(task, callback)
 
     def mark_notification_read(self, notif_id, callback=None):
@@ -112,6 +130,7 @@ class StudentController(BaseController):
         
         user = Session.current_user
         if not user: return
+        student_profile_id = Session.student_profile_id
 
         def fetch_task():
             # 1. Get Course Info
@@ -120,7 +139,7 @@ class StudentController(BaseController):
             
             # 2. Get Assignments
             assign_service = self.get_service(AssignmentService)
-            assignments = assign_service.get_student_assignments(user.id, course_id)
+            assignments = assign_service.get_student_assignments(user.id, course_id, student_profile_id)
             
             # 3. Get Announcements
             ann_service = self.get_service(AnnouncementService)
@@ -135,7 +154,7 @@ class StudentController(BaseController):
                 "announcements": announcements
             }
 
-        self.run_async(fetch_task, update_view_callback)
+        self.run_async(fetch_task, update_view_callback, key=("classroom", user.id, course_id))
 
     # --- ASSIGNMENT DETAILS & SUBMISSION ---
     def open_assignment_details(self, assignment_id):
@@ -144,30 +163,33 @@ class StudentController(BaseController):
     def load_assignments(self, update_view_callback):
         user = Session.current_user
         if not user: return
+        student_profile_id = Session.student_profile_id
         
         def task():
             service = self.get_service(AssignmentService)
-            return service.get_student_assignments(user.id)
+            return service.get_student_assignments(user.id, student_profile_id=student_profile_id)
             
-        self.run_async(task, update_view_callback)
+        self.run_async(task, update_view_callback, key=("student_assignments", user.id))
         
     def load_assignment_details(self, assignment_id, callback):
         user = Session.current_user
         if not user: return
+        student_profile_id = Session.student_profile_id
         
         def task():
             service = self.get_service(AssignmentService)
-            return service.get_assignment_detail_for_student(user.id, assignment_id)
+            return service.get_assignment_detail_for_student(user.id, assignment_id, student_profile_id)
             
         self.run_async(task, callback)
     
     def submit_assignment(self, assignment_id, content, callback):
         user = Session.current_user
         if not user: return
+        student_profile_id = Session.student_profile_id
         
         def task():
             service = self.get_service(AssignmentService)
-            return service.submit_assignment(user.id, assignment_id, content)
+            return service.submit_assignment(user.id, assignment_id, content, student_profile_id)
             
         self.run_async(task, callback)
     
@@ -181,13 +203,14 @@ class StudentController(BaseController):
     def load_grades(self, update_view_callback):
         user = Session.current_user
         if not user: return
+        student_profile_id = Session.student_profile_id
         
         def task():
             service = self.get_service(StudentService)
             # Ensure this method exists in your StudentService
-            return service.get_grades(user.id) 
+            return service.get_grades(user.id, student_profile_id)
             
-        self.run_async(task, update_view_callback)
+        self.run_async(task, update_view_callback, key=("grades", user.id))
 
     def navigate_to_notifications(self):
         self.navigate("student_notifications")
@@ -196,44 +219,59 @@ class StudentController(BaseController):
         self.navigate("student_catalog")
     
     # --- CATALOG & ENROLLMENT ---
-    def load_catalog_data(self, update_view_callback, query=None):
+    def load_catalog_data(self, update_view_callback, query=None, cursor=None):
+        """
+        Loads one catalog Page of CatalogCard (see CourseService.get_catalog_page).
+        Pass the previous page's 'next_cursor' as 'cursor' to load the next one.
+        """
         user = Session.current_user
         if not user: return
 
         def task():
             course_service = self.get_service(CourseService)
-            if query:
-                courses = course_service.search_courses_with_details(query)
-            else:
-                courses = course_service.get_all_courses_with_details()
-            
-            student_service = self.get_service(StudentService)
-            my_courses = student_service.get_my_courses(user.id)
-            enrolled_ids = [mc['id'] for mc in my_courses] if my_courses else []
-            
-            return {
-                "courses": courses,
-                "enrolled_ids": enrolled_ids
-            }
+            return course_service.get_catalog_page(user.id, query, cursor)
 
-        self.run_async(task, update_view_callback)
+        self.run_async(task, update_view_callback, key=("catalog", user.id, query, cursor))
     
     def enroll_course(self, course_id, callback):
         user = Session.current_user
         if not user: return
+        student_profile_id = Session.student_profile_id
 
         def task():
-            service = self.get_service(StudentService)
-            return service.enroll_course(user.id, course_id)
+            try:
+                # Goes through the shared queue so registration rushes are written in batches
+                return self.get_service(EnrollmentQueue).enroll(
+                    user.id, course_id, student_profile_id=student_profile_id)
+            finally:
+                self.invalidate_loads(*ENROLLMENT_LOADS)
 
         self.run_async(task, callback)
     
+    def join_waitlist(self, course_id, callback):
+        """callback(place) with the student's place in line (1 = next)."""
+        user = Session.current_user
+        if not user: return
+        student_profile_id = Session.student_profile_id
+
+        def task():
+            try:
+                return self.get_service(StudentService).join_waitlist(user.id, course_id, student_profile_id)
+            finally:
+                self.invalidate_loads(*ENROLLMENT_LOADS)
+
+        self.run_async(task, callback)
+
     def drop_course(self, course_id, callback):
         user = Session.current_user
         if not user: return
+        student_profile_id = Session.student_profile_id
 
         def task():
-            service = self.get_service(StudentService)
-            return service.drop_course(user.id, course_id)
+            try:
+                service = self.get_service(StudentService)
+                return service.drop_course(user.id, course_id, student_profile_id)
+            finally:
+                self.invalidate_loads(*ENROLLMENT_LOADS)
 
         self.run_async(task, callback)
\ No newline at end of file
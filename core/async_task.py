@@ -1,28 +1,14 @@
 # core/async_task.py
-import threading
-import tkinter as tk
+from core.task_executor import get_executor, INTERACTIVE
 
 class AsyncTask:
     """
-    Runs a heavy function in a separate thread.
+    Runs a heavy function on the shared worker pool (see core/task_executor.py).
     When finished, updates the UI on the main thread.
     """
-    def __init__(self, target_func, callback_func, error_callback=None):
+    def __init__(self, target_func, callback_func, error_callback=None, priority=INTERACTIVE, token=None, key=None):
         self.target = target_func
         self.callback = callback_func
         self.error_callback = error_callback
-        
-        self.thread = threading.Thread(target=self._run, daemon=True) 
-        self.thread.start()
 
-    def _run(self):
-        try:
-            result = self.target()
-            # Schedule the callback on the main UI thread
-            # We assume the root window is accessible or passed via closure
-            self.callback(result)
-        except Exception as e:
-            if self.error_callback:
-                self.error_callback(e)
-            else:
-                print(f"Async Error: {e}")
\ No newline at end of file
+        self.future = get_executor().submit(target_func, callback_func, error_callback, priority, token, key)
@@ -2,23 +2,39 @@
 from tkinter import messagebox
 from core.service_locator import ServiceLocator
 from core.async_task import AsyncTask
+from core.task_executor import INTERACTIVE, get_executor
 
 class BaseController:
     def __init__(self, router):
         self.router = router
+        # Set by the owning BaseView; cancelled when that view is destroyed
+        self.cancel_token = None
 
     def get_service(self, service_class):
         """Helper to get a service from the locator."""
         return ServiceLocator.get(service_class)
 
-    def run_async(self, task_func, success_callback):
+    def run_async(self, task_func, success_callback, priority=INTERACTIVE, key=None):
         """
-        Runs 'task_func' in background. 
+        Runs 'task_func' on the shared worker pool.
         Calls 'success_callback(result)' on UI thread when done.
+        Use priority=BACKGROUND for work the user is not waiting on.
+        Once the owning view is destroyed, queued work is dropped and results are discarded.
+
+        'key' (e.g. ("notifications", user_id)) enables single-flight: while a load with
+        the same key is in flight, new calls share its result instead of querying again.
+        """
+        return AsyncTask(task_func, success_callback, self.handle_exception, priority,
+                         self.cancel_token, key).future
+
+    def invalidate_loads(self, *names):
+        """
+        Call at the end of a write task: keyed loads (see run_async) named e.g. "catalog"
+        that are still in flight started before the write, so later calls start fresh.
         """
-        # We wrap the callback to ensure it runs on the main loop if needed
-        # (Tkinter is sensitive about threads, but keeping it simple here)
-        AsyncTask(task_func, success_callback, self.handle_exception)
+        executor = get_executor()
+        for name in names:
+            executor.invalidate((name,))
 
     def navigate(self, route_name, *args, **kwargs):
         self.router.navigate(route_name, *args, **kwargs)
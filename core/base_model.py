@@ -3,7 +3,13 @@ from abc import ABC, abstractmethod
 class BaseModel(ABC):
     """
     The Abstract Parent class for ALL data models .
+
+    Models declare their private attributes in __slots__ (no per-instance
+    __dict__). Constructors run the validating setters and are used for user
+    input; from_row() trusts rows read from our own database and fills the
+    slots directly.
     """
+    __slots__ = ()
 
     @abstractmethod
     def to_dict(self):
@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from database.db_connection import get_db_connection
+from core.query_spec import QuerySpec, Page, cursor_value
 
 class BaseRepository(ABC):
     """
@@ -12,6 +13,27 @@ class BaseRepository(ABC):
         """
         return get_db_connection()
 
+    def fetch_page(self, base_sql: str, spec: QuerySpec, params=(), allowed=(), key="id", mapper=dict,
+                   nullable=()) -> Page:
+        """
+        Runs 'base_sql' (a SELECT without ORDER BY) with the spec's filters,
+        ordering and cursor applied in SQL, and returns one Page.
+        'allowed' lists the columns callers may filter/sort on; each row is
+        converted with 'mapper' (e.g. Course.from_row). 'nullable' lists the
+        allowed text columns that may be NULL (see core.query_spec).
+        """
+        sql, values, ordering = spec.build(base_sql, params, allowed, key, nullable)
+
+        with self.get_connection() as conn:
+            rows = conn.execute(sql, values).fetchall()
+
+        next_cursor = None
+        if spec.limit is not None and len(rows) > spec.limit:
+            rows = rows[:spec.limit]
+            next_cursor = tuple(cursor_value(rows[-1][field], field, nullable) for field, _ in ordering)
+
+        return Page([mapper(row) for row in rows], next_cursor)
+
     @abstractmethod
     def create(self, *args, **kwargs):
         
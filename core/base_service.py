@@ -1,8 +1,17 @@
+from core.unit_of_work import UnitOfWork
+
 class BaseService:
     """
     Abstract Base Class for Services.
     """
 
+    def unit_of_work(self) -> UnitOfWork:
+        """
+        Groups several repository calls into one atomic transaction.
+        Usage: with self.unit_of_work(): ...
+        """
+        return UnitOfWork()
+
     def check_permission(self, owner_id: int, user_id: int):
         """
         Simple logic check: Is the user acting on their own data?
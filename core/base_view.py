@@ -3,6 +3,7 @@ import tkinter as tk
 from tkinter import ttk
 from abc import ABC, abstractmethod
 
+from core.task_executor import CancellationToken
 from ui.styles import COLORS, FONTS
 
 class BaseView(tk.Frame, ABC):
@@ -17,9 +18,13 @@ class BaseView(tk.Frame, ABC):
         self.view_args = args 
 
         self.kwargs = kwargs
+
+        # Cancelled in destroy(): async loads started by this view stop calling back into it
+        self.cancel_token = CancellationToken()
         
         # Every View must have a Controller
         self.controller = self.create_controller()
+        self.controller.cancel_token = self.cancel_token
         
         # Build the visual elements
         self.setup_ui()
@@ -34,6 +39,11 @@ class BaseView(tk.Frame, ABC):
         """Where all the Buttons, Labels, and Entries are created."""
         pass
 
+    def destroy(self):
+        """Cancels this view's pending async work before the widgets go away."""
+        self.cancel_token.cancel()
+        super().destroy()
+
     def clear_content(self):
         """Helper to wipe the frame if needed."""
         for widget in self.winfo_children():
@@ -0,0 +1,118 @@
+# core/cache.py
+"""
+Read-through caching for service reads that change rarely.
+
+Each kind of entity gets its own named region with a TTL and an LRU size
+bound. Services read through a region and the matching write methods
+invalidate it:
+
+    COURSES = ServiceCache.region("courses", ttl=300, max_size=512)
+
+    def get_course_by_id(self, course_id):
+        return COURSES.get(course_id, lambda: self.course_repo.get_by_id(course_id))
+
+    def update_course(self, course_id, data):
+        ...
+        COURSES.invalidate(course_id)
+
+Cached values are shared between callers: treat them as read-only.
+Set SMS_CACHE=0 to bypass every region (e.g. when benchmarking queries).
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+
+CACHE_ENABLED = os.environ.get("SMS_CACHE", "1") != "0"
+
+
+class CacheRegion:
+    """A TTL + LRU bounded key/value store with hit/miss statistics."""
+
+    def __init__(self, name: str, ttl: float = 60.0, max_size: int = 256):
+        self.name = name
+        self.ttl = ttl
+        self.max_size = max_size
+
+        self._entries = OrderedDict()   # key -> (expires_at, value), oldest first
+        self._generation = 0            # Bumped by every invalidation
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def get(self, key, loader):
+        """
+        Returns the cached value for 'key', or calls 'loader()' and caches its result.
+        None results and loader exceptions are not cached.
+        """
+        if not CACHE_ENABLED:
+            return loader()
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats["hits"] += 1
+                    return entry[1]
+                del self._entries[key]
+                self._stats["expirations"] += 1
+            self._stats["misses"] += 1
+            generation = self._generation
+
+        value = loader()
+        if value is None:
+            return value
+
+        with self._lock:
+            # Skip the store if a write invalidated the region while we were loading:
+            # the value we hold may predate that write.
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, value)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+                    self._stats["evictions"] += 1
+        return value
+
+    def invalidate(self, key=None):
+        """Drops one key, or the whole region when 'key' is None."""
+        with self._lock:
+            self._generation += 1
+            self._stats["invalidations"] += 1
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> dict:
+        with self._lock:
+            stats = dict(self._stats, size=len(self._entries), max_size=self.max_size, ttl=self.ttl)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 3) if lookups else 0.0
+        return stats
+
+
+class ServiceCache:
+    """Registry of all cache regions (one per entity kind)."""
+    _regions = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def region(cls, name: str, ttl: float = 60.0, max_size: int = 256) -> CacheRegion:
+        """Returns the region called 'name', creating it on first use."""
+        with cls._lock:
+            if name not in cls._regions:
+                cls._regions[name] = CacheRegion(name, ttl, max_size)
+            return cls._regions[name]
+
+    @classmethod
+    def stats(cls) -> dict:
+        """{region_name: {hits, misses, hit_rate, size, ...}} for sizing the regions."""
+        return {name: region.stats() for name, region in cls._regions.items()}
+
+    @classmethod
+    def clear(cls):
+        """Empties every region (e.g. on logout or after a bulk import)."""
+        for region in cls._regions.values():
+            region.invalidate()
@@ -0,0 +1,206 @@
+# core/query_recorder.py
+"""
+SQL instrumentation for repositories and services.
+
+Every connection handed out by get_db_connection() reports its statements to
+the listeners in database/db_connection.py. QueryRecorder is such a listener:
+it keeps the statement, parameters, duration and the service (or repository)
+method that triggered it.
+
+Usage:
+    with QueryRecorder() as rec:
+        service.get_student_grades(user_id)
+    print(rec.report())
+
+    with assert_max_queries(3):
+        service.get_dashboard_overview(user_id)
+
+    @assert_max_queries(1)
+    def test_catalog(): ...
+
+Run main.py with SMS_QUERY_PROFILE=1 to record the whole app run and print a summary
+(slowest callers and N+1 patterns) on exit.
+"""
+import atexit
+import functools
+import re
+import sys
+import threading
+from collections import Counter, namedtuple
+
+from database import db_connection
+
+QueryRecord = namedtuple("QueryRecord", ["sql", "parameters", "duration", "caller", "thread"])
+
+# Packages whose frames identify "who issued this query", most specific first
+CALLER_PACKAGES = ("services.", "controllers.", "repositories.")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """
+    Reduces a statement to its shape, so the same query with different
+    values (or a different number of IN (...) placeholders) compares equal.
+    """
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _NUMBER_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER_LIST.sub("(?)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def find_caller(skip: int = 2) -> str:
+    """
+    Walks up the stack and returns 'Class.method' of the first frame that
+    lives in a service, controller or repository module.
+    """
+    frame = sys._getframe(skip)
+    fallback = None
+
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        for rank, package in enumerate(CALLER_PACKAGES):
+            if module.startswith(package):
+                owner = frame.f_locals.get("self")
+                name = frame.f_code.co_name
+                label = f"{type(owner).__name__}.{name}" if owner is not None else f"{module}.{name}"
+                if rank == 0:
+                    return label
+                if fallback is None:
+                    fallback = label
+                break
+        frame = frame.f_back
+
+    return fallback or "<unknown>"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """Raised by assert_max_queries when an operation issues too many statements."""
+
+
+class QueryRecorder:
+    """
+    Records every SQL statement issued while active.
+
+    By default only statements from the thread that started the recorder are
+    kept, so background tasks do not leak into an assertion. Pass
+    all_threads=True to record the whole application.
+    """
+
+    def __init__(self, all_threads: bool = False):
+        self.all_threads = all_threads
+        self.queries = []
+        self._thread_id = None
+        self._lock = threading.Lock()
+
+    # --- Listener Protocol ---
+    def __call__(self, sql, parameters, duration):
+        thread = threading.get_ident()
+        if not self.all_threads and thread != self._thread_id:
+            return
+        record = QueryRecord(sql, parameters, duration, find_caller(), thread)
+        with self._lock:
+            self.queries.append(record)
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        db_connection.add_statement_listener(self)
+        return self
+
+    def stop(self):
+        db_connection.remove_statement_listener(self)
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+        return False
+
+    # --- Analysis ---
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    @property
+    def total_time(self) -> float:
+        return sum(q.duration for q in self.queries)
+
+    def by_caller(self) -> dict:
+        """Returns {caller: (query_count, total_seconds)}, busiest first."""
+        stats = {}
+        for q in self.queries:
+            count, seconds = stats.get(q.caller, (0, 0.0))
+            stats[q.caller] = (count + 1, seconds + q.duration)
+        return dict(sorted(stats.items(), key=lambda item: item[1][0], reverse=True))
+
+    def find_n_plus_one(self, threshold: int = 3) -> list:
+        """
+        Detects the N+1 pattern: the same statement shape issued repeatedly
+        by one caller. Returns [(caller, normalized_sql, count)], worst first.
+        """
+        shapes = Counter((q.caller, normalize_sql(q.sql)) for q in self.queries)
+        return [
+            (caller, sql, count)
+            for (caller, sql), count in shapes.most_common()
+            if count >= threshold
+        ]
+
+    def report(self, n_plus_one_threshold: int = 3) -> str:
+        lines = [f"{self.count} queries in {self.total_time * 1000:.2f} ms"]
+        for caller, (count, seconds) in self.by_caller().items():
+            lines.append(f"  {count:>6}  {seconds * 1000:>9.2f} ms  {caller}")
+
+        repeated = self.find_n_plus_one(n_plus_one_threshold)
+        if repeated:
+            lines.append("Possible N+1 queries:")
+            for caller, sql, count in repeated:
+                lines.append(f"  {count:>6}x  {caller}: {sql[:120]}")
+        return "\n".join(lines)
+
+
+class assert_max_queries:
+    """
+    Fails (QueryBudgetExceeded) if the wrapped block or function issues more
+    than 'limit' SQL statements. Works as a context manager or a decorator.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.recorder = None
+
+    def __enter__(self):
+        self.recorder = QueryRecorder().start()
+        return self.recorder
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.recorder.stop()
+        if exc_type is None and self.recorder.count > self.limit:
+            raise QueryBudgetExceeded(
+                f"Expected at most {self.limit} queries, got {self.recorder.count}.\n"
+                f"{self.recorder.report()}"
+            )
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with assert_max_queries(self.limit):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+# --- App-Wide Profiling ---
+_profiler = None
+
+
+def enable_profiling():
+    """Records every query of the running app and prints a summary at exit."""
+    global _profiler
+    if _profiler is None:
+        _profiler = QueryRecorder(all_threads=True).start()
+        atexit.register(lambda: print(f"\n[Query Profile]\n{_profiler.report()}"))
+    return _profiler
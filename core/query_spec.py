@@ -0,0 +1,180 @@
+# core/query_spec.py
+"""
+Query specifications: filters, ordering and keyset pagination pushed into SQL.
+
+A repository describes WHAT to select (a base SELECT without ORDER BY), the
+caller describes WHICH rows with a QuerySpec, and BaseRepository.fetch_page
+combines the two into one statement:
+
+    spec = QuerySpec(limit=25).where("instructor_id", None, "IS NULL").order("code")
+    page = course_repo.find_page(spec)
+    ...
+    next_page = course_repo.find_page(spec.after(page.next_cursor))
+
+Field names refer to the column names of the base SELECT and are checked
+against the repository's whitelist, so they are safe to put in SQL.
+
+A row-value comparison never matches NULL, so a cursor would silently skip
+rows whose sort column is NULL. Repositories list such (text) columns as
+'nullable': they are sorted, and compared against the cursor, as
+COALESCE(column, '').
+"""
+
+OPERATORS = ("=", "!=", "<", "<=", ">", ">=", "LIKE", "IN", "IS NULL", "IS NOT NULL")
+
+
+class QuerySpec:
+    """Filters + ordering + cursor for one page. Builder methods return a new spec."""
+
+    def __init__(self, filters=None, ordering=None, cursor=None, limit: int = 50, searches=None):
+        if limit is not None and limit <= 0:
+            raise ValueError("Page limit must be a positive number.")
+
+        self.filters = list(filters or [])      # [(field, op, value)]
+        self.searches = list(searches or [])    # [((field, ...), text)] -> OR'ed LIKE
+        self.ordering = list(ordering or [])    # [(field, descending)]
+        self.cursor = cursor
+        self.limit = limit
+
+    def _copy(self, **changes):
+        values = dict(filters=self.filters, ordering=self.ordering, cursor=self.cursor,
+                      limit=self.limit, searches=self.searches)
+        values.update(changes)
+        return QuerySpec(**values)
+
+    def where(self, field: str, value=None, op: str = "="):
+        op = op.upper()
+        if op not in OPERATORS:
+            raise ValueError(f"Unsupported operator '{op}'. Must be one of: {OPERATORS}")
+        return self._copy(filters=self.filters + [(field, op, value)])
+
+    def search(self, fields, text: str):
+        """Case-insensitive substring match on ANY of the given fields."""
+        if not text:
+            return self
+        return self._copy(searches=self.searches + [(tuple(fields), text)])
+
+    def order(self, field: str, descending: bool = False):
+        return self._copy(ordering=self.ordering + [(field, descending)])
+
+    def after(self, cursor):
+        """The spec for the page that follows 'cursor' (a Page.next_cursor)."""
+        return self._copy(cursor=tuple(cursor) if cursor is not None else None)
+
+    def fields(self):
+        return ([f for f, _, _ in self.filters] + [f for f, _ in self.ordering]
+                + [f for fields, _ in self.searches for f in fields])
+
+    # ---------------------------------------------------------
+    # SQL Generation
+    # ---------------------------------------------------------
+    def build(self, base_sql: str, base_params=(), allowed=(), key: str = "id", nullable=()):
+        """
+        Wraps 'base_sql' and returns (sql, params, ordering) for one page.
+        'key' is a unique column appended to the ordering so the cursor is unambiguous.
+        'nullable' lists text columns that may be NULL; they sort as ''.
+        """
+        for field in self.fields() + [key]:
+            if field not in allowed:
+                raise ValueError(f"Cannot filter or sort on '{field}'.")
+
+        ordering = list(self.ordering)
+        if key not in [f for f, _ in ordering]:
+            # Tie-breaker follows the last sort direction so one index can serve both
+            ordering.append((key, ordering[-1][1] if ordering else False))
+
+        clauses, params = [], list(base_params)
+
+        for field, op, value in self.filters:
+            if op in ("IS NULL", "IS NOT NULL"):
+                clauses.append(f"{field} {op}")
+            elif op == "IN":
+                values = list(value)
+                if not values:
+                    clauses.append("0")
+                    continue
+                clauses.append(f"{field} IN ({', '.join('?' * len(values))})")
+                params.extend(values)
+            else:
+                clauses.append(f"{field} {op} ?")
+                params.append(value)
+
+        for fields, text in self.searches:
+            clauses.append("(" + " OR ".join(f"{f} LIKE ?" for f in fields) + ")")
+            params.extend([f"%{text}%"] * len(fields))
+
+        if self.cursor is not None:
+            clause, values = self._keyset_clause(ordering, self.cursor, nullable)
+            clauses.append(clause)
+            params.extend(values)
+
+        sql = f"SELECT * FROM ({base_sql}) AS page"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY " + ", ".join(
+            f"{sort_expr(f, nullable)} {'DESC' if desc else 'ASC'}" for f, desc in ordering)
+
+        if self.limit is not None:
+            # One extra row tells us whether another page exists
+            sql += " LIMIT ?"
+            params.append(self.limit + 1)
+
+        return sql, params, ordering
+
+    @staticmethod
+    def _keyset_clause(ordering, cursor, nullable=()):
+        """'Rows after the cursor' for the given ordering."""
+        if len(cursor) != len(ordering):
+            raise ValueError("Cursor does not match the page ordering.")
+
+        ordering = [(sort_expr(f, nullable), desc) for f, desc in ordering]
+
+        directions = {desc for _, desc in ordering}
+        if len(directions) == 1:
+            # Uniform direction: one row-value comparison the planner can seek on
+            op = "<" if directions.pop() else ">"
+            fields = ", ".join(f for f, _ in ordering)
+            marks = ", ".join("?" * len(ordering))
+            return f"({fields}) {op} ({marks})", list(cursor)
+
+        # Mixed directions: (a > ?) OR (a = ? AND b < ?) OR ...
+        parts, values = [], []
+        for i, (field, desc) in enumerate(ordering):
+            equal = [f"{f} = ?" for f, _ in ordering[:i]]
+            parts.append("(" + " AND ".join(equal + [f"{field} {'<' if desc else '>'} ?"]) + ")")
+            values.extend(cursor[:i + 1])
+        return "(" + " OR ".join(parts) + ")", values
+
+
+def sort_expr(field: str, nullable=()) -> str:
+    """The SQL a page is sorted on for 'field': NULL-safe for nullable columns."""
+    return f"COALESCE({field}, '')" if field in nullable else field
+
+
+def cursor_value(value, field: str, nullable=()):
+    """A row's sort value as stored in a cursor, matching sort_expr."""
+    return "" if value is None and field in nullable else value
+
+
+class Page:
+    """One page of results. Iterates like a list; pass next_cursor back to get more."""
+
+    def __init__(self, items: list, next_cursor=None):
+        self.items = items
+        self.next_cursor = next_cursor
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    def __bool__(self):
+        return bool(self.items)
@@ -7,10 +7,17 @@ class Session:
     current_user = None
     current_course_id = None
 
+    # Profile ids of the active user, resolved once at login (None if not that role)
+    student_profile_id = None
+    instructor_profile_id = None
+
     @classmethod
     def login(cls, user):
         """Sets the current user after successful auth."""
         cls.current_user = user
+        # AuthService.login returns the role model, which already carries its profile id
+        cls.student_profile_id = getattr(user, "student_profile_id", None)
+        cls.instructor_profile_id = getattr(user, "instructor_profile_id", None)
         print(f"[Session] User logged in: {user.username} ({user.role})")
 
     @classmethod
@@ -18,7 +25,25 @@ class Session:
         """Clears the session."""
         print(f"[Session] User logged out: {cls.current_user.username if cls.current_user else 'None'}")
         cls.current_user = None
+        cls.student_profile_id = None
+        cls.instructor_profile_id = None
 
     @classmethod
     def is_logged_in(cls) -> bool:
-        return cls.current_user is not None
\ No newline at end of file
+        return cls.current_user is not None
+
+    @classmethod
+    def student_id_for(cls, user_id: int):
+        """The cached student profile id if 'user_id' is the logged-in user, else None."""
+        user = cls.current_user
+        if user is not None and user.id == user_id:
+            return cls.student_profile_id
+        return None
+
+    @classmethod
+    def instructor_id_for(cls, user_id: int):
+        """The cached instructor profile id if 'user_id' is the logged-in user, else None."""
+        user = cls.current_user
+        if user is not None and user.id == user_id:
+            return cls.instructor_profile_id
+        return None
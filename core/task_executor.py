@@ -0,0 +1,333 @@
+# core/task_executor.py
+"""
+Bounded background worker pool for the UI.
+
+- A fixed number of worker threads run submitted functions; extra work waits
+  in a priority queue instead of spawning more threads.
+- INTERACTIVE work (what the user is looking at) always runs before
+  BACKGROUND work (refreshes, cleanups) that was queued earlier.
+- Results are handed back through a completion queue that the Tk main loop
+  drains with root.after(), so callbacks always run on the UI thread.
+  Before attach(root) is called (scripts, benchmarks) callbacks run directly
+  on the worker thread.
+- A CancellationToken ties work to the lifetime of its requester (a view):
+  once cancelled, queued work is dropped and finished results are discarded.
+- Single-flight: work submitted with a 'key' that is already queued or
+  running joins the existing task instead of running again; every
+  requester receives the one result. Writes call invalidate() so that
+  requests made after them never join a load that started before.
+
+Usage:
+    executor = get_executor()
+    executor.submit(load_rows, on_rows, on_error, priority=BACKGROUND, token=view.cancel_token)
+"""
+import itertools
+import queue
+import threading
+import time
+from collections import deque
+
+from core.service_locator import ServiceLocator
+from database.db_connection import release_thread_connection
+
+INTERACTIVE = 0
+BACKGROUND = 1
+
+DEFAULT_WORKERS = 4       # Stays below the DB pool size so workers never wait for a connection
+POLL_INTERVAL_MS = 15     # How often the Tk loop drains finished tasks
+
+_STOP = 99                # Queue priority of the shutdown sentinel (after all real work)
+
+
+class TaskCancelled(Exception):
+    """Raised by TaskFuture.wait() when the task was dropped before it ran."""
+
+
+class CancellationToken:
+    """
+    Marks work as no longer wanted (e.g. its view was destroyed).
+    Long-running task functions may also poll 'token.cancelled' and stop early.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+class TaskFuture:
+    """The pending result of one submitted function."""
+
+    def __init__(self, func, priority: int, key=None):
+        self.func = func
+        self.priority = priority
+        self.key = key
+        self.submitted_at = time.perf_counter()
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self._done = threading.Event()
+        self._subscribers = []      # [(callback, error_callback, token)]
+        self._lock = threading.Lock()
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None):
+        """Blocks until finished; returns the result or raises the task's error."""
+        if not self._done.wait(timeout):
+            raise TimeoutError("Task did not finish in time.")
+        if self.cancelled:
+            raise TaskCancelled("Task was cancelled before it ran.")
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def _cancel_if_abandoned(self) -> bool:
+        """Marks the task cancelled when every subscriber has cancelled. Returns True if so."""
+        with self._lock:
+            abandoned = bool(self._subscribers) and all(
+                token is not None and token.cancelled for _, _, token in self._subscribers
+            )
+            if abandoned:
+                self.cancelled = True
+                self._subscribers = []
+                self._done.set()
+            return abandoned
+
+
+class TaskExecutor:
+    """Fixed-size thread pool with priorities and main-thread result delivery."""
+
+    def __init__(self, max_workers: int = DEFAULT_WORKERS, poll_interval_ms: int = POLL_INTERVAL_MS):
+        self.max_workers = max_workers
+        self.poll_interval_ms = poll_interval_ms
+
+        self._queue = queue.PriorityQueue()
+        self._completions = queue.SimpleQueue()
+        self._sequence = itertools.count()      # FIFO order within one priority
+        self._workers = []
+        self._root = None
+        self._lock = threading.Lock()
+
+        # --- Metrics ---
+        self._running = 0
+        self._counts = {"submitted": 0, "completed": 0, "failed": 0,
+                        "dropped": 0, "discarded": 0, "coalesced": 0}
+        self._inflight = {}                     # key -> TaskFuture still queued or running
+        self._max_queue_depth = 0
+        self._wait_times = deque(maxlen=500)    # Seconds between submit and start
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    def attach(self, root):
+        """Starts delivering results on the Tk main loop of 'root'."""
+        self._root = root
+        root.after(self.poll_interval_ms, self._drain)
+
+    def shutdown(self, wait: bool = False):
+        """Stops the workers after the work already queued. Results are no longer delivered."""
+        self._root = None
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for _ in workers:
+            self._queue.put((_STOP, next(self._sequence), None))
+        if wait:
+            for worker in workers:
+                worker.join()
+
+    def _ensure_workers(self):
+        with self._lock:
+            while len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._work, daemon=True,
+                                          name=f"TaskWorker-{len(self._workers) + 1}")
+                self._workers.append(worker)
+                worker.start()
+
+    # ---------------------------------------------------------
+    # Submitting
+    # ---------------------------------------------------------
+    def submit(self, func, callback=None, error_callback=None, priority: int = INTERACTIVE,
+               token: CancellationToken = None, key=None) -> TaskFuture:
+        """
+        Queues 'func()' to run on a worker thread.
+        'callback(result)' or 'error_callback(exception)' is called when it finishes,
+        unless 'token' has been cancelled by then.
+
+        If 'key' is given and a task with the same key is still queued or running,
+        no new work is queued: the callbacks are attached to that task instead.
+        Only use keys for reads whose result is the same for every requester.
+        """
+        if key is not None:
+            with self._lock:
+                existing = self._inflight.get(key)
+            if existing is not None and self._join(existing, callback, error_callback, token):
+                with self._lock:
+                    self._counts["coalesced"] += 1
+                return existing
+
+        future = TaskFuture(func, priority, key)
+        future._subscribers.append((callback, error_callback, token))
+        self._ensure_workers()
+
+        with self._lock:
+            self._counts["submitted"] += 1
+            if key is not None:
+                self._inflight[key] = future
+        self._queue.put((priority, next(self._sequence), future))
+        self._max_queue_depth = max(self._max_queue_depth, self._queue.qsize())
+        return future
+
+    @staticmethod
+    def _join(future: TaskFuture, callback, error_callback, token) -> bool:
+        """Adds a subscriber to an unfinished task. False if it finished in the meantime."""
+        with future._lock:
+            if future.done():
+                return False
+            future._subscribers.append((callback, error_callback, token))
+            return True
+
+    def _forget(self, future: TaskFuture):
+        """Stops new requests from joining 'future' (it is about to finish)."""
+        if future.key is None:
+            return
+        with self._lock:
+            if self._inflight.get(future.key) is future:
+                del self._inflight[future.key]
+
+    def invalidate(self, prefix: tuple):
+        """
+        Stops new requests from joining in-flight work whose key starts with 'prefix'.
+        Call it once a write has made those loads stale: the running work still reaches
+        whoever already asked for it, the next request starts a fresh load.
+        """
+        size = len(prefix)
+        with self._lock:
+            for key in [k for k in self._inflight if isinstance(k, tuple) and k[:size] == prefix]:
+                del self._inflight[key]
+
+    # ---------------------------------------------------------
+    # Worker Side
+    # ---------------------------------------------------------
+    def _work(self):
+        try:
+            while True:
+                _, _, future = self._queue.get()
+                if future is None:
+                    return
+                self._run(future)
+        finally:
+            # This worker is exiting: hand its DB connection back to the pool
+            release_thread_connection()
+
+    def _run(self, future: TaskFuture):
+        if future._cancel_if_abandoned():
+            # Every requesting view is gone: skip the work entirely
+            self._forget(future)
+            with self._lock:
+                self._counts["dropped"] += 1
+            return
+
+        self._wait_times.append(time.perf_counter() - future.submitted_at)
+        with self._lock:
+            self._running += 1
+
+        try:
+            future.result = future.func()
+        except Exception as e:
+            future.error = e
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._counts["failed" if future.error is not None else "completed"] += 1
+
+        # Late requests for the same key now start a fresh load with fresh data
+        self._forget(future)
+        with future._lock:
+            future._done.set()
+            subscribers, future._subscribers = future._subscribers, []
+        for callback, error_callback, token in subscribers:
+            self._deliver(future, callback, error_callback, token)
+
+    def _deliver(self, future, callback, error_callback, token):
+        if self._root is None:
+            self._invoke(future, callback, error_callback, token)
+        else:
+            self._completions.put((future, callback, error_callback, token))
+
+    def _invoke(self, future, callback, error_callback, token):
+        # Checked on the delivering thread, right before touching any widget
+        if future.cancelled or (token is not None and token.cancelled):
+            with self._lock:
+                self._counts["discarded"] += 1
+            return
+
+        try:
+            if future.error is None:
+                if callback:
+                    callback(future.result)
+                return
+            error = future.error
+        except Exception as e:
+            # A failing callback is reported like a failing task
+            error = e
+
+        if error_callback:
+            error_callback(error)
+        else:
+            print(f"Async Error: {error}")
+
+    # ---------------------------------------------------------
+    # Main-Thread Side
+    # ---------------------------------------------------------
+    def _drain(self):
+        """Runs every finished task's callback, then re-arms itself on the Tk loop."""
+        root = self._root
+        if root is None:
+            return
+
+        while True:
+            try:
+                item = self._completions.get_nowait()
+            except queue.Empty:
+                break
+            self._invoke(*item)
+
+        try:
+            root.after(self.poll_interval_ms, self._drain)
+        except Exception:
+            # The window is gone (app shutting down)
+            self._root = None
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def metrics(self) -> dict:
+        waits = sorted(self._wait_times)
+        with self._lock:
+            counts = dict(self._counts)
+            running = self._running
+        return {
+            "workers": len(self._workers),
+            "running": running,
+            "queue_depth": self._queue.qsize(),
+            "max_queue_depth": self._max_queue_depth,
+            "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 2) if waits else 0.0,
+            "max_wait_ms": round(waits[-1] * 1000, 2) if waits else 0.0,
+            **counts,
+        }
+
+
+def get_executor() -> TaskExecutor:
+    """The app-wide executor (registered in main.py); created on first use elsewhere."""
+    executor = ServiceLocator.get(TaskExecutor)
+    if executor is None:
+        executor = TaskExecutor()
+        ServiceLocator.register(TaskExecutor, executor)
+    return executor
@@ -0,0 +1,36 @@
+# core/unit_of_work.py
+from database.db_connection import get_db_connection
+
+class UnitOfWork:
+    """
+    Runs several repository calls as ONE transaction on ONE connection.
+
+    Every repository used inside the block (on the same thread) receives the
+    same connection from get_db_connection(), and nothing is committed until
+    the block exits. An exception rolls back everything done inside it.
+
+    Usage:
+        with UnitOfWork():
+            self.submission_repo.create(sub)
+            self.notification_repo.create(notification)
+    """
+
+    def __init__(self, immediate: bool = True):
+        # IMMEDIATE takes the write lock up front, so a read-then-write flow
+        # cannot fail half-way with 'database is locked' when it starts writing.
+        self.immediate = immediate
+        self.conn = None
+        self._context = None
+
+    def __enter__(self):
+        self._context = get_db_connection()
+        self.conn = self._context.__enter__()
+
+        if self.immediate and not self.conn.in_transaction:
+            self.conn.execute("BEGIN IMMEDIATE")
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        context, self._context = self._context, None
+        self.conn = None
+        return context.__exit__(exc_type, exc_value, traceback)
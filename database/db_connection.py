@@ -1,34 +1,395 @@
+import atexit
 import sqlite3
 import os
+import threading
+import time
 from contextlib import contextmanager
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-DB_PATH = os.path.join(BASE_DIR, '..', 'student_management.db')
+DB_PATH = os.environ.get("SMS_DB_PATH") or os.path.join(BASE_DIR, '..', 'student_management.db')
+
+# --- Connection Pool Settings ---
+# SMS_DB_POOL=0 falls back to one short-lived connection per call (the old behaviour).
+POOL_ENABLED = os.environ.get("SMS_DB_POOL", "1") != "0"
+POOL_SIZE = int(os.environ.get("SMS_DB_POOL_SIZE", "8"))
+POOL_TIMEOUT = 10.0            # Seconds a thread waits for a free slot before failing
+HEALTH_CHECK_INTERVAL = 30.0   # Idle seconds after which a connection is pinged before reuse
+
+# --- Performance Profiles ---
+# Named PRAGMA sets applied to every connection at connect time.
+# Select one with SMS_DB_PROFILE=<name> or configure_pool(profile=<name>).
+PERFORMANCE_PROFILES = {
+    # WAL lets readers keep working while a writer commits; NORMAL sync is crash-safe in WAL.
+    "balanced": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 268435456,     # 256 MB memory-mapped reads
+        "cache_size": -65536,       # 64 MB page cache (negative = KiB)
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,       # ms to wait on a locked database
+    },
+    # Same concurrency as 'balanced' but fsyncs on every commit.
+    "durable": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -16384,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    # The SQLite defaults the app used before profiles existed.
+    "legacy": {
+        "journal_mode": "DELETE",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -2000,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+}
+DB_PROFILE = os.environ.get("SMS_DB_PROFILE", "balanced")
+
+
+def get_profile(name=None) -> dict:
+    """Returns the PRAGMA settings of a named profile (the active one by default)."""
+    name = name or DB_PROFILE
+    if name not in PERFORMANCE_PROFILES:
+        raise ValueError(
+            f"Unknown database profile '{name}'. Must be one of: {sorted(PERFORMANCE_PROFILES)}"
+        )
+    return PERFORMANCE_PROFILES[name]
+
+
+def apply_profile(conn, name=None):
+    """Applies a performance profile's PRAGMAs to an open connection."""
+    for pragma, value in get_profile(name).items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+# --- Statement Listeners ---
+# Callbacks of the form listener(sql, parameters, duration_seconds), called after
+# every statement run through Connection.execute/executemany. Used by benchmarks
+# and profiling; when no listener is registered the overhead is one list check.
+_statement_listeners = []
+
+
+def add_statement_listener(listener):
+    _statement_listeners.append(listener)
+
+
+def remove_statement_listener(listener):
+    if listener in _statement_listeners:
+        _statement_listeners.remove(listener)
+
+
+class ObservedConnection(sqlite3.Connection):
+    """sqlite3.Connection that reports each statement to the registered listeners."""
+
+    def execute(self, sql, parameters=()):
+        if not _statement_listeners:
+            return super().execute(sql, parameters)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _notify_listeners(sql, parameters, time.perf_counter() - start)
+
+    def executemany(self, sql, seq_of_parameters):
+        if not _statement_listeners:
+            return super().executemany(sql, seq_of_parameters)
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            _notify_listeners(sql, None, time.perf_counter() - start)
+
+
+def _notify_listeners(sql, parameters, duration):
+    for listener in list(_statement_listeners):
+        listener(sql, parameters, duration)
+
+
+def open_connection(db_path=None):
+    """
+    Opens a new, fully configured SQLite connection.
+    Every connection in the app (pooled or not) is created here.
+    """
+    conn = sqlite3.connect(db_path or DB_PATH, check_same_thread=False, factory=ObservedConnection)
+    conn.execute("PRAGMA foreign_keys = ON")
+    apply_profile(conn)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def describe_profile() -> dict:
+    """
+    Reads back the settings SQLite actually applied for the active profile.
+    Used to report the configuration at startup.
+    """
+    conn = open_connection()
+    try:
+        settings = {"profile": DB_PROFILE, "database": os.path.abspath(DB_PATH)}
+        for pragma in get_profile():
+            settings[pragma] = conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+        return settings
+    finally:
+        conn.close()
+
+
+class ConnectionPool:
+    """
+    Keeps one long-lived connection per worker thread.
+
+    - A thread keeps its connection between calls, so the connect + PRAGMA setup
+      only happens once per thread instead of once per repository call.
+    - At most 'max_size' connections exist at a time. Connections owned by threads
+      that have finished are reclaimed and handed to the next thread.
+    - Connections that sat idle for a while are pinged before reuse and replaced if broken.
+    """
+
+    def __init__(self, db_path=None, max_size=POOL_SIZE, timeout=POOL_TIMEOUT,
+                 health_check_interval=HEALTH_CHECK_INTERVAL):
+        if max_size < 1:
+            raise ValueError("Pool size must be at least 1.")
+
+        self.db_path = db_path or DB_PATH
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+
+        self._cond = threading.Condition()
+        self._owners = {}   # thread -> connection currently leased to that thread
+        self._idle = []     # connections ready to be adopted by a new thread
+        self._last_used = {}
+        self._closed = False
+
+    # ---------------------------------------------------------
+    # Leasing
+    # ---------------------------------------------------------
+    def acquire(self):
+        """Returns the calling thread's connection, leasing one if needed."""
+        thread = threading.current_thread()
+
+        with self._cond:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Connection pool is closed.")
+
+            conn = self._owners.get(thread)
+            if conn is None:
+                conn = self._lease(thread)
+
+        conn = self._ensure_healthy(thread, conn)
+        self._last_used[conn] = time.monotonic()
+        return conn
+
+    def release(self):
+        """
+        Hands the calling thread's connection back to the idle list.
+        Optional: threads that exit are reclaimed automatically.
+        """
+        thread = threading.current_thread()
+        with self._cond:
+            conn = self._owners.pop(thread, None)
+            if conn is not None:
+                self._reset(conn)
+                self._idle.append(conn)
+                self._cond.notify()
+
+    def _lease(self, thread):
+        """Called with the lock held. Finds or opens a connection for 'thread'."""
+        deadline = time.monotonic() + self.timeout
+
+        while True:
+            if self._idle:
+                conn = self._idle.pop()
+                break
+
+            if len(self._owners) < self.max_size:
+                conn = open_connection(self.db_path)
+                break
+
+            # Pool is full: take back connections from threads that have finished.
+            if self._reclaim_dead_threads():
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise sqlite3.OperationalError(
+                    f"Timed out waiting for a database connection (pool size {self.max_size})."
+                )
+            self._cond.wait(min(remaining, 0.1))
+
+        self._owners[thread] = conn
+        return conn
+
+    def _reclaim_dead_threads(self) -> bool:
+        """Called with the lock held. Moves connections of dead threads to the idle list."""
+        dead = [t for t in self._owners if not t.is_alive()]
+        for t in dead:
+            conn = self._owners.pop(t)
+            self._reset(conn)
+            self._idle.append(conn)
+        return bool(dead)
+
+    # ---------------------------------------------------------
+    # Health Checks
+    # ---------------------------------------------------------
+    def _ensure_healthy(self, thread, conn):
+        last_used = self._last_used.get(conn)
+        if last_used is not None and time.monotonic() - last_used < self.health_check_interval:
+            return conn
+
+        try:
+            conn.execute("SELECT 1").fetchone()
+            return conn
+        except sqlite3.Error:
+            # Broken connection: replace it in place.
+            self._discard(conn)
+            fresh = open_connection(self.db_path)
+            with self._cond:
+                self._owners[thread] = fresh
+            return fresh
+
+    def _reset(self, conn):
+        """Makes sure a connection changing hands carries no open transaction."""
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error:
+            pass
+
+    def _discard(self, conn):
+        self._last_used.pop(conn, None)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    # ---------------------------------------------------------
+    # Shutdown
+    # ---------------------------------------------------------
+    def close(self):
+        """Closes every connection. Safe to call more than once."""
+        with self._cond:
+            self._closed = True
+            connections = list(self._owners.values()) + self._idle
+            self._owners.clear()
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for conn in connections:
+            self._reset(conn)
+            self._discard(conn)
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "in_use": len(self._owners),
+                "idle": len(self._idle),
+            }
+
+
+# ---------------------------------------------------------
+# Module-level pool (shared by every repository)
+# ---------------------------------------------------------
+_pool = None
+_pool_lock = threading.Lock()
+_scope = threading.local()   # Per-thread: connection of the outermost active block + nesting depth
+
+
+def get_pool():
+    """Returns the shared pool, creating it on first use. None when pooling is disabled."""
+    global _pool
+    if not POOL_ENABLED:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool(DB_PATH, POOL_SIZE)
+    return _pool
+
+
+def configure_pool(db_path=None, max_size=None, enabled=None, profile=None):
+    """
+    Re-points the data layer (e.g. at a benchmark database) or changes pool settings.
+    Closes the current pool; a new one is created lazily on the next call.
+    """
+    global DB_PATH, POOL_SIZE, POOL_ENABLED, DB_PROFILE
+    if profile is not None:
+        get_profile(profile)  # Validate before touching anything
+    close_pool()
+    if profile is not None:
+        DB_PROFILE = profile
+    if db_path is not None:
+        DB_PATH = db_path
+    if max_size is not None:
+        POOL_SIZE = max_size
+    if enabled is not None:
+        POOL_ENABLED = enabled
+
+
+def release_thread_connection():
+    """Returns the calling thread's pooled connection to the pool (no-op without pooling)."""
+    if _pool is not None:
+        _pool.release()
+
+
+def close_pool():
+    """Shutdown hook: closes all pooled connections."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(close_pool)
+
 
 @contextmanager
 def get_db_connection():
-    
+    """
+    Yields a connection for one block of repository work.
+    Commits on success and rolls back on error.
+
+    Blocks opened while another block is active on the same thread reuse its
+    connection, and only the outermost block commits or rolls back.
+    """
+    depth = getattr(_scope, "depth", 0)
+    outermost = depth == 0
+
     conn = None
+    pool = None
 
     try:
-        conn = sqlite3.connect(DB_PATH)
-        conn.execute("PRAGMA foreign_keys = ON")
-        conn.row_factory = sqlite3.Row
-        
+        if outermost:
+            pool = get_pool()
+            conn = pool.acquire() if pool else open_connection()
+            _scope.conn = conn
+        else:
+            conn = _scope.conn
+
+        _scope.depth = depth + 1
+
         yield conn
-        conn.commit()
-    
+        if outermost:
+            conn.commit()
+
     except sqlite3.Error as e:
-        
-        if conn:
+        if conn and outermost:
             conn.rollback()
-        print(f" Database Error: {e}") 
+        print(f" Database Error: {e}")
         raise e
 
     except Exception as e:
-        if conn:
+        if conn and outermost:
             conn.rollback()
-        raise e 
+        raise e
     finally:
-        if conn:
-            conn.close()
\ No newline at end of file
+        if conn is not None:
+            _scope.depth = depth
+        if outermost:
+            _scope.conn = None
+            if conn and pool is None:
+                conn.close()
@@ -0,0 +1,364 @@
+"""
+Synthetic Campus Generator
+==========================
+Fills a database with a realistic, reproducible campus so that benchmarks and
+profiling run against real volumes instead of a handful of hand-made rows.
+
+- Uses the normal schema (runs the migrations first).
+- Bulk inserts with executemany inside one transaction.
+- Deterministic: the same size, seed and base date always produce the same rows
+  (only the salted password hash differs between runs).
+- Every generated account can log in with DEFAULT_PASSWORD.
+
+Run from the project root:
+    python -m database.generate_campus --size small
+    python -m database.generate_campus --size large --seed 7 --db /tmp/campus.db --overwrite
+"""
+import argparse
+import itertools
+import os
+import random
+import time
+from datetime import date, timedelta
+
+from database.db_connection import open_connection
+from database.initialize_db import create_tables
+from models.assignment import Assignment
+
+DEFAULT_PASSWORD = "password123"
+
+# --- Size Presets ---
+PRESETS = {
+    "small": {
+        "students": 500,
+        "instructors": 20,
+        "courses": 40,
+        "courses_per_student": 4,
+        "assignments_per_course": 8,
+        "announcements_per_course": 3,
+        "submission_rate": 0.7,
+        "grade_rate": 0.8,
+    },
+    "medium": {
+        "students": 5_000,
+        "instructors": 120,
+        "courses": 300,
+        "courses_per_student": 5,
+        "assignments_per_course": 20,
+        "announcements_per_course": 4,
+        "submission_rate": 0.5,
+        "grade_rate": 0.8,
+    },
+    "large": {
+        "students": 50_000,
+        "instructors": 600,
+        "courses": 2_000,
+        "courses_per_student": 4,
+        "assignments_per_course": 40,
+        "announcements_per_course": 5,
+        "submission_rate": 0.2,
+        "grade_rate": 0.7,
+    },
+}
+
+FIRST_NAMES = ["Ahmed", "Mona", "Omar", "Salma", "Youssef", "Nour", "Karim", "Laila", "Hassan", "Mariam",
+               "Ali", "Farah", "Tarek", "Hana", "Mostafa", "Dina", "Khaled", "Yasmin", "Seif", "Reem"]
+LAST_NAMES = ["Hassan", "Mohamed", "Ibrahim", "Elsayed", "Mahmoud", "Abdallah", "Fathy", "Saleh",
+              "Kamal", "Nasser", "Elzwawy", "Madi", "Abouelgoud", "Elsaadi", "Younis", "Fouad"]
+MAJORS = ["Computer Science", "Mathematics", "Physics", "Electrical Engineering",
+          "Mechanical Engineering", "Business", "Biology", "Chemistry"]
+DEPARTMENTS = [("CSE", "Computer Science"), ("MAT", "Mathematics"), ("PHY", "Physics"),
+               ("ELC", "Electrical Engineering"), ("MEC", "Mechanical Engineering"),
+               ("BUS", "Business"), ("BIO", "Biology"), ("CHM", "Chemistry")]
+TOPICS = ["Introduction to", "Foundations of", "Advanced", "Applied", "Topics in", "Principles of"]
+SUBJECTS = ["Programming", "Algorithms", "Data Structures", "Databases", "Networks", "Calculus",
+            "Linear Algebra", "Statistics", "Mechanics", "Circuits", "Thermodynamics", "Marketing",
+            "Accounting", "Genetics", "Organic Chemistry", "Operating Systems", "Machine Learning"]
+SEMESTERS = ["Fall 2025", "Spring 2026"]
+ASSIGNMENT_TYPES = ["quiz", "project", "homework", "exam"]
+
+
+def _iso(day: date) -> str:
+    return day.isoformat()
+
+
+class CampusGenerator:
+    """
+    Builds every table's rows from one seeded Random instance.
+    IDs are assigned explicitly so rows can reference each other without reading back.
+    """
+
+    def __init__(self, size="small", seed=42, base_date=None, **overrides):
+        if size not in PRESETS:
+            raise ValueError(f"Unknown size '{size}'. Must be one of: {list(PRESETS)}")
+
+        self.config = dict(PRESETS[size], **overrides)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        # Deadlines are spread around this day, so "upcoming" work always exists.
+        self.base_date = base_date or date.today()
+
+        self.counts = {}
+        self._enrollments = {}    # course_id -> [student_id, ...]
+        self._assignments = {}    # course_id -> [(assignment_id, due_day, max_score), ...]
+
+    # ---------------------------------------------------------
+    # Entry Point
+    # ---------------------------------------------------------
+    def populate(self, conn):
+        cfg = self.config
+        password_hash = self._password_hash()
+
+        n_students = cfg["students"]
+        n_instructors = cfg["instructors"]
+
+        # 1. Users: instructors first (ids 1..I), then students (ids I+1..I+S)
+        self._insert(conn, "users",
+                     "INSERT INTO users (id, username, name, email, gender, password, role) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                     self._user_rows(n_instructors, n_students, password_hash))
+
+        self._insert(conn, "instructors",
+                     "INSERT INTO instructors (id, user_id, department) VALUES (?, ?, ?)",
+                     ((i, i, self.rng.choice(DEPARTMENTS)[1]) for i in range(1, n_instructors + 1)))
+
+        self._insert(conn, "students",
+                     "INSERT INTO students (id, user_id, level, birthdate, major) VALUES (?, ?, ?, ?, ?)",
+                     self._student_rows(n_instructors, n_students))
+
+        # 2. Enrollments are planned before courses so each course's capacity fits its roster
+        self._plan_enrollments()
+
+        self._insert(conn, "courses",
+                     "INSERT INTO courses (id, code, name, description, credits, semester, max_students, instructor_id) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                     self._course_rows())
+
+        self._insert(conn, "enrollments",
+                     "INSERT INTO enrollments (id, student_id, course_id, date_enrolled, status) VALUES (?, ?, ?, ?, 'enrolled')",
+                     self._enrollment_rows())
+
+        # 3. Coursework
+        self._insert(conn, "assignments",
+                     "INSERT INTO assignments (id, course_id, title, description, type, due_date, due_at, max_score) "
+                     "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                     self._assignment_rows())
+
+        grades = []
+        self._insert(conn, "submissions",
+                     "INSERT INTO submissions (id, assignment_id, student_id, content, submitted_at) VALUES (?, ?, ?, ?, ?)",
+                     self._submission_rows(grades))
+
+        self._insert(conn, "grades",
+                     "INSERT INTO grades (id, submission_id, grade_value, feedback) VALUES (?, ?, ?, ?)",
+                     grades)
+
+        # 4. Announcements, fanned out to every enrolled student
+        notifications = []
+        self._insert(conn, "announcements",
+                     "INSERT INTO announcements (id, course_id, title, message, created_at) VALUES (?, ?, ?, ?, ?)",
+                     self._announcement_rows(notifications, n_instructors))
+
+        self._insert(conn, "notifications",
+                     "INSERT INTO notifications (user_id, announcement_id, read_flag, sent_at) VALUES (?, ?, ?, ?)",
+                     notifications)
+
+        return self.counts
+
+    # ---------------------------------------------------------
+    # Row Builders
+    # ---------------------------------------------------------
+    def _password_hash(self):
+        # One hash for everyone: bcrypt is deliberately slow, 50k hashes would take minutes.
+        from core.security import hash_password
+        return hash_password(DEFAULT_PASSWORD)
+
+    def _user_rows(self, n_instructors, n_students, password_hash):
+        rng = self.rng
+        for i in range(1, n_instructors + n_students + 1):
+            is_instructor = i <= n_instructors
+            number = i if is_instructor else i - n_instructors
+            prefix = "instructor" if is_instructor else "student"
+            username = f"{prefix}{number:05d}"
+            name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            if is_instructor:
+                name = "Dr. " + name
+            yield (i, username, name, f"{username}@campus.edu", rng.choice(("male", "female")),
+                   password_hash, "instructor" if is_instructor else "student")
+
+    def _student_rows(self, n_instructors, n_students):
+        rng = self.rng
+        for sid in range(1, n_students + 1):
+            birth = date(2000, 1, 1) + timedelta(days=rng.randrange(0, 6 * 365))
+            yield (sid, n_instructors + sid, rng.randint(1, 4), _iso(birth), rng.choice(MAJORS))
+
+    def _plan_enrollments(self):
+        """Picks each student's courses with a popularity skew (gateway courses fill up first)."""
+        rng = self.rng
+        n_courses = self.config["courses"]
+        per_student = min(self.config["courses_per_student"], n_courses)
+
+        course_ids = list(range(1, n_courses + 1))
+        cum_weights = list(itertools.accumulate(1.0 / (rank ** 0.7) for rank in course_ids))
+        self._enrollments = {cid: [] for cid in course_ids}
+
+        for sid in range(1, self.config["students"] + 1):
+            chosen = set()
+            while len(chosen) < per_student:
+                chosen.update(rng.choices(course_ids, cum_weights=cum_weights, k=per_student - len(chosen)))
+            for cid in sorted(chosen):
+                self._enrollments[cid].append(sid)
+
+    def _course_rows(self):
+        rng = self.rng
+        n_instructors = self.config["instructors"]
+        for cid in range(1, self.config["courses"] + 1):
+            prefix, _dept = DEPARTMENTS[(cid - 1) % len(DEPARTMENTS)]
+            code = f"{prefix}{100 + (cid - 1) // len(DEPARTMENTS)}"
+            subject = rng.choice(SUBJECTS)
+            name = f"{rng.choice(TOPICS)} {subject}"
+            description = (f"{name} covers the core ideas of {subject.lower()} through lectures, "
+                           f"weekly labs and a final project.")
+            roster = len(self._enrollments[cid])
+            max_students = max(30, roster + rng.randint(0, 20))
+            # ~5% of courses are left for the Campus Manager to assign
+            instructor_id = None if rng.random() < 0.05 else rng.randint(1, n_instructors)
+            yield (cid, code, name, description, rng.choice((2, 3, 3, 4)),
+                   rng.choice(SEMESTERS), max_students, instructor_id)
+
+    def _enrollment_rows(self):
+        enrolled_on = _iso(self.base_date - timedelta(days=100))
+        eid = 0
+        for cid, students in self._enrollments.items():
+            for sid in students:
+                eid += 1
+                yield (eid, sid, cid, enrolled_on)
+
+    def _assignment_rows(self):
+        rng = self.rng
+        per_course = self.config["assignments_per_course"]
+        aid = 0
+        for cid in range(1, self.config["courses"] + 1):
+            course_assignments = []
+            for n in range(1, per_course + 1):
+                aid += 1
+                a_type = rng.choice(ASSIGNMENT_TYPES)
+                due_day = self.base_date + timedelta(days=rng.randint(-90, 60))
+                max_score = rng.choice((10, 20, 50, 100))
+                course_assignments.append((aid, due_day, max_score))
+                yield (aid, cid, f"{a_type.title()} {n}", f"Complete {a_type} {n}.",
+                       a_type, _iso(due_day), Assignment.due_timestamp(_iso(due_day)), max_score)
+            self._assignments[cid] = course_assignments
+
+    def _submission_rows(self, grades):
+        # Hot loop (millions of rows for 'large'): only rng.random() and precomputed strings inside.
+        random_float = self.rng.random
+        submission_rate = self.config["submission_rate"]
+        grade_rate = self.config["grade_rate"]
+        feedback_options = ("", "Good work.", "See comments.")
+        sub_id = 0
+
+        for cid, students in self._enrollments.items():
+            for aid, due_day, max_score in self._assignments.get(cid, []):
+                past_due = due_day < self.base_date
+                content = f"Submission for assignment {aid}."
+                # Students hand in up to a week early
+                submitted_options = [_iso(due_day - timedelta(days=d)) + "T12:00:00" for d in range(8)]
+
+                for sid in students:
+                    if random_float() >= submission_rate:
+                        continue
+                    sub_id += 1
+                    yield (sub_id, aid, sid, content, submitted_options[int(random_float() * 8)])
+
+                    if past_due and random_float() < grade_rate:
+                        score = round((0.4 + 0.6 * random_float()) * max_score, 1)
+                        grades.append((len(grades) + 1, sub_id, score, feedback_options[int(random_float() * 3)]))
+
+    def _announcement_rows(self, notifications, n_instructors):
+        rng = self.rng
+        per_course = self.config["announcements_per_course"]
+        ann_id = 0
+        for cid, students in self._enrollments.items():
+            for n in range(1, per_course + 1):
+                ann_id += 1
+                posted = self.base_date - timedelta(days=rng.randint(0, 60))
+                created_at = _iso(posted) + "T09:00:00"
+                yield (ann_id, cid, f"Course update #{n}", "Please check the course page for details.", created_at)
+
+                random_float = rng.random
+                notifications.extend(
+                    (n_instructors + sid, ann_id, 1 if random_float() < 0.6 else 0, created_at)
+                    for sid in students
+                )
+
+    # ---------------------------------------------------------
+    # Bulk Insert Helper
+    # ---------------------------------------------------------
+    def _insert(self, conn, table, sql, rows):
+        cursor = conn.executemany(sql, rows)
+        self.counts[table] = cursor.rowcount
+
+
+def generate_campus(db_path, size="small", seed=42, base_date=None, overwrite=False, **overrides):
+    """
+    Creates (or refuses to overwrite) a database at 'db_path' filled with a synthetic campus.
+    Returns a dict of table -> inserted row count.
+    """
+    if os.path.exists(db_path):
+        if not overwrite:
+            raise FileExistsError(f"'{db_path}' already exists. Pass overwrite=True to replace it.")
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+
+    create_tables(db_path)
+
+    generator = CampusGenerator(size, seed, base_date, **overrides)
+    conn = open_connection(db_path)
+    try:
+        # Bulk-load settings for a throwaway file: no fsync, one big transaction.
+        # Referential integrity is guaranteed by construction, so skip the per-row FK lookups.
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA foreign_keys = OFF")
+        with conn:
+            # Building indexes once after the load is much faster than updating them per row.
+            indexes = conn.execute(
+                "SELECT name, sql FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL"
+            ).fetchall()
+            for index in indexes:
+                conn.execute(f"DROP INDEX {index['name']}")
+
+            counts = generator.populate(conn)
+
+            for index in indexes:
+                conn.execute(index["sql"])
+        conn.execute("ANALYZE")
+    finally:
+        conn.close()
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic campus database.")
+    parser.add_argument("--size", choices=list(PRESETS), default="small")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--db", default=None, help="Output database file (default: campus_<size>.db).")
+    parser.add_argument("--base-date", type=date.fromisoformat, default=None,
+                        help="Day deadlines are spread around (YYYY-MM-DD). Defaults to today.")
+    parser.add_argument("--overwrite", action="store_true")
+    args = parser.parse_args()
+    if args.db is None:
+        args.db = f"campus_{args.size}.db"
+
+    start = time.perf_counter()
+    counts = generate_campus(args.db, args.size, args.seed, args.base_date, args.overwrite)
+    elapsed = time.perf_counter() - start
+
+    print(f"Generated '{args.size}' campus (seed {args.seed}) in {elapsed:.1f}s -> {args.db}")
+    for table, count in counts.items():
+        print(f"  {table:<14} {count:>10,}")
+
+
+if __name__ == "__main__":
+    main()
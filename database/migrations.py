@@ -0,0 +1,434 @@
+"""
+Versioned schema migrations.
+
+The number of the last applied migration is stored in SQLite's
+'PRAGMA user_version', so startup only has to read one integer to know
+whether anything needs to run.
+
+Rules for the team:
+- To change the schema, APPEND a new Migration with the next version number.
+- Never edit a migration that has already shipped; existing databases will not re-run it.
+- A step is either an SQL string or a function taking the connection.
+"""
+import sqlite3
+from datetime import datetime
+
+
+class Migration:
+    """One ordered schema change, applied inside a single transaction."""
+
+    def __init__(self, version: int, description: str, steps: list):
+        self.version = version
+        self.description = description
+        self.steps = steps
+
+    def apply(self, conn: sqlite3.Connection):
+        for step in self.steps:
+            if callable(step):
+                step(conn)
+            else:
+                conn.execute(step)
+
+
+# ---------------------------------------------------------
+# 1. Initial Schema (previously create_tables)
+# ---------------------------------------------------------
+INITIAL_SCHEMA = [
+    # --- TEAM MEMBER 4 (AUTH): USERS TABLE ---
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        gender TEXT,
+        password TEXT NOT NULL,
+        role TEXT NOT NULL -- "student", "instructor", "admin"
+    );
+    """,
+
+    # --- TEAM MEMBER 1: STUDENTS ---
+    """
+    CREATE TABLE IF NOT EXISTS students (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        level INTEGER,
+        birthdate TEXT,
+        major TEXT,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    );
+    """,
+
+    # --- TEAM MEMBER 2: INSTRUCTORS ---
+    """
+    CREATE TABLE IF NOT EXISTS instructors (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        department TEXT ,
+        FOREIGN KEY (user_id) REFERENCES users(id)
+    );
+    """,
+
+    # --- TEAM MEMBER 3: COURSES ---
+    """
+    CREATE TABLE IF NOT EXISTS courses (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        code TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL,
+        description TEXT,
+        credits INTEGER NOT NULL DEFAULT 3,
+        semester TEXT NOT NULL,
+        max_students INTEGER NOT NULL DEFAULT 30,
+        instructor_id INTEGER,
+        FOREIGN KEY (instructor_id) REFERENCES instructors(id)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS enrollments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        student_id INTEGER NOT NULL,
+        course_id INTEGER NOT NULL,
+        date_enrolled TEXT,
+        status TEXT NOT NULL DEFAULT 'enrolled',
+        FOREIGN KEY (student_id) REFERENCES students(id),
+        FOREIGN KEY (course_id) REFERENCES courses(id)
+    );
+    """,
+
+    # --- TEAM MEMBER 5: ASSIGNMENTS ---
+    """
+    CREATE TABLE IF NOT EXISTS assignments (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        course_id INTEGER NOT NULL,
+        title TEXT NOT NULL,
+        description TEXT,
+        type TEXT NOT NULL, -- "quiz" or "project"
+        due_date TEXT,
+        max_score INTEGER NOT NULL DEFAULT 100,
+        FOREIGN KEY (course_id) REFERENCES courses(id)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS submissions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        assignment_id INTEGER NOT NULL,
+        student_id INTEGER NOT NULL,
+        content TEXT,
+        submitted_at TEXT,
+        FOREIGN KEY (assignment_id) REFERENCES assignments(id) ON DELETE CASCADE,
+        FOREIGN KEY (student_id) REFERENCES students(id)
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS grades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        submission_id INTEGER NOT NULL,
+        grade_value REAL NOT NULL,
+        feedback TEXT,
+        FOREIGN KEY (submission_id) REFERENCES submissions(id) ON DELETE CASCADE
+    );
+    """,
+
+    # --- TEAM MEMBER 6: ANNOUNCEMENTS ---
+    """
+    CREATE TABLE IF NOT EXISTS announcements (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        course_id INTEGER, -- NULL means global announcement
+        title TEXT NOT NULL,
+        message TEXT NOT NULL,
+        created_at TEXT,
+        FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE
+    );
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS notifications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        user_id INTEGER NOT NULL,
+        announcement_id INTEGER NOT NULL,
+        read_flag INTEGER DEFAULT 0,
+        sent_at TEXT,
+        FOREIGN KEY (user_id) REFERENCES users(id),
+        FOREIGN KEY (announcement_id) REFERENCES announcements(id) ON DELETE CASCADE
+    );
+    """,
+]
+
+# ---------------------------------------------------------
+# 2. Index Set (one per foreign key + the hot filters used by the repositories)
+# ---------------------------------------------------------
+CORE_INDEXES = [
+    # Profile resolution: user_id -> student / instructor profile
+    "CREATE INDEX IF NOT EXISTS idx_students_user ON students(user_id)",
+    "CREATE INDEX IF NOT EXISTS idx_instructors_user ON instructors(user_id)",
+
+    # Courses by instructor; partial index for the Campus Manager's unassigned list
+    "CREATE INDEX IF NOT EXISTS idx_courses_instructor ON courses(instructor_id)",
+    "CREATE INDEX IF NOT EXISTS idx_courses_unassigned ON courses(code) WHERE instructor_id IS NULL",
+
+    # Enrollments: covering indexes for "my courses" and per-course counts/fan-out
+    "CREATE INDEX IF NOT EXISTS idx_enrollments_student ON enrollments(student_id, status, course_id)",
+    "CREATE INDEX IF NOT EXISTS idx_enrollments_course_status ON enrollments(course_id, status, student_id)",
+
+    # Assignments listed per course in due-date order
+    "CREATE INDEX IF NOT EXISTS idx_assignments_course_due ON assignments(course_id, due_date)",
+
+    # Submissions: grading queue per assignment, duplicate check per student
+    "CREATE INDEX IF NOT EXISTS idx_submissions_assignment ON submissions(assignment_id, submitted_at)",
+    "CREATE INDEX IF NOT EXISTS idx_submissions_student_assignment ON submissions(student_id, assignment_id)",
+
+    "CREATE INDEX IF NOT EXISTS idx_grades_submission ON grades(submission_id)",
+    "CREATE INDEX IF NOT EXISTS idx_announcements_course ON announcements(course_id)",
+
+    # Notifications: unread badge, newest-first feed, cleanup by announcement
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_read ON notifications(user_id, read_flag)",
+    "CREATE INDEX IF NOT EXISTS idx_notifications_user_sent ON notifications(user_id, sent_at)",
+    "CREATE INDEX IF NOT EXISTS idx_notifications_announcement ON notifications(announcement_id)",
+
+    # Refresh planner statistics so the new indexes get picked up
+    "ANALYZE",
+]
+
+
+# ---------------------------------------------------------
+# 3. Full-Text Course Search
+# ---------------------------------------------------------
+COURSE_SEARCH = [
+    # External-content FTS5 index: stores only the inverted index, rows stay in 'courses'.
+    # prefix='2 3' keeps short prefix queries ("ma*", "cs1*") off the full-scan path.
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS courses_fts USING fts5(
+        code, name, description,
+        content='courses', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    );
+    """,
+    # Keep the index in sync with every write to 'courses'
+    """
+    CREATE TRIGGER IF NOT EXISTS courses_fts_insert AFTER INSERT ON courses BEGIN
+        INSERT INTO courses_fts(rowid, code, name, description)
+        VALUES (new.id, new.code, new.name, new.description);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS courses_fts_delete AFTER DELETE ON courses BEGIN
+        INSERT INTO courses_fts(courses_fts, rowid, code, name, description)
+        VALUES ('delete', old.id, old.code, old.name, old.description);
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS courses_fts_update AFTER UPDATE OF code, name, description ON courses BEGIN
+        INSERT INTO courses_fts(courses_fts, rowid, code, name, description)
+        VALUES ('delete', old.id, old.code, old.name, old.description);
+        INSERT INTO courses_fts(rowid, code, name, description)
+        VALUES (new.id, new.code, new.name, new.description);
+    END;
+    """,
+    # Index the courses that already exist
+    "INSERT INTO courses_fts(courses_fts) VALUES ('rebuild')",
+]
+
+
+def create_course_search(conn: sqlite3.Connection):
+    """
+    Creates the FTS5 course index. SQLite builds without FTS5 skip it;
+    CourseRepository then falls back to LIKE matching.
+    """
+    try:
+        conn.execute("CREATE VIRTUAL TABLE temp.fts5_probe USING fts5(x)")
+        conn.execute("DROP TABLE temp.fts5_probe")
+    except sqlite3.OperationalError:
+        print("FTS5 is not available in this SQLite build; course search will use LIKE.")
+        return
+
+    for step in COURSE_SEARCH:
+        conn.execute(step)
+
+
+# ---------------------------------------------------------
+# 4. Normalized Deadlines
+# ---------------------------------------------------------
+def _due_date_to_epoch(value: str):
+    """
+    Epoch seconds (local time) for a stored due_date string, or None if it does not parse.
+    A date without a time (or exactly midnight) means the END of that day.
+    Frozen copy of the rule as of this migration: it must not follow later model changes.
+    """
+    text = str(value).strip()
+    try:
+        due = datetime.fromisoformat(text)
+    except ValueError:
+        try:
+            due = datetime.strptime(text, "%Y-%m-%d")
+        except ValueError:
+            return None
+
+    if due.hour == 0 and due.minute == 0 and due.second == 0:
+        due = due.replace(hour=23, minute=59, second=59)
+    return int(due.timestamp())
+
+
+def backfill_due_at(conn: sqlite3.Connection):
+    """
+    Fills assignments.due_at from the existing due_date strings with the
+    end-of-day rule. Unparseable dates stay NULL.
+    """
+    rows = conn.execute("SELECT id, due_date FROM assignments WHERE due_date IS NOT NULL").fetchall()
+    values = []
+    for assignment_id, due_date in rows:
+        due_at = _due_date_to_epoch(due_date)
+        if due_at is not None:
+            values.append((due_at, assignment_id))
+    conn.executemany("UPDATE assignments SET due_at = ? WHERE id = ?", values)
+
+
+DEADLINES = [
+    "ALTER TABLE assignments ADD COLUMN due_at INTEGER",
+    backfill_due_at,
+    # Deadline range scans per course; replaces the index on the raw strings
+    "DROP INDEX IF EXISTS idx_assignments_course_due",
+    "CREATE INDEX IF NOT EXISTS idx_assignments_course_due_at ON assignments(course_id, due_at)",
+    "ANALYZE assignments",
+]
+
+
+# ---------------------------------------------------------
+# 5. Enrollment Counters and Capacity
+# ---------------------------------------------------------
+ENROLLMENT_COUNTERS = [
+    # Seats taken per course, kept in step with 'enrollments' by the triggers below
+    "ALTER TABLE courses ADD COLUMN enrolled_count INTEGER NOT NULL DEFAULT 0",
+    """
+    UPDATE courses SET enrolled_count = (
+        SELECT COUNT(*) FROM enrollments e
+        WHERE e.course_id = courses.id AND e.status = 'enrolled'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS enrollments_count_insert AFTER INSERT ON enrollments
+    WHEN new.status = 'enrolled' BEGIN
+        UPDATE courses SET enrolled_count = enrolled_count + 1 WHERE id = new.course_id;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS enrollments_count_delete AFTER DELETE ON enrollments
+    WHEN old.status = 'enrolled' BEGIN
+        UPDATE courses SET enrolled_count = enrolled_count - 1 WHERE id = old.course_id;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS enrollments_count_update AFTER UPDATE OF status, course_id ON enrollments
+    BEGIN
+        UPDATE courses SET enrolled_count = enrolled_count - 1
+        WHERE id = old.course_id AND old.status = 'enrolled';
+        UPDATE courses SET enrolled_count = enrolled_count + 1
+        WHERE id = new.course_id AND new.status = 'enrolled';
+    END;
+    """,
+    # Last line of defence against over-enrollment, whatever path the write takes
+    """
+    CREATE TRIGGER IF NOT EXISTS enrollments_capacity_insert BEFORE INSERT ON enrollments
+    WHEN new.status = 'enrolled' BEGIN
+        SELECT RAISE(ABORT, 'Course is full.')
+        FROM courses WHERE id = new.course_id AND enrolled_count >= max_students;
+    END;
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS enrollments_capacity_update BEFORE UPDATE OF status, course_id ON enrollments
+    WHEN new.status = 'enrolled' AND (old.status IS NOT 'enrolled' OR old.course_id != new.course_id) BEGIN
+        SELECT RAISE(ABORT, 'Course is full.')
+        FROM courses WHERE id = new.course_id AND enrolled_count >= max_students;
+    END;
+    """,
+]
+
+
+
+# ---------------------------------------------------------
+# 6. Course Waitlists
+# ---------------------------------------------------------
+WAITLISTS = [
+    """
+    CREATE TABLE IF NOT EXISTS waitlist_entries (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        course_id INTEGER NOT NULL,
+        student_id INTEGER NOT NULL,
+        position INTEGER NOT NULL,
+        joined_at TEXT,
+        FOREIGN KEY (course_id) REFERENCES courses(id) ON DELETE CASCADE,
+        FOREIGN KEY (student_id) REFERENCES students(id)
+    );
+    """,
+    # Head of the line, the tail (next position) and a place-in-line are all seeks on this index.
+    # Not UNIQUE: closing a gap shifts positions down one row at a time.
+    "CREATE INDEX IF NOT EXISTS idx_waitlist_course_position ON waitlist_entries(course_id, position)",
+    # One entry per student per course; also serves "am I waitlisted?" lookups
+    "CREATE UNIQUE INDEX IF NOT EXISTS idx_waitlist_course_student ON waitlist_entries(course_id, student_id)",
+    "CREATE INDEX IF NOT EXISTS idx_waitlist_student ON waitlist_entries(student_id)",
+]
+
+# ---------------------------------------------------------
+# 7. Personal Announcements
+# ---------------------------------------------------------
+PERSONAL_ANNOUNCEMENTS = [
+    # Set on announcements written for ONE student (e.g. a waitlist promotion): they keep
+    # their course but stay out of its announcement feed and reach the student only
+    # through their notification
+    "ALTER TABLE announcements ADD COLUMN is_personal INTEGER NOT NULL DEFAULT 0",
+    "UPDATE announcements SET is_personal = 1 WHERE title LIKE 'Enrolled from Waitlist: %'",
+]
+
+MIGRATIONS = [
+    Migration(1, "initial schema", INITIAL_SCHEMA),
+    Migration(2, "indexes for foreign keys and hot filters", CORE_INDEXES),
+    Migration(3, "FTS5 full-text index for course search", [create_course_search]),
+    Migration(4, "epoch due_at column for assignment deadlines", DEADLINES),
+    Migration(5, "trigger-maintained enrollment counts and capacity guard", ENROLLMENT_COUNTERS),
+    Migration(6, "course waitlists", WAITLISTS),
+    Migration(7, "personal announcements", PERSONAL_ANNOUNCEMENTS),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> list:
+    """
+    Applies every migration newer than the database's user_version, in order.
+    Each migration runs in its own transaction together with the version bump,
+    so a failure leaves the database at the last fully applied version.
+
+    Returns the list of versions that were applied (empty when up to date).
+    """
+    current = get_schema_version(conn)
+    if current >= LATEST_VERSION:
+        return []
+
+    # Manage transactions explicitly: DDL must not be auto-committed step by step.
+    previous_isolation = conn.isolation_level
+    conn.isolation_level = None
+    applied = []
+
+    try:
+        for migration in MIGRATIONS:
+            if migration.version <= current:
+                continue
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                migration.apply(conn)
+                conn.execute(f"PRAGMA user_version = {migration.version}")
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+
+            print(f"Applied migration {migration.version}: {migration.description}")
+            applied.append(migration.version)
+    finally:
+        conn.isolation_level = previous_isolation
+
+    return applied
@@ -9,6 +9,8 @@ else:
     application_path = os.path.dirname(os.path.abspath(__file__))
 
 from database.initialize_db import create_tables
+from database.db_connection import close_pool, describe_profile
+from core.query_recorder import enable_profiling
 from services.instructor_service import InstructorService
 from services.user_service import UserService
 from ui.main_window import MainWindow
@@ -17,17 +19,20 @@ from ui.styles import setup_theme
 
 # Import Services and Locator
 from core.service_locator import ServiceLocator
+from core.task_executor import TaskExecutor
 from services.auth_service import AuthService
 from services.course_service import CourseService
 from services.notification_service import NotificationService
 from services.student_service import StudentService
 from services.assignment_service import AssignmentService
 from services.announcement_service import AnnouncementService
+from services.enrollment_queue import EnrollmentQueue
 # ... import other services
 
 def bootstrap_services():
     """Register all services once at startup."""
     print("--- Bootstrapping Services ---")
+    ServiceLocator.register(TaskExecutor, TaskExecutor())
     ServiceLocator.register(AuthService, AuthService())
     ServiceLocator.register(CourseService, CourseService())
     ServiceLocator.register(NotificationService, NotificationService())
@@ -35,6 +40,7 @@ def bootstrap_services():
     ServiceLocator.register(AssignmentService, AssignmentService())
     ServiceLocator.register(InstructorService, InstructorService())
     ServiceLocator.register(AnnouncementService, AnnouncementService())
+    ServiceLocator.register(EnrollmentQueue, EnrollmentQueue())
     # ... register others
 
 def main():
@@ -44,16 +50,27 @@ def main():
     
     
     # 1. Infrastructure
+    if os.environ.get("SMS_QUERY_PROFILE") == "1":
+        enable_profiling()
     create_tables()
+    settings = describe_profile()
+    print(f"--- Database profile '{settings.pop('profile')}': "
+          + ", ".join(f"{k}={v}" for k, v in settings.items()) + " ---")
     bootstrap_services() 
     
     # 2. UI Init
     root = tk.Tk()
     setup_theme(root) 
+    ServiceLocator.get(TaskExecutor).attach(root)
     
     # 3. Launch
     app = MainWindow(root)
     root.mainloop()
 
+    # 4. Shutdown
+    ServiceLocator.get(TaskExecutor).shutdown()
+    ServiceLocator.get(EnrollmentQueue).shutdown()
+    close_pool()
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -12,14 +12,16 @@ class Announcement(BaseModel):
     - Encapsulation: private attributes with getters/setters.
     - Validation: all input validated immediately.
     """
+    __slots__ = ("_id", "_course_id", "_title", "_message", "_created_at", "_is_personal")
 
-    def __init__(self, id, course_id, title, message, created_at=None):
+    def __init__(self, id, course_id, title, message, created_at=None, is_personal=False):
         self.id = id
         self.course_id = course_id
         self.title = title
         self._message = message
         self.message = message
         self.created_at = created_at or datetime.datetime.now().isoformat()
+        self.is_personal = is_personal
 
     # -------------------
     # Getters
@@ -44,6 +46,10 @@ class Announcement(BaseModel):
     def created_at(self):
         return self._created_at
 
+    @property
+    def is_personal(self):
+        return self._is_personal
+
     # -------------------
     # Setters (with validation)
     # -------------------
@@ -82,6 +88,13 @@ class Announcement(BaseModel):
             raise ValueError("created_at must be a valid datetime string.")
         self._created_at = value.strip()
 
+    @is_personal.setter
+    def is_personal(self, value):
+        # Personal announcements reach one student through their notification only
+        if not isinstance(value, bool):
+            raise TypeError("is_personal must be a boolean.")
+        self._is_personal = value
+
     # -------------------
     # Convert to dict
     # -------------------
@@ -95,7 +108,8 @@ class Announcement(BaseModel):
             "course_id": self._course_id,
             "title": self._title,
             "message": self._message,
-            "created_at": self._created_at
+            "created_at": self._created_at,
+            "is_personal": self._is_personal
         }
 
     # -------------------
@@ -110,14 +124,12 @@ class Announcement(BaseModel):
         if row is None:
             return None
 
-        msg = row["message"]
-        if msg is None: 
-            msg = "No details provided."
-        
-        return Announcement(
-            id=row["id"],
-            course_id=row["course_id"],
-            title=row["title"],
-            message=msg,
-            created_at=row["created_at"]
-        )
+        # Trusted path: the row was validated when it was written, so the setters are skipped
+        announcement = Announcement.__new__(Announcement)
+        announcement._id = row["id"]
+        announcement._course_id = row["course_id"]
+        announcement._title = row["title"]
+        announcement._message = row["message"] or "No details provided."
+        announcement._created_at = row["created_at"]
+        announcement._is_personal = bool(row["is_personal"])
+        return announcement
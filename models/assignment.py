@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from core.base_model import BaseModel
 
 class Assignment(BaseModel):
@@ -13,6 +15,8 @@ class Assignment(BaseModel):
     # Constant to enforce database constraints on 'type' column
     ALLOWED_TYPES = {"quiz", "project", "homework", "exam"}
 
+    __slots__ = ("_id", "_course_id", "_title", "_description", "_type", "_due_date", "_due_at", "_max_score")
+
     def __init__(self, id: int, course_id: int, title: str, description: str, type: str, due_date: str, max_score: int):
         """
         Initialize and VALIDATE all data immediately.
@@ -27,7 +31,7 @@ class Assignment(BaseModel):
         self.title = title
         self.description = description  # Can be empty
         self.type = type                # Must be 'quiz' or 'project'
-        self.due_date = due_date        # Cannot be empty
+        self.due_date = due_date        # Cannot be empty; also sets due_at
         self.max_score = max_score      # Must be > 0
 
     # ---------------------------------------------------------
@@ -58,6 +62,11 @@ class Assignment(BaseModel):
     def due_date(self):
         return self._due_date
 
+    @property
+    def due_at(self):
+        """The deadline as epoch seconds (stored in the indexed 'due_at' column)."""
+        return self._due_at
+
     @property
     def max_score(self):
         return self._max_score
@@ -118,8 +127,29 @@ class Assignment(BaseModel):
         if not cleaned_date:
             raise ValueError("Due date cannot be empty.")
         
+        self._due_at = Assignment.due_timestamp(cleaned_date)
         self._due_date = cleaned_date
 
+    @staticmethod
+    def due_timestamp(value: str) -> int:
+        """
+        Normalizes a due date string to epoch seconds (local time).
+        A date without a time (or exactly midnight) means the END of that day.
+        Accepts ISO strings and the date picker's unpadded 'YYYY-M-D'.
+        """
+        text = str(value).strip()
+        try:
+            due = datetime.fromisoformat(text)
+        except ValueError:
+            try:
+                due = datetime.strptime(text, "%Y-%m-%d")
+            except ValueError:
+                raise ValueError(f"Invalid due date '{value}'. Use YYYY-MM-DD or YYYY-MM-DDTHH:MM.")
+
+        if due.hour == 0 and due.minute == 0 and due.second == 0:
+            due = due.replace(hour=23, minute=59, second=59)
+        return int(due.timestamp())
+
     @max_score.setter
     def max_score(self, value):
         if not isinstance(value, int):
@@ -145,6 +175,7 @@ class Assignment(BaseModel):
             "description": self._description,
             "type": self._type,
             "due_date": self._due_date,
+            "due_at": self._due_at,
             "max_score": self._max_score
         }
 
@@ -153,16 +184,18 @@ class Assignment(BaseModel):
         """
         Factory method to create an Assignment from a database row.
         Safe against optional fields and missing data.
+        Trusted path: the row was validated when it was written, so the setters are skipped.
         """
         if not row:
             return None
         
-        return Assignment(
-            id=row['id'],
-            course_id=row['course_id'],
-            title=row['title'],
-            description=row['description'],
-            type=row['type'],
-            due_date=row['due_date'],
-            max_score=row['max_score']
-        )
\ No newline at end of file
+        assignment = Assignment.__new__(Assignment)
+        assignment._id = row['id']
+        assignment._course_id = row['course_id']
+        assignment._title = row['title']
+        assignment._description = row['description'] or ""
+        assignment._type = row['type']
+        assignment._due_date = row['due_date']
+        assignment._due_at = row['due_at']
+        assignment._max_score = row['max_score']
+        return assignment
\ No newline at end of file
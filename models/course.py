@@ -9,6 +9,8 @@ class Course(BaseModel):
     - Encapsulation: All attributes are private (_var) with public properties.
     - Validation: Setters enforce type and value constraints immediately.
     """
+    __slots__ = ("_id", "_code", "_name", "_description", "_credits", "_semester",
+                 "_max_students", "_instructor_id", "_enrolled_count")
 
     def __init__(
         self,id: int,
@@ -74,6 +76,10 @@ class Course(BaseModel):
     def instructor_id(self):
         return self._instructor_id
 
+    @property
+    def enrolled_count(self):
+        return self._enrolled_count
+
     # ---------------------------------------------------------
     # Setters (Validation Logic)
     # ---------------------------------------------------------
@@ -152,6 +158,12 @@ class Course(BaseModel):
 
         self._instructor_id = value
 
+    @enrolled_count.setter
+    def enrolled_count(self, value):
+        if not isinstance(value, int) or value < 0:
+            raise ValueError("Enrolled count must be a non-negative integer.")
+        self._enrolled_count = value
+
     # ---------------------------------------------------------
     # Polymorphism (Required by BaseModel)
     # ---------------------------------------------------------
@@ -177,17 +189,19 @@ class Course(BaseModel):
     def from_row(row):
         """
         Factory method to create a Course from a database row.
+        Trusted path: the row was validated when it was written, so the setters are skipped.
         """
         if not row:
             return None
 
-        return Course(
-            id=row["id"],
-            code=row["code"],
-            name=row["name"],
-            description=row["description"],
-            credits=row["credits"],
-            semester=row["semester"],
-            max_students=row["max_students"],
-            instructor_id=row["instructor_id"]
-        )
+        course = Course.__new__(Course)
+        course._id = row["id"]
+        course._code = row["code"]
+        course._name = row["name"]
+        course._description = row["description"] or ""
+        course._credits = row["credits"]
+        course._semester = row["semester"]
+        course._max_students = row["max_students"]
+        course._instructor_id = row["instructor_id"]
+        course._enrolled_count = row["enrolled_count"]
+        return course
@@ -13,6 +13,8 @@ class Enrollment(BaseModel):
     # Enforced by DB design
     ALLOWED_STATUS = {"enrolled", "dropped"}
 
+    __slots__ = ("_id", "_student_id", "_course_id", "_date_enrolled", "_status")
+
     def __init__(
         self,
         id: int,
@@ -126,14 +128,15 @@ class Enrollment(BaseModel):
     def from_row(row):
         """
         Factory method to create an Enrollment from a database row.
+        Trusted path: the row was validated when it was written, so the setters are skipped.
         """
         if not row:
             return None
 
-        return Enrollment(
-            id=row["id"],
-            student_id=row["student_id"],
-            course_id=row["course_id"],
-            date_enrolled=row["date_enrolled"],
-            status=row["status"]
-        )
+        enrollment = Enrollment.__new__(Enrollment)
+        enrollment._id = row["id"]
+        enrollment._student_id = row["student_id"]
+        enrollment._course_id = row["course_id"]
+        enrollment._date_enrolled = row["date_enrolled"]
+        enrollment._status = row["status"]
+        return enrollment
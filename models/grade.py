@@ -9,6 +9,7 @@ class Grade(BaseModel):
     - Encapsulation: All attributes are private (_var) with public properties.
     - Validation: Setters enforce type and value constraints immediately.
     """
+    __slots__ = ("_id", "_submission_id", "_grade_value", "_feedback")
 
     def __init__(self, id: int, submission_id: int, grade_value: float, feedback: str):
         """
@@ -102,12 +103,13 @@ class Grade(BaseModel):
     def from_row(row):
         """
         Factory method to create a Grade from a database row.
+        Trusted path: the row was validated when it was written, so the setters are skipped.
         """
         if not row:
             return None
-        return Grade(
-            id=row['id'],
-            submission_id=row['submission_id'],
-            grade_value=row['grade_value'],
-            feedback=row['feedback']
-        )
\ No newline at end of file
+        grade = Grade.__new__(Grade)
+        grade._id = row['id']
+        grade._submission_id = row['submission_id']
+        grade._grade_value = float(row['grade_value'])
+        grade._feedback = row['feedback'] or ""
+        return grade
\ No newline at end of file
@@ -5,6 +5,7 @@ class Instructor(User):
     Derived class demonstrating Inheritance from User.
     Holds instructor-specific profile data from the 'instructors' table.
     """
+    __slots__ = ("_instructor_profile_id", "_user_id_fk", "_department")
     
     def __init__(self, id, username, name, email, gender, role, password_hash, department,
                  instructor_profile_id=None, user_id_fk=None):
@@ -74,17 +75,10 @@ class Instructor(User):
         if not row:
             return None
         
-        return Instructor(
-            # User Data
-            id=row['id'], 
-            username=row['username'], 
-            name=row['name'], 
-            email=row['email'], 
-            gender=row['gender'], 
-            role=row['role'], 
-            password_hash=row['password'],
-            # Instructor Data
-            department=row['department'],
-            instructor_profile_id=row['instructor_profile_id'], 
-            user_id_fk=row['user_id']
-        )
\ No newline at end of file
+        # Trusted path: the row was validated when it was written, so the setters are skipped
+        instructor = Instructor.__new__(Instructor)
+        instructor._fill_from_row(row)
+        instructor._department = row['department']
+        instructor._instructor_profile_id = row['instructor_profile_id']
+        instructor._user_id_fk = row['user_id']
+        return instructor
\ No newline at end of file
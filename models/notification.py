@@ -13,6 +13,7 @@ class Notification(BaseModel):
     - Encapsulation via private attributes
     - Immediate validation via setters
     """
+    __slots__ = ("_id", "_user_id", "_announcement_id", "_read_flag", "_sent_at")
 
     def __init__(self, id, user_id, announcement_id, read_flag=0, sent_at=None):
         self.id = id
@@ -101,10 +102,11 @@ class Notification(BaseModel):
         if row is None:
             return None
 
-        return Notification(
-            id=row["id"],
-            user_id=row["user_id"],
-            announcement_id=row["announcement_id"],
-            read_flag=row["read_flag"],
-            sent_at=row["sent_at"]
-        )
\ No newline at end of file
+        # Trusted path: the row was validated when it was written, so the setters are skipped
+        notification = Notification.__new__(Notification)
+        notification._id = row["id"]
+        notification._user_id = row["user_id"]
+        notification._announcement_id = row["announcement_id"]
+        notification._read_flag = row["read_flag"]
+        notification._sent_at = row["sent_at"]
+        return notification
\ No newline at end of file
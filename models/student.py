@@ -4,6 +4,7 @@ class Student(User):
     """
     Student model extending User.
     """
+    __slots__ = ("_user_id", "_level", "_birthdate", "_major", "_student_profile_id")
 
     def __init__(
         self,
@@ -46,6 +47,11 @@ class Student(User):
     @property
     def student_profile_id(self): return self._student_profile_id
 
+    @property
+    def student_id(self):
+        """Alias used by services and controllers (the students.id column)."""
+        return self._student_profile_id
+
     # --- Setters ---
     @user_id.setter
     def user_id(self, value):
@@ -93,17 +99,13 @@ class Student(User):
     def from_row(row):
         if not row: return None
 
-        profile_id = row["student_profile_id"] if "student_profile_id" in row.keys() else None
-        return Student(
-            id=row["id"],
-            username=row["username"],
-            name=row["name"],
-            email=row["email"],
-            gender=row["gender"],
-            password_hash=row["password"],
-            user_id=row["user_id"],
-            level=row["level"],
-            birthdate=row["birthdate"],
-            major=row["major"],
-            student_profile_id=profile_id
-        )
\ No newline at end of file
+        # Trusted path: the row was validated when it was written, so the setters are skipped
+        student = Student.__new__(Student)
+        student._fill_from_row(row)
+        student._role = "student"
+        student._user_id = row["user_id"]
+        student._level = row["level"]
+        student._birthdate = row["birthdate"]
+        student._major = row["major"] or ""
+        student._student_profile_id = row["student_profile_id"] if "student_profile_id" in row.keys() else None
+        return student
\ No newline at end of file
@@ -9,6 +9,8 @@ class Submission(BaseModel):
     - Encapsulation: All attributes are private (_var) with public properties.
     - Validation: Setters enforce type and value constraints immediately.
     """
+    __slots__ = ("_id", "_assignment_id", "_student_id", "_content", "_submitted_at",
+                 "grade", "feedback", "status")
 
     def __init__(self, id, assignment_id, student_id, content, submitted_at, grade=None, feedback=None, status="submitted"):
         """
@@ -119,19 +121,23 @@ class Submission(BaseModel):
     
     @staticmethod
     def from_row(row):
+        """
+        Factory method to create a Submission from a database row (optionally joined with its grade).
+        Trusted path: the row was validated when it was written, so the setters are skipped.
+        """
         if not row:
             return None
-    
-        data = dict(row)
-
-        return Submission(
-            id=data['id'],
-            assignment_id=data['assignment_id'],
-            student_id=data['student_id'],
-            content=data['content'],
-            submitted_at=data['submitted_at'], 
-            
-            grade=data.get('grade_value'),     
-            feedback=data.get('feedback'),
-            status="graded" if data.get('grade_value') else "submitted"
-        )
\ No newline at end of file
+
+        keys = row.keys()
+        grade = row['grade_value'] if 'grade_value' in keys else None
+
+        submission = Submission.__new__(Submission)
+        submission._id = row['id']
+        submission._assignment_id = row['assignment_id']
+        submission._student_id = row['student_id']
+        submission._content = row['content']
+        submission._submitted_at = row['submitted_at']
+        submission.grade = grade
+        submission.feedback = row['feedback'] if 'feedback' in keys else None
+        submission.status = "graded" if grade else "submitted"
+        return submission
\ No newline at end of file
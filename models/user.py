@@ -10,6 +10,8 @@ class User(BaseModel):
     
     ALLOWED_ROLES = {"student", "instructor", "admin"} 
     ALLOWED_GENDERS = {"male", "female", "engineer"} 
+
+    __slots__ = ("_id", "_username", "_name", "_email", "_gender", "_role", "_password_hash")
     
     def __init__(self, id, username, name, email, gender, role, password_hash=None):
         self.id = id
@@ -116,12 +118,16 @@ class User(BaseModel):
         if not row:
             return None
         
-        return User(
-            id=row['id'],
-            username=row['username'],
-            name=row['name'],
-            email=row['email'],
-            gender=row['gender'],
-            password_hash=row['password'], 
-            role=row['role']
-        )
\ No newline at end of file
+        user = User.__new__(User)
+        user._fill_from_row(row)
+        return user
+
+    def _fill_from_row(self, row):
+        """Trusted path shared with subclasses: the row was validated when it was written."""
+        self._id = row['id']
+        self._username = row['username']
+        self._name = row['name']
+        self._email = row['email']
+        self._gender = row['gender']
+        self._role = row['role']
+        self._password_hash = row['password']
\ No newline at end of file
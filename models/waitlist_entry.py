@@ -0,0 +1,128 @@
+from core.base_model import BaseModel
+
+class WaitlistEntry(BaseModel):
+    """
+    Represents one student's place in a full course's waitlist.
+
+    Strict OOP Implementation:
+    - Inheritance: Inherits from BaseModel.
+    - Encapsulation: All attributes are private (_var) with public properties.
+    - Validation: Setters enforce type and value constraints immediately.
+
+    'position' is the entry's slot in its course's line. Positions are kept
+    dense (no gaps), so a student's place in line is 'position - head position + 1'.
+    """
+
+    __slots__ = ("_id", "_course_id", "_student_id", "_position", "_joined_at")
+
+    def __init__(
+        self,
+        id: int,
+        course_id: int,
+        student_id: int,
+        position: int,
+        joined_at: str
+    ):
+        """
+        Initialize and VALIDATE all data immediately.
+        """
+        self.id = id
+        self.course_id = course_id
+        self.student_id = student_id
+        self.position = position
+        self.joined_at = joined_at
+
+    # ---------------------------------------------------------
+    # Getters (@property)
+    # ---------------------------------------------------------
+
+    @property
+    def id(self):
+        return self._id
+
+    @property
+    def course_id(self):
+        return self._course_id
+
+    @property
+    def student_id(self):
+        return self._student_id
+
+    @property
+    def position(self):
+        return self._position
+
+    @property
+    def joined_at(self):
+        return self._joined_at
+
+    # ---------------------------------------------------------
+    # Setters (Validation Logic)
+    # ---------------------------------------------------------
+
+    @id.setter
+    def id(self, value):
+        if value is not None and not isinstance(value, int):
+            raise TypeError(f"Waitlist entry ID must be an integer, got {type(value).__name__}")
+        self._id = value
+
+    @course_id.setter
+    def course_id(self, value):
+        if not isinstance(value, int):
+            raise TypeError("Course ID must be an integer.")
+        self._course_id = value
+
+    @student_id.setter
+    def student_id(self, value):
+        if not isinstance(value, int):
+            raise TypeError("Student ID must be an integer.")
+        self._student_id = value
+
+    @position.setter
+    def position(self, value):
+        # None until the repository assigns the next slot
+        if value is not None and (not isinstance(value, int) or value < 1):
+            raise ValueError("Waitlist position must be a positive integer.")
+        self._position = value
+
+    @joined_at.setter
+    def joined_at(self, value):
+        if value is None:
+            self._joined_at = None
+            return
+
+        if isinstance(value, str):
+            self._joined_at = value.strip()
+            return
+
+        raise TypeError("joined_at must be a string or None.")
+
+    # ---------------------------------------------------------
+    # Polymorphism (Required by BaseModel)
+    # ---------------------------------------------------------
+
+    def to_dict(self):
+        return {
+            "id": self._id,
+            "course_id": self._course_id,
+            "student_id": self._student_id,
+            "position": self._position,
+            "joined_at": self._joined_at
+        }
+
+    @staticmethod
+    def from_row(row):
+        """
+        Factory method to create a WaitlistEntry from a database row.
+        Trusted path: the row was validated when it was written, so the setters are skipped.
+        """
+        if not row:
+            return None
+
+        entry = WaitlistEntry.__new__(WaitlistEntry)
+        entry._id = row["id"]
+        entry._course_id = row["course_id"]
+        entry._student_id = row["student_id"]
+        entry._position = row["position"]
+        entry._joined_at = row["joined_at"]
+        return entry
@@ -18,10 +18,10 @@ class AnnouncementRepository(BaseRepository):
         """
 
         sql = """
-        INSERT INTO announcements (course_id, title, message, created_at)
-        VALUES (?, ?, ?, ?)
+        INSERT INTO announcements (course_id, title, message, created_at, is_personal)
+        VALUES (?, ?, ?, ?, ?)
         """
-        values = (item.course_id, item.title, item.message, item.created_at)
+        values = (item.course_id, item.title, item.message, item.created_at, int(item.is_personal))
         with self.get_connection() as conn:
             cursor = conn.execute(sql, values)
             item.id = cursor.lastrowid
@@ -50,9 +50,10 @@ class AnnouncementRepository(BaseRepository):
 
     def get_by_course_id(self, course_id):
         """
-        Fetches all announcements belonging to a specific course.
+        Fetches the course's announcement feed. Personal announcements (written for
+        one student) belong to the course but are not part of its feed.
         """
-        sql = "SELECT * FROM announcements WHERE course_id = ?"
+        sql = "SELECT * FROM announcements WHERE course_id = ? AND is_personal = 0"
         with self.get_connection() as conn:
             cursor = conn.execute(sql, (course_id,))
             return [Announcement.from_row(row) for row in cursor.fetchall()]
@@ -61,7 +62,7 @@ class AnnouncementRepository(BaseRepository):
         """
         Fetches all global announcements (course_id is NULL).
         """
-        sql = "SELECT * FROM announcements WHERE course_id IS NULL"
+        sql = "SELECT * FROM announcements WHERE course_id IS NULL AND is_personal = 0"
         with self.get_connection() as conn:
             cursor = conn.execute(sql)
             return [Announcement.from_row(row) for row in cursor.fetchall()]
@@ -1,6 +1,11 @@
+from collections import namedtuple
+
 from core.base_repository import BaseRepository
 from models.assignment import Assignment
 
+# One unsubmitted assignment on a student's deadline list
+DeadlineRow = namedtuple("DeadlineRow", ["assignment_id", "course_id", "course_code", "title", "due_date", "due_at"])
+
 class AssignmentRepository(BaseRepository):
     """
     Handles strict Database interactions for the 'assignments' table.
@@ -16,11 +21,11 @@ class AssignmentRepository(BaseRepository):
         Inserts a new assignment into the database.
         """
         sql = """
-        INSERT INTO assignments (course_id, title, description, type, due_date, max_score)
-        VALUES (?, ?, ?, ?, ?, ?)
+        INSERT INTO assignments (course_id, title, description, type, due_date, due_at, max_score)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
         """
         # We extract values from the Validated Object, not raw arguments
-        values = (item.course_id, item.title, item.description, item.type, item.due_date, item.max_score)
+        values = (item.course_id, item.title, item.description, item.type, item.due_date, item.due_at, item.max_score)
         with self.get_connection() as conn:
             cursor = conn.execute(sql, values)
             item.id = cursor.lastrowid
@@ -48,7 +53,7 @@ class AssignmentRepository(BaseRepository):
         """
         Fetches all assignments belonging to a specific course.
         """
-        sql = "SELECT * FROM assignments WHERE course_id = ? ORDER BY due_date ASC"
+        sql = "SELECT * FROM assignments WHERE course_id = ? ORDER BY due_at ASC"
         with self.get_connection() as conn:
             cursor = conn.execute(sql, (course_id,))
             return [Assignment.from_row(row) for row in cursor.fetchall()]
@@ -59,10 +64,10 @@ class AssignmentRepository(BaseRepository):
         """
         sql = """
         UPDATE assignments 
-        SET title = ?, description = ?, type = ?, due_date = ?, max_score = ?
+        SET title = ?, description = ?, type = ?, due_date = ?, due_at = ?, max_score = ?
         WHERE id = ?
         """
-        values = (item.title, item.description, item.type, item.due_date, item.max_score, item.id)
+        values = (item.title, item.description, item.type, item.due_date, item.due_at, item.max_score, item.id)
         with self.get_connection() as conn:
             conn.execute(sql, values)
 
@@ -84,4 +89,60 @@ class AssignmentRepository(BaseRepository):
             cursor = conn.execute(sql, (course_id,))
             result = cursor.fetchone()[0]
             # If result is None (no assignments), return 0.0
-            return result if result else 0.0
\ No newline at end of file
+            return result if result else 0.0
+
+    def get_student_deadlines(self, student_id: int, start: int, end: int):
+        """
+        A student's unsubmitted assignments due in (start, end] (epoch seconds),
+        soonest first, as DeadlineRow tuples. ONE query: enrollments ->
+        idx_assignments_course_due_at range -> anti-join on submissions.
+        """
+        sql = """
+        SELECT a.id, a.course_id, c.code, a.title, a.due_date, a.due_at
+        FROM enrollments e
+        JOIN assignments a ON a.course_id = e.course_id
+        JOIN courses c ON c.id = a.course_id
+        WHERE e.student_id = ? AND e.status = 'enrolled'
+          AND a.due_at > ? AND a.due_at <= ?
+          AND NOT EXISTS (SELECT 1 FROM submissions s
+                          WHERE s.student_id = e.student_id AND s.assignment_id = a.id)
+        ORDER BY a.due_at, a.id
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (student_id, start, end))
+            return [DeadlineRow._make(row) for row in cursor.fetchall()]
+
+    def get_student_assignment_statuses(self, student_id: int, now: int, course_id: int = None):
+        """
+        Every assignment of the student's enrolled courses (or of one course) with
+        course_code, submission_id, grade, feedback and a status computed in SQL:
+        Graded > Submitted > Overdue (due_at before 'now') > Pending.
+        ONE query regardless of the number of courses and assignments; returns
+        dicts ordered by deadline.
+        """
+        sql = """
+        SELECT a.id, a.course_id, a.title, a.type, a.due_date, a.due_at, a.max_score,
+               c.code AS course_code,
+               s.id AS submission_id,
+               g.grade_value AS grade,
+               g.feedback,
+               CASE WHEN g.id IS NOT NULL THEN 'Graded'
+                    WHEN s.id IS NOT NULL THEN 'Submitted'
+                    WHEN a.due_at < ? THEN 'Overdue'
+                    ELSE 'Pending' END AS status
+        FROM enrollments e
+        JOIN courses c ON c.id = e.course_id
+        JOIN assignments a ON a.course_id = e.course_id
+        LEFT JOIN submissions s ON s.student_id = e.student_id AND s.assignment_id = a.id
+        LEFT JOIN grades g ON g.submission_id = s.id
+        WHERE e.student_id = ? AND e.status = 'enrolled'
+        """
+        params = [now, student_id]
+        if course_id is not None:
+            sql += " AND e.course_id = ?"
+            params.append(course_id)
+        sql += " ORDER BY a.due_at, a.id"
+
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, params)
+            return [dict(row) for row in cursor.fetchall()]
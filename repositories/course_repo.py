@@ -1,5 +1,45 @@
+import re
+from collections import namedtuple
+
 from core.base_repository import BaseRepository
+from core.query_spec import QuerySpec, Page
 from models.course import Course
+from repositories.waitlist_repo import WaitlistRepository
+
+# Catalog cards show the start of the description, never all of it
+SUMMARY_LENGTH = 120
+
+
+class CourseListRow(namedtuple("CourseListRow", ["id", "code", "name", "instructor_id"])):
+    """One row of a course table (e.g. the campus manager's unassigned list)."""
+    __slots__ = ()
+
+
+class CatalogCard(namedtuple("CatalogCard", [
+        "id", "code", "name", "credits", "semester", "max_students", "instructor_id", "summary",
+        "instructor_name", "enrolled_count", "is_enrolled", "waitlist_place", "relevance", "snippet"])):
+    """
+    One student catalog card. 'summary' is at most SUMMARY_LENGTH + 1 characters of
+    the description (one extra so the card knows to add '...'); 'waitlist_place' is
+    the student's place in the course's waitlist (None if not waiting); 'relevance'
+    and 'snippet' are only set for full-text searches.
+    """
+    __slots__ = ()
+
+    @property
+    def remaining_seats(self) -> int:
+        return max(0, self.max_students - self.enrolled_count)
+
+
+class TeachingCourseRow(namedtuple("TeachingCourseRow", [
+        "id", "code", "name", "credits", "semester", "max_students", "enrolled_count",
+        "submission_count", "ungraded_count", "next_due_title", "next_due_at"])):
+    """
+    One course card on the instructor dashboard. 'ungraded_count' counts submissions
+    without a grade; 'next_due_*' are None when nothing is due from now on.
+    """
+    __slots__ = ()
+
 
 class CourseRepository(BaseRepository):
     """
@@ -11,6 +51,21 @@ class CourseRepository(BaseRepository):
     - Security: Parameterized queries to prevent SQL injection.
     """
 
+    # Columns a QuerySpec may filter or sort on
+    PAGE_FIELDS = ("id", "code", "name", "credits", "semester", "max_students", "instructor_id")
+    CATALOG_FIELDS = PAGE_FIELDS + ("instructor_name", "enrolled_count", "is_enrolled", "relevance")
+
+    # Substring fallback when SQLite has no FTS5
+    LIKE_SEARCH = "(c.code LIKE ? OR c.name LIKE ? OR c.description LIKE ?)"
+    # Weights: a hit in the code outranks the name, which outranks the description
+    RANK = "bm25(courses_fts, 10.0, 5.0, 1.0)"
+
+    LIST_SQL = "SELECT id, code, name, instructor_id FROM courses"
+
+    def __init__(self):
+        super().__init__()
+        self._has_search_index = None
+
     def create(self, item: Course) -> Course:
         """
         Inserts a new course into the database.
@@ -36,6 +91,38 @@ class CourseRepository(BaseRepository):
             cursor = conn.execute(sql)
             return [Course.from_row(row) for row in cursor.fetchall()]
 
+    def get_all_with_instructor_names(self):
+        """
+        Fetches all courses as dicts (Course.to_dict() plus 'instructor_name'),
+        with the instructor's name joined in the same query.
+        """
+        sql = """
+        SELECT c.*, COALESCE(u.name, 'Unknown') AS instructor_name
+        FROM courses c
+        LEFT JOIN instructors i ON c.instructor_id = i.id
+        LEFT JOIN users u ON i.user_id = u.id
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql)
+            return [dict(Course.from_row(row).to_dict(), instructor_name=row["instructor_name"])
+                    for row in cursor.fetchall()]
+
+    def find_page(self, spec: QuerySpec) -> Page:
+        """
+        One page of Course objects matching 'spec'.
+        e.g. QuerySpec().where("instructor_id", op="IS NULL").order("code")
+        """
+        return self.fetch_page("SELECT * FROM courses", spec,
+                               allowed=self.PAGE_FIELDS, mapper=Course.from_row)
+
+    def find_list_page(self, spec: QuerySpec) -> Page:
+        """
+        Same filtering as find_page, but only the columns a course table shows:
+        a Page of CourseListRow (id, code, name, instructor_id).
+        """
+        return self.fetch_page(self.LIST_SQL, spec,
+                               allowed=CourseListRow._fields, mapper=CourseListRow._make)
+
     def get_by_id(self, id: int):
         """
         Fetches a single course by its unique ID.
@@ -54,6 +141,34 @@ class CourseRepository(BaseRepository):
             cursor = conn.execute(sql, (instructor_id,))
             return [Course.from_row(row) for row in cursor.fetchall()]
 
+    def get_teaching_overview(self, instructor_id: int, now: int):
+        """
+        Dashboard figures for every course of one instructor, in a single grouped
+        query: enrollment, submission and ungraded counts plus the next assignment
+        due at or after 'now' (epoch seconds). The query is driven from the
+        instructor's courses and every lookup is an index seek, so its cost grows
+        with the instructor's own sections, not with the campus.
+        """
+        sql = """
+        SELECT c.id, c.code, c.name, c.credits, c.semester, c.max_students, c.enrolled_count,
+               COUNT(s.id) AS submission_count,
+               COALESCE(SUM(s.id IS NOT NULL AND NOT EXISTS (
+                   SELECT 1 FROM grades g WHERE g.submission_id = s.id)), 0) AS ungraded_count,
+               (SELECT n.title FROM assignments n
+                WHERE n.course_id = c.id AND n.due_at >= ?
+                ORDER BY n.due_at LIMIT 1) AS next_due_title,
+               MIN(CASE WHEN a.due_at >= ? THEN a.due_at END) AS next_due_at
+        FROM courses c
+        LEFT JOIN assignments a ON a.course_id = c.id
+        LEFT JOIN submissions s ON s.assignment_id = a.id
+        WHERE c.instructor_id = ?
+        GROUP BY c.id
+        ORDER BY c.code
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (now, now, instructor_id))
+            return [TeachingCourseRow._make(row) for row in cursor.fetchall()]
+
     def update(self, item: Course):
         """
         Updates an existing course's details.
@@ -89,8 +204,8 @@ class CourseRepository(BaseRepository):
             return Course.from_row(cursor.fetchone())
     
     def get_enrollment_count(self, course_id: int) -> int:
-        """Calculates how many students are currently in the course."""
-        sql = "SELECT COUNT(*) FROM enrollments WHERE course_id = ? AND status = 'enrolled'"
+        """How many students are currently in the course (trigger-maintained counter)."""
+        sql = "SELECT enrolled_count FROM courses WHERE id = ?"
         with self.get_connection() as conn:
             cursor = conn.execute(sql, (course_id,))
             result = cursor.fetchone()
@@ -116,4 +231,114 @@ class CourseRepository(BaseRepository):
         """Sets the instructor_id of a course to NULL in the database."""
         sql = "UPDATE courses SET instructor_id = NULL WHERE id = ?"
         with self.get_connection() as conn:
-            conn.execute(sql, (course_id,))
\ No newline at end of file
+            conn.execute(sql, (course_id,))
+
+    # ---------------------------------------------------------
+    # Catalog & Full-Text Search
+    # ---------------------------------------------------------
+    def has_search_index(self) -> bool:
+        """True when migration 3 created the FTS5 'courses_fts' table."""
+        if self._has_search_index is None:
+            with self.get_connection() as conn:
+                row = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'courses_fts'"
+                ).fetchone()
+            self._has_search_index = row is not None
+        return self._has_search_index
+
+    @staticmethod
+    def to_match_query(text: str):
+        """
+        Turns user input into a safe FTS5 query: every word must match as a prefix.
+        'intro net' -> '"intro"* "net"*'. Returns None when there are no words.
+        """
+        words = re.findall(r"\w+", text or "")
+        if not words:
+            return None
+        return " ".join(f'"{word}"*' for word in words)
+
+    def get_catalog_page(self, user_id: int, spec: QuerySpec, text: str = None) -> Page:
+        """
+        Student catalog read model: ONE round trip per page, returned as CatalogCard rows.
+        Each card carries the displayed course columns plus instructor_name,
+        enrolled_count, remaining_seats, is_enrolled and waitlist_place (for the student
+        behind 'user_id').
+
+        With 'text', only matching courses are returned. When the FTS5 index exists
+        cards also carry 'relevance' (bm25, lower is better) and a highlighted
+        'snippet', and are ranked by relevance unless 'spec' orders them otherwise.
+        """
+        match = self.to_match_query(text)
+        use_index = match is not None and self.has_search_index()
+
+        sql = f"""
+        WITH me AS (SELECT id FROM students WHERE user_id = ?)
+        SELECT c.id, c.code, c.name, c.credits, c.semester, c.max_students, c.instructor_id,
+               substr(c.description, 1, {SUMMARY_LENGTH + 1}) AS summary,
+               COALESCE(u.name, 'Unknown') AS instructor_name,
+               c.enrolled_count,
+               EXISTS (SELECT 1 FROM enrollments e JOIN me ON e.student_id = me.id
+                        WHERE e.course_id = c.id AND e.status = 'enrolled') AS is_enrolled,
+               (SELECT {WaitlistRepository.PLACE_SQL} FROM waitlist_entries w JOIN me ON w.student_id = me.id
+                 WHERE w.course_id = c.id) AS waitlist_place
+        """
+        params = [user_id]
+
+        if use_index:
+            sql += f""",
+               {self.RANK} AS relevance,
+               snippet(courses_fts, -1, '[', ']', '...', 12) AS snippet
+        FROM courses_fts
+        JOIN courses c ON c.id = courses_fts.rowid
+        """
+        else:
+            sql += """,
+               NULL AS relevance,
+               NULL AS snippet
+        FROM courses c
+        """
+        sql += """
+        LEFT JOIN instructors i ON c.instructor_id = i.id
+        LEFT JOIN users u ON i.user_id = u.id
+        """
+
+        if use_index:
+            sql += " WHERE courses_fts MATCH ?"
+            params.append(match)
+            if not spec.ordering:
+                spec = spec.order("relevance")
+        elif match is not None:
+            sql += " WHERE " + self.LIKE_SEARCH
+            params.extend([f"%{text.strip()}%"] * 3)
+
+        if not spec.ordering:
+            spec = spec.order("code")
+
+        return self.fetch_page(sql, spec, params, allowed=self.CATALOG_FIELDS, mapper=CatalogCard._make)
+
+    def search(self, text: str, limit: int = None):
+        """Courses matching 'text' as full Course objects, best match first."""
+        match = self.to_match_query(text)
+        params = []
+
+        if match is not None and self.has_search_index():
+            sql = f"""
+            SELECT c.* FROM courses_fts
+            JOIN courses c ON c.id = courses_fts.rowid
+            WHERE courses_fts MATCH ?
+            ORDER BY {self.RANK}
+            """
+            params.append(match)
+        elif match is not None:
+            sql = f"SELECT c.* FROM courses c WHERE {self.LIKE_SEARCH} ORDER BY c.code"
+            params.extend([f"%{text.strip()}%"] * 3)
+        else:
+            sql = "SELECT c.* FROM courses c ORDER BY c.code"
+
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, params)
+            return [Course.from_row(row) for row in cursor.fetchall()]
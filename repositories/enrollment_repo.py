@@ -1,7 +1,12 @@
+from collections import namedtuple
+
 from core.base_repository import BaseRepository
 from models.enrollment import Enrollment
 from models.course import Course
 
+# Why a conditional insert found nothing to insert (see create_if_open)
+AdmissionState = namedtuple("AdmissionState", ["is_enrolled", "is_full", "has_waitlist"])
+
 class EnrollmentRepository(BaseRepository):
     """
     Handles strict Database interactions for the 'enrollments' table.
@@ -28,6 +33,59 @@ class EnrollmentRepository(BaseRepository):
             item.id = cursor.lastrowid
             return item
 
+    def create_if_open(self, item: Enrollment):
+        """
+        Enrolls in ONE conditional write: the row is only inserted while the course
+        has a free seat, the student is not already enrolled and nobody is ahead of
+        them on the course's waitlist (free seats go to the line first; the head of
+        the line itself may take one). The check and the insert run in the same
+        statement (and the counter trigger in the same transaction), so concurrent
+        registrations cannot overfill a course or jump the line.
+        Returns the saved Enrollment, or None when nothing was inserted.
+        """
+        sql = """
+        INSERT INTO enrollments (student_id, course_id, date_enrolled, status)
+        SELECT ?, c.id, ?, 'enrolled' FROM courses c
+        WHERE c.id = ? AND c.enrolled_count < c.max_students
+          AND NOT EXISTS (
+              SELECT 1 FROM enrollments e
+              WHERE e.student_id = ? AND e.course_id = c.id AND e.status = 'enrolled'
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM waitlist_entries w
+              WHERE w.course_id = c.id AND w.position < COALESCE(
+                  (SELECT m.position FROM waitlist_entries m
+                   WHERE m.course_id = c.id AND m.student_id = ?),
+                  9223372036854775807)
+          )
+        """
+        values = (item.student_id, item.date_enrolled, item.course_id, item.student_id, item.student_id)
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, values)
+            if cursor.rowcount == 0:
+                return None
+            item.id = cursor.lastrowid
+            return item
+
+    def get_admission_state(self, student_profile_id: int, course_id: int):
+        """
+        The facts that explain a refused create_if_open, in one query:
+        an AdmissionState, or None if the course does not exist.
+        """
+        sql = """
+        SELECT EXISTS (
+                   SELECT 1 FROM enrollments e
+                   WHERE e.student_id = ? AND e.course_id = c.id AND e.status = 'enrolled'
+               ),
+               c.enrolled_count >= c.max_students,
+               EXISTS (SELECT 1 FROM waitlist_entries w WHERE w.course_id = c.id)
+        FROM courses c
+        WHERE c.id = ?
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(sql, (student_profile_id, course_id)).fetchone()
+            return AdmissionState(bool(row[0]), bool(row[1]), bool(row[2])) if row else None
+
     def get_all(self):
         """
         Fetches all enrollments.
@@ -94,6 +152,19 @@ class EnrollmentRepository(BaseRepository):
         with self.get_connection() as conn:
             cursor = conn.execute(sql, (user_id, course_id))
             return cursor.fetchone() is not None
+
+    def is_student_enrolled(self, student_profile_id: int, course_id: int) -> bool:
+        """
+        Same check as is_enrolled, for callers that already hold the Student Profile ID.
+        Served straight from the enrollments index, no join.
+        """
+        sql = """
+        SELECT 1 FROM enrollments
+        WHERE student_id = ? AND course_id = ? AND status = 'enrolled'
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (student_profile_id, course_id))
+            return cursor.fetchone() is not None
         
     def get_courses_by_student(self, student_profile_id: int):
         """
@@ -110,6 +181,24 @@ class EnrollmentRepository(BaseRepository):
             # We reuse the Course model's factory to return standard objects
             return [Course.from_row(row) for row in cursor.fetchall()]
         
+    def get_course_details_by_student(self, student_profile_id: int):
+        """
+        The student's enrolled courses as dicts (Course.to_dict() plus 'instructor_name'),
+        with the instructor's name joined in the same query.
+        """
+        sql = """
+        SELECT c.*, COALESCE(u.name, 'Unknown') AS instructor_name
+        FROM courses c
+        JOIN enrollments e ON c.id = e.course_id
+        LEFT JOIN instructors i ON c.instructor_id = i.id
+        LEFT JOIN users u ON i.user_id = u.id
+        WHERE e.student_id = ? AND e.status = 'enrolled'
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (student_profile_id,))
+            return [dict(Course.from_row(row).to_dict(), instructor_name=row["instructor_name"])
+                    for row in cursor.fetchall()]
+
     def delete_enrollment(self, student_id: int, course_id: int) -> bool:
         """Permanently removes the enrollment record from the database."""
         sql = "DELETE FROM enrollments WHERE student_id = ? AND course_id = ?"
@@ -1,6 +1,14 @@
+from collections import namedtuple
+
 from core.base_repository import BaseRepository
 from models.grade import Grade
 
+# One line of a student's grade ledger (a submission with its assignment, course and grade)
+GradeLedgerRow = namedtuple("GradeLedgerRow", [
+    "submission_id", "assignment_id", "course_id", "course_code", "assignment_title",
+    "submitted_at", "status", "grade", "max_score", "feedback"
+])
+
 class GradeRepository(BaseRepository):
     """
     Handles strict Database interactions for the 'grades' table.
@@ -92,6 +100,52 @@ class GradeRepository(BaseRepository):
             result = cursor.fetchone()[0]
             return result if result else 0.0
     
+    def get_student_ledger(self, student_id: int, course_id: int = None,
+                           submitted_from: str = None, submitted_to: str = None):
+        """
+        All of a student's submissions with assignment, course and grade in ONE query,
+        oldest first, as GradeLedgerRow tuples.
+        Optional filters: one course, and a 'YYYY-MM-DD' date range on submitted_at
+        (both ends inclusive).
+        Driven by idx_submissions_student_assignment; the joins are primary-key
+        and idx_grades_submission lookups.
+        """
+        sql = """
+        SELECT 
+            s.id AS submission_id,
+            a.id AS assignment_id,
+            c.id AS course_id,
+            c.code AS course_code,
+            a.title AS assignment_title,
+            s.submitted_at,
+            CASE WHEN g.id IS NULL THEN 'Awaiting Grade' ELSE 'Graded' END AS status,
+            g.grade_value AS grade,
+            a.max_score,
+            COALESCE(g.feedback, '') AS feedback
+        FROM submissions s
+        JOIN assignments a ON s.assignment_id = a.id
+        JOIN courses c ON a.course_id = c.id
+        LEFT JOIN grades g ON g.submission_id = s.id
+        WHERE s.student_id = ?
+        """
+        params = [student_id]
+
+        if course_id is not None:
+            sql += " AND a.course_id = ?"
+            params.append(course_id)
+        if submitted_from:
+            sql += " AND s.submitted_at >= ?"
+            params.append(submitted_from)
+        if submitted_to:
+            sql += " AND substr(s.submitted_at, 1, 10) <= ?"
+            params.append(submitted_to)
+
+        sql += " ORDER BY s.submitted_at, s.id"
+
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, params)
+            return [GradeLedgerRow._make(row) for row in cursor.fetchall()]
+
     def get_transcript_data(self, student_id: int):
         """
         Complex Reporting Query updated for named row access.
@@ -1,4 +1,5 @@
 from core.base_repository import BaseRepository
+from core.query_spec import QuerySpec, Page
 from models.instructor import Instructor 
 
 class InstructorRepository(BaseRepository):
@@ -73,6 +74,16 @@ class InstructorRepository(BaseRepository):
             cursor = conn.execute(sql)
             return [Instructor.from_row(row) for row in cursor.fetchall()]
 
+    def find_page(self, spec: QuerySpec) -> Page:
+        """One page of the faculty directory (filter/sort on name, department, ...)."""
+        sql = """
+            SELECT u.*, i.user_id, i.id as instructor_profile_id, i.department 
+            FROM users u
+            JOIN instructors i ON u.id = i.user_id
+        """
+        return self.fetch_page(sql, spec, allowed=("id", "name", "username", "email", "department"),
+                               mapper=Instructor.from_row)
+
     def get_by_id(self, id: int):
         sql = """
             SELECT u.*, i.user_id, i.id as instructor_profile_id, i.department 
@@ -1,7 +1,16 @@
+from collections import namedtuple
 from typing import List
 from core.base_repository import BaseRepository
+from core.query_spec import QuerySpec, Page
 from models.notification import Notification
 
+# The inbox table shows the start of each announcement; the full text is loaded on open
+PREVIEW_LENGTH = 120
+
+NotificationRow = namedtuple("NotificationRow", [
+    "notification_id", "read_flag", "sent_at", "announcement_id", "course_id", "title", "preview"
+])
+
 class NotificationRepository(BaseRepository):
     """
     Handles strict Database interactions for the 'notifications' table.
@@ -101,6 +110,23 @@ class NotificationRepository(BaseRepository):
         with self.get_connection() as conn:
             conn.executemany(sql, values_list)
 
+    def create_for_course(self, course_id: int, announcement_id: int, sent_at: str) -> int:
+        """
+        Fans an announcement out to every enrolled student of a course in ONE statement:
+        the recipients are selected and inserted inside SQLite, so the Python-side
+        cost is the same for 8 students or 800. Returns the number of notifications created.
+        """
+        sql = """
+        INSERT INTO notifications (user_id, announcement_id, read_flag, sent_at)
+        SELECT s.user_id, ?, 0, ?
+        FROM enrollments e
+        JOIN students s ON s.id = e.student_id
+        WHERE e.course_id = ? AND e.status = 'enrolled'
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (announcement_id, sent_at, course_id))
+            return cursor.rowcount
+
     def count_unread(self, user_id: int) -> int:
         """Fast SQL count for the UI badge."""
         sql = "SELECT COUNT(*) FROM notifications WHERE user_id = ? AND read_flag = 0"
@@ -114,12 +140,7 @@ class NotificationRepository(BaseRepository):
         with self.get_connection() as conn:
             conn.execute(sql, (announcement_id,))
 
-    def get_dashboard_notifications(self, user_id: int):
-        """
-        Complex Query: Joins Notifications with Announcements.
-        Returns a dictionary for the UI, not a Model object.
-        """
-        sql = """
+    DASHBOARD_SQL = """
         SELECT 
             n.id as notification_id, 
             n.read_flag, 
@@ -131,11 +152,40 @@ class NotificationRepository(BaseRepository):
         FROM notifications n
         JOIN announcements a ON n.announcement_id = a.id
         WHERE n.user_id = ?
-        ORDER BY n.sent_at DESC
         """
+    DASHBOARD_FIELDS = ("notification_id", "read_flag", "sent_at", "announcement_id", "course_id")
+
+    INBOX_SQL = f"""
+        SELECT 
+            n.id as notification_id, 
+            n.read_flag, 
+            n.sent_at,
+            a.id as announcement_id,
+            a.course_id,
+            a.title, 
+            substr(a.message, 1, {PREVIEW_LENGTH + 1}) as preview
+        FROM notifications n
+        JOIN announcements a ON n.announcement_id = a.id
+        WHERE n.user_id = ?
+        """
+
+    def get_dashboard_notifications(self, user_id: int):
+        """
+        Complex Query: Joins Notifications with Announcements.
+        Returns a dictionary for the UI, not a Model object.
+        """
+        sql = self.DASHBOARD_SQL + " ORDER BY n.sent_at DESC"
         with self.get_connection() as conn:
             cursor = conn.execute(sql, (user_id,))
             return [dict(row) for row in cursor.fetchall()]
+
+    def get_dashboard_notifications_page(self, user_id: int, spec: QuerySpec) -> Page:
+        """
+        The notifications inbox, one page at a time, as NotificationRow tuples.
+        Rows carry a 'preview' of the announcement instead of its full message.
+        """
+        return self.fetch_page(self.INBOX_SQL, spec, (user_id,), allowed=self.DASHBOARD_FIELDS,
+                               key="notification_id", mapper=NotificationRow._make, nullable=("sent_at",))
     
     def delete_old_read(self, cutoff_date: str):
         """System Cleanup job."""
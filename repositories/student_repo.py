@@ -126,7 +126,20 @@ class StudentRepository(BaseRepository):
         with self.get_connection() as conn:
             res = conn.execute(sql, (user_id,)).fetchone()
             return res[0] if res else None
-        
+
+    def get_profile_ids_by_user_ids(self, user_ids) -> dict:
+        """
+        Batch form of get_profile_id_by_user_id: {user_id: student_profile_id}
+        for every given user that has a student profile, in one query.
+        """
+        user_ids = list(user_ids)
+        if not user_ids:
+            return {}
+        marks = ", ".join("?" * len(user_ids))
+        sql = f"SELECT user_id, id FROM students WHERE user_id IN ({marks})"
+        with self.get_connection() as conn:
+            return {row[0]: row[1] for row in conn.execute(sql, user_ids).fetchall()}
+
     def _fetch_all(self, sql, params=()):
         """Helper to ensure results can be accessed by column name (like s.name)."""
         with self.get_connection() as conn:
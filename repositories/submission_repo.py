@@ -1,4 +1,5 @@
 from core.base_repository import BaseRepository
+from core.query_spec import QuerySpec, Page
 from models.submission import Submission
 
 class SubmissionRepository(BaseRepository):
@@ -102,11 +103,7 @@ class SubmissionRepository(BaseRepository):
             cursor = conn.execute(sql, (student_id, assignment_id))
             return Submission.from_row(cursor.fetchone())
             
-    def get_grading_queue(self, assignment_id: int):
-        """
-        Fetches all submissions for a specific assignment, including the Content.
-        """
-        sql = """
+    GRADING_QUEUE_SQL = """
         SELECT 
             s.id as submission_id,
             u.name as student_name,
@@ -119,8 +116,20 @@ class SubmissionRepository(BaseRepository):
         JOIN users u ON st.user_id = u.id
         LEFT JOIN grades g ON s.id = g.submission_id
         WHERE s.assignment_id = ?
-        ORDER BY s.submitted_at DESC
         """
+    GRADING_QUEUE_FIELDS = ("submission_id", "student_name", "submitted_at", "grade_value")
+
+    def get_grading_queue(self, assignment_id: int):
+        """
+        Fetches all submissions for a specific assignment, including the Content.
+        """
+        sql = self.GRADING_QUEUE_SQL + " ORDER BY s.submitted_at DESC"
         with self.get_connection() as conn:
             cursor = conn.execute(sql, (assignment_id,))
-            return [dict(row) for row in cursor.fetchall()]
\ No newline at end of file
+            return [dict(row) for row in cursor.fetchall()]
+
+    def get_grading_queue_page(self, assignment_id: int, spec: QuerySpec) -> Page:
+        """Same rows as get_grading_queue, one page at a time."""
+        return self.fetch_page(self.GRADING_QUEUE_SQL, spec, (assignment_id,),
+                               allowed=self.GRADING_QUEUE_FIELDS, key="submission_id",
+                               nullable=("submitted_at",))
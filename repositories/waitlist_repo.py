@@ -0,0 +1,149 @@
+from collections import namedtuple
+
+from core.base_repository import BaseRepository
+from models.waitlist_entry import WaitlistEntry
+
+# The next student in line, with the account to notify when they get the seat
+WaitlistHead = namedtuple("WaitlistHead", ["id", "student_id", "user_id", "position"])
+
+# One row of a student's "my waitlists" list; 'place' is 1 for the head of the line
+WaitlistRow = namedtuple("WaitlistRow", ["course_id", "course_code", "course_name", "place", "joined_at"])
+
+
+class WaitlistRepository(BaseRepository):
+    """
+    Handles strict Database interactions for the 'waitlist_entries' table.
+
+    Implementation details:
+    - Connection Safety: Uses 'with self.get_connection() as conn:' for automatic cleanup.
+    - Data Safety: Returns strict 'WaitlistEntry' objects via 'from_row', not raw tuples.
+    - Security: Uses parameterized queries (?) to prevent SQL Injection.
+    - Ordering: positions are dense per course and indexed by (course_id, position),
+      so joining, the head of the line and a place-in-line are index seeks however
+      long the line is. Only leaving from the middle rewrites the entries behind.
+    """
+
+    # Place in line = own position - head position + 1
+    PLACE_SQL = """
+        w.position - (SELECT MIN(h.position) FROM waitlist_entries h
+                      WHERE h.course_id = w.course_id) + 1
+    """
+
+    def create(self, item: WaitlistEntry) -> WaitlistEntry:
+        """
+        Appends the student to the end of the course's line; assigns item.position.
+        Raises sqlite3.IntegrityError if the student is already in this line.
+        """
+        sql = """
+        INSERT INTO waitlist_entries (course_id, student_id, position, joined_at)
+        SELECT ?, ?, COALESCE(MAX(position), 0) + 1, ? FROM waitlist_entries WHERE course_id = ?
+        """
+        values = (item.course_id, item.student_id, item.joined_at, item.course_id)
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, values)
+            item.id = cursor.lastrowid
+            item.position = conn.execute(
+                "SELECT position FROM waitlist_entries WHERE id = ?", (item.id,)).fetchone()[0]
+            return item
+
+    def get_all(self):
+        """
+        Fetches all waitlist entries, line by line.
+        """
+        sql = "SELECT * FROM waitlist_entries ORDER BY course_id, position"
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql)
+            return [WaitlistEntry.from_row(row) for row in cursor.fetchall()]
+
+    def get_by_id(self, id: int):
+        """
+        Fetch a single waitlist entry by unique ID.
+        """
+        sql = "SELECT * FROM waitlist_entries WHERE id = ?"
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (id,))
+            return WaitlistEntry.from_row(cursor.fetchone())
+
+    def get_entry(self, student_id: int, course_id: int):
+        """
+        The student's entry in one course's line, or None.
+        """
+        sql = "SELECT * FROM waitlist_entries WHERE course_id = ? AND student_id = ?"
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (course_id, student_id))
+            return WaitlistEntry.from_row(cursor.fetchone())
+
+    def update(self, item: WaitlistEntry):
+        """
+        Updates an entry's join date. Positions only move through delete().
+        """
+        sql = "UPDATE waitlist_entries SET joined_at = ? WHERE id = ?"
+        with self.get_connection() as conn:
+            conn.execute(sql, (item.joined_at, item.id))
+
+    def delete(self, id: int) -> bool:
+        """
+        Removes an entry and keeps the course's positions dense.
+        Removing the head costs nothing extra: the line simply starts one later.
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(
+                "SELECT course_id, position FROM waitlist_entries WHERE id = ?", (id,)).fetchone()
+            if not row:
+                return False
+            course_id, position = row[0], row[1]
+
+            conn.execute("DELETE FROM waitlist_entries WHERE id = ?", (id,))
+            has_ahead = conn.execute(
+                "SELECT 1 FROM waitlist_entries WHERE course_id = ? AND position < ? LIMIT 1",
+                (course_id, position)).fetchone()
+            if has_ahead:
+                # Left from the middle: everyone behind moves up one place
+                conn.execute(
+                    "UPDATE waitlist_entries SET position = position - 1 WHERE course_id = ? AND position > ?",
+                    (course_id, position))
+            return True
+
+    def get_head(self, course_id: int):
+        """
+        The next student in line for a course as a WaitlistHead, or None if nobody waits.
+        """
+        sql = """
+        SELECT w.id, w.student_id, s.user_id, w.position
+        FROM waitlist_entries w
+        JOIN students s ON s.id = w.student_id
+        WHERE w.course_id = ?
+        ORDER BY w.position
+        LIMIT 1
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(sql, (course_id,)).fetchone()
+            return WaitlistHead._make(row) if row else None
+
+    def get_place(self, student_id: int, course_id: int):
+        """
+        The student's place in a course's line (1 = next to get a seat), or None.
+        """
+        sql = f"""
+        SELECT {self.PLACE_SQL}
+        FROM waitlist_entries w
+        WHERE w.course_id = ? AND w.student_id = ?
+        """
+        with self.get_connection() as conn:
+            row = conn.execute(sql, (course_id, student_id)).fetchone()
+            return row[0] if row else None
+
+    def get_by_student(self, student_id: int):
+        """
+        Every line the student is waiting in, as WaitlistRow, oldest first.
+        """
+        sql = f"""
+        SELECT w.course_id, c.code, c.name, {self.PLACE_SQL} AS place, w.joined_at
+        FROM waitlist_entries w
+        JOIN courses c ON c.id = w.course_id
+        WHERE w.student_id = ?
+        ORDER BY w.joined_at, w.id
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute(sql, (student_id,))
+            return [WaitlistRow._make(row) for row in cursor.fetchall()]
@@ -7,11 +7,11 @@ from repositories.notification_repo import NotificationRepository
 from repositories.announcement_repo import AnnouncementRepository
 from datetime import datetime
 from core.base_service import BaseService
+from core.cache import ServiceCache
+from core.query_spec import QuerySpec
 
 from services.notification_service import NotificationService
 
-from database.db_connection import get_db_connection
-
 # Models
 from models.assignment import Assignment
 from models.submission import Submission
@@ -19,6 +19,9 @@ from models.grade import Grade
 from models.notification import Notification
 from models.announcement import Announcement
 
+# Assignment lists per course; invalidated by create_assignment / delete_assignment
+COURSE_ASSIGNMENTS_CACHE = ServiceCache.region("course_assignments", ttl=120, max_size=512)
+
 class AssignmentService(BaseService):
     """
     Central module for managing the Assignment Lifecycle:
@@ -34,7 +37,10 @@ class AssignmentService(BaseService):
         self.notification_repo = NotificationRepository()
         self.announcement_repo = AnnouncementRepository()
 
-    def _get_student_profile_id(self, user_id: int) -> int | None:
+    def _get_student_profile_id(self, user_id: int, student_profile_id: int = None) -> int | None:
+        # Controllers pass the ID resolved at login; other callers are looked up
+        if student_profile_id is not None:
+            return student_profile_id
         with self.enrollment_repo.get_connection() as conn:
             res = conn.execute("SELECT id FROM students WHERE user_id = ?", (user_id,)).fetchone()
             return res[0] if res else None
@@ -49,27 +55,30 @@ class AssignmentService(BaseService):
             if not course: raise ValueError("Course not found.")
             self.check_permission(course.instructor_id, instructor_id)
 
-            if datetime.fromisoformat(due_date) < datetime.now():
+            if Assignment.due_timestamp(due_date) < datetime.now().timestamp():
                 raise ValueError("Due date must be in the future.")
 
-            # 2. Create Assignment
-            assignment = Assignment(None, course_id, title, description, type, due_date, max_score)
-            saved_assignment = self.assignment_repo.create(assignment)
-
-            # 3.Create System Announcement 
-            sys_announcement = Announcement(
-                id=None,
-                course_id=course_id,
-                title=f"New Assignment: {title}",
-                message=f"A new {type} has been posted. Due: {due_date}",
-                created_at=datetime.now().isoformat()
-            )
-            saved_ann = self.announcement_repo.create(sys_announcement)
-
-            # 4. Notification Logic
-            notification_service = NotificationService()
-            notification_service.notify_course(course_id, saved_ann.id)
-            
+            # Assignment, announcement and notifications are saved together or not at all
+            with self.unit_of_work():
+                # 2. Create Assignment
+                assignment = Assignment(None, course_id, title, description, type, due_date, max_score)
+                saved_assignment = self.assignment_repo.create(assignment)
+
+                # 3.Create System Announcement 
+                sys_announcement = Announcement(
+                    id=None,
+                    course_id=course_id,
+                    title=f"New Assignment: {title}",
+                    message=f"A new {type} has been posted. Due: {due_date}",
+                    created_at=datetime.now().isoformat()
+                )
+                saved_ann = self.announcement_repo.create(sys_announcement)
+
+                # 4. Notification Logic
+                notification_service = NotificationService()
+                notification_service.notify_course(course_id, saved_ann.id)
+
+            COURSE_ASSIGNMENTS_CACHE.invalidate(course_id)
             return saved_assignment
 
         except Exception as e:
@@ -83,7 +92,7 @@ class AssignmentService(BaseService):
         Fetches all assignments for a specific course.
         """
         try:
-            return self.assignment_repo.get_by_course_id(course_id)
+            return COURSE_ASSIGNMENTS_CACHE.get(course_id, lambda: self.assignment_repo.get_by_course_id(course_id))
         except Exception as e:
             self.handle_db_error(e)
             return []
@@ -91,64 +100,22 @@ class AssignmentService(BaseService):
     # ---------------------------------------------------------
     # 3. STUDENT UI: Get Status List (Critical for UI)
     # ---------------------------------------------------------
-    def get_student_assignments(self, user_id: int, course_id: int = None):
+    def get_student_assignments(self, user_id: int, course_id: int = None, student_profile_id: int = None):
+        """
+        The student's assignments (all enrolled courses, or one course) with
+        course_code, submission_id, grade and status (Pending/Submitted/Overdue/Graded).
+        One set-based query, plus the enrollment check in single-course mode.
+        """
         try:
-            student_profile_id = self._get_student_profile_id(user_id)
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
             if not student_profile_id:
                 return []
 
-            results = []
-            now = datetime.now()
-            courses_map = {}
-
-            if course_id:
-                # Single course mode
-                if not self.enrollment_repo.is_enrolled(user_id, course_id):
-                    raise PermissionError("Not enrolled in this course.")
-                courses_map[course_id] = self.course_repo.get_by_id(course_id)
-                assignments = self.assignment_repo.get_by_course_id(course_id)
-                submissions = self.submission_repo.get_by_student_and_course(student_profile_id, course_id)
-            else:
-                # All courses mode
-                enrollments = self.enrollment_repo.get_by_student_id(student_profile_id)
-                course_ids = [e.course_id for e in enrollments if e.status == 'enrolled']
-                if not course_ids:
-                    return []
-                courses_map = {cid: self.course_repo.get_by_id(cid) for cid in course_ids}
-                assignments = []
-                for cid in course_ids:
-                    assignments.extend(self.assignment_repo.get_by_course_id(cid))
-                submissions = self.submission_repo.get_by_student_id(student_profile_id)
-
-            submission_map = {s.assignment_id: s for s in submissions}
-
-            for asm in assignments:
-                if asm.course_id not in courses_map:
-                    continue  # Skip if course not loaded (edge case)
-                
-                status = "Pending"
-                submission = submission_map.get(asm.id)
-                grade = None
-                if submission:
-                    status = "Submitted"
-                    grade = self.grade_repo.get_by_submission_id(submission.id)
-                elif datetime.fromisoformat(asm.due_date) < now:
-                    status = "Overdue"
-
-                asm_data = asm.to_dict()
-                asm_data['course_code'] = courses_map[asm.course_id].code
-                asm_data['status'] = status
-                asm_data['submission_id'] = submission.id if submission else None
-                
-                if grade:
-                    asm_data['grade'] = grade.grade_value
-                    asm_data['feedback'] = grade.feedback
-
-                results.append(asm_data)
+            if course_id and not self.enrollment_repo.is_student_enrolled(student_profile_id, course_id):
+                raise PermissionError("Not enrolled in this course.")
 
-            # Sort by due date
-            results.sort(key=lambda x: x['due_date'])
-            return results
+            now = int(datetime.now().timestamp())
+            return self.assignment_repo.get_student_assignment_statuses(student_profile_id, now, course_id)
 
         except Exception as e:
             self.handle_db_error(e)
@@ -156,72 +123,71 @@ class AssignmentService(BaseService):
     # ---------------------------------------------------------
     # 4. STUDENT: Submit Assignment
     # ---------------------------------------------------------
-    def submit_assignment(self, user_id: int, assignment_id: int, content: str):
+    def submit_assignment(self, user_id: int, assignment_id: int, content: str, student_profile_id: int = None):
         try:
-            # 1. Fetch Assignment to check dates and course
-            assignment = self.assignment_repo.get_by_id(assignment_id)
-            if not assignment:
-                raise ValueError("Assignment not found.")
-
-            # 2. Security: Check Enrollment
-            if not self.enrollment_repo.is_enrolled(user_id, assignment.course_id):
-                raise PermissionError("You are not enrolled in this course.")
-            
-            # 3. Get the Student Profile ID for the database record
-            student_profile_id = self._get_student_profile_id(user_id)
-            if not student_profile_id:
-                raise ValueError("Student profile not found.")
-
-            # 4. Validation: Late Check
-            due_date = datetime.fromisoformat(assignment.due_date)
-            if datetime.now() > due_date:
-                raise ValueError("Submission Deadline has passed.")
-
-            # 5. Duplicate Check
-            existing_sub = self.submission_repo.get_by_student_and_assignment(student_profile_id, assignment_id)
-            
-            if existing_sub:
-                existing_sub.content = content
-                existing_sub.submitted_at = datetime.now().isoformat()
-                self.submission_repo.update(existing_sub)
-                sub = existing_sub
-            else:
-                new_sub = Submission(
-                    id=None,
-                    assignment_id=assignment_id,
-                    student_id=student_profile_id,
-                    content=content,
-                    submitted_at=datetime.now().isoformat()
-                )
-                sub = self.submission_repo.create(new_sub)
-
-            # 6. Notify Instructor
-            course = self.course_repo.get_by_id(assignment.course_id)
-            with self.course_repo.get_connection() as conn:
-                res = conn.execute("SELECT user_id FROM instructors WHERE id = ?", (course.instructor_id,)).fetchone()
-                instructor_user_id = res[0] if res else None
-
-            if instructor_user_id:
-                # Create announcement for submission
-                announcement_title = f"New Submission for {assignment.title}"
-                announcement_message = f"A student has submitted the assignment."
-                announcement_created_at = datetime.now().isoformat()
+            # One transaction (and one connection) for the whole flow
+            with self.unit_of_work():
+                # 1. Fetch Assignment to check dates and course
+                assignment = self.assignment_repo.get_by_id(assignment_id)
+                if not assignment:
+                    raise ValueError("Assignment not found.")
+
+                # 2. Get the Student Profile ID for the database record
+                student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
+                if not student_profile_id:
+                    raise ValueError("Student profile not found.")
+
+                # 3. Security: Check Enrollment
+                if not self.enrollment_repo.is_student_enrolled(student_profile_id, assignment.course_id):
+                    raise PermissionError("You are not enrolled in this course.")
+
+                # 4. Validation: Late Check
+                if assignment.due_at is not None and datetime.now().timestamp() > assignment.due_at:
+                    raise ValueError("Submission Deadline has passed.")
+
+                # 5. Duplicate Check
+                existing_sub = self.submission_repo.get_by_student_and_assignment(student_profile_id, assignment_id)
                 
-                with get_db_connection() as conn_ann:
-                    cursor = conn_ann.execute("""
-                        INSERT INTO announcements (course_id, title, message, created_at)
-                        VALUES (?, ?, ?, ?)
-                    """, (assignment.course_id, announcement_title, announcement_message, announcement_created_at))
-                    announcement_id = cursor.lastrowid
-
-                notification = Notification(
-                    id=None,
-                    user_id=instructor_user_id,
-                    announcement_id=announcement_id,
-                    read_flag=0,
-                    sent_at=datetime.now().isoformat()
-                )
-                self.notification_repo.create(notification)
+                if existing_sub:
+                    existing_sub.content = content
+                    existing_sub.submitted_at = datetime.now().isoformat()
+                    self.submission_repo.update(existing_sub)
+                    sub = existing_sub
+                else:
+                    new_sub = Submission(
+                        id=None,
+                        assignment_id=assignment_id,
+                        student_id=student_profile_id,
+                        content=content,
+                        submitted_at=datetime.now().isoformat()
+                    )
+                    sub = self.submission_repo.create(new_sub)
+
+                # 6. Notify Instructor
+                course = self.course_repo.get_by_id(assignment.course_id)
+                with self.course_repo.get_connection() as conn:
+                    res = conn.execute("SELECT user_id FROM instructors WHERE id = ?", (course.instructor_id,)).fetchone()
+                    instructor_user_id = res[0] if res else None
+
+                if instructor_user_id:
+                    # Create announcement for submission
+                    announcement = Announcement(
+                        id=None,
+                        course_id=assignment.course_id,
+                        title=f"New Submission for {assignment.title}",
+                        message="A student has submitted the assignment.",
+                        created_at=datetime.now().isoformat()
+                    )
+                    saved_ann = self.announcement_repo.create(announcement)
+
+                    notification = Notification(
+                        id=None,
+                        user_id=instructor_user_id,
+                        announcement_id=saved_ann.id,
+                        read_flag=0,
+                        sent_at=datetime.now().isoformat()
+                    )
+                    self.notification_repo.create(notification)
 
             return sub
 
@@ -233,67 +199,70 @@ class AssignmentService(BaseService):
     # ---------------------------------------------------------
     def grade_assignment(self, instructor_id: int, submission_id: int, grade_value: float, feedback: str):
         try:
-            # 1. Fetch Context
-            submission = self.submission_repo.get_by_id(submission_id)
-            if not submission: 
-                raise ValueError("Submission not found.")
-            
-            assignment = self.assignment_repo.get_by_id(submission.assignment_id)
-            
-          
-            # 2.  VALIDATION: Grade Value
-            try:
-                val = float(grade_value)
-            except ValueError:
-                raise ValueError("Grade must be a valid number.")
-
-            if val < 0:
-                raise ValueError("Grade cannot be negative.")
-            
-            if val > assignment.max_score:
-                raise ValueError(f"Grade {val} exceeds the maximum score of {assignment.max_score}.")
-
-            # 3. Create OR Update Grade
-            existing_grade = self.grade_repo.get_by_submission_id(submission_id)
-            
-            saved_grade = None
-            if existing_grade:
-                existing_grade.grade_value = val
-                existing_grade.feedback = feedback
-                saved_grade = self.grade_repo.update(existing_grade)
-            else:
-                grade = Grade(None, submission_id, val, feedback)
-                saved_grade = self.grade_repo.create(grade)
-
-            # 4. Notification Logic
-            student_user_id = None
-            with self.enrollment_repo.get_connection() as conn:
-                res = conn.execute("SELECT user_id FROM students WHERE id = ?", (submission.student_id,)).fetchone()
-                student_user_id = res[0] if res else None
-
-            if student_user_id:
-                # A. Create a backend announcement to link the notification to
-                ann_title = f"Grade Posted: {assignment.title}"
-                ann_message = f"You received a score of {val}/{assignment.max_score}."
+            # One transaction (and one connection) for the whole flow
+            with self.unit_of_work():
+                # 1. Fetch Context
+                submission = self.submission_repo.get_by_id(submission_id)
+                if not submission: 
+                    raise ValueError("Submission not found.")
                 
-                sys_announcement = Announcement(
-                    id=None,
-                    course_id=assignment.course_id,
-                    title=ann_title,
-                    message=ann_message,
-                    created_at=datetime.now().isoformat()
-                )
-                saved_ann = self.announcement_repo.create(sys_announcement)
+                assignment = self.assignment_repo.get_by_id(submission.assignment_id)
+                
+              
+                # 2.  VALIDATION: Grade Value
+                try:
+                    val = float(grade_value)
+                except ValueError:
+                    raise ValueError("Grade must be a valid number.")
+
+                if val < 0:
+                    raise ValueError("Grade cannot be negative.")
+                
+                if val > assignment.max_score:
+                    raise ValueError(f"Grade {val} exceeds the maximum score of {assignment.max_score}.")
 
-                # B. Create the Notification for the specific student
-                notification = Notification(
-                    id=None,
-                    user_id=student_user_id,
-                    announcement_id=saved_ann.id,
-                    read_flag=0,
-                    sent_at=datetime.now().isoformat()
-                )
-                self.notification_repo.create(notification)
+                # 3. Create OR Update Grade
+                existing_grade = self.grade_repo.get_by_submission_id(submission_id)
+                
+                saved_grade = None
+                if existing_grade:
+                    existing_grade.grade_value = val
+                    existing_grade.feedback = feedback
+                    self.grade_repo.update(existing_grade)
+                    saved_grade = existing_grade
+                else:
+                    grade = Grade(None, submission_id, val, feedback)
+                    saved_grade = self.grade_repo.create(grade)
+
+                # 4. Notification Logic
+                student_user_id = None
+                with self.enrollment_repo.get_connection() as conn:
+                    res = conn.execute("SELECT user_id FROM students WHERE id = ?", (submission.student_id,)).fetchone()
+                    student_user_id = res[0] if res else None
+
+                if student_user_id:
+                    # A. Create a backend announcement to link the notification to
+                    ann_title = f"Grade Posted: {assignment.title}"
+                    ann_message = f"You received a score of {val}/{assignment.max_score}."
+                    
+                    sys_announcement = Announcement(
+                        id=None,
+                        course_id=assignment.course_id,
+                        title=ann_title,
+                        message=ann_message,
+                        created_at=datetime.now().isoformat()
+                    )
+                    saved_ann = self.announcement_repo.create(sys_announcement)
+
+                    # B. Create the Notification for the specific student
+                    notification = Notification(
+                        id=None,
+                        user_id=student_user_id,
+                        announcement_id=saved_ann.id,
+                        read_flag=0,
+                        sent_at=datetime.now().isoformat()
+                    )
+                    self.notification_repo.create(notification)
 
             return saved_grade
 
@@ -303,6 +272,17 @@ class AssignmentService(BaseService):
         except Exception as e:
             self.handle_db_error(e)
 
+    def get_grading_queue(self, assignment_id: int, cursor=None, limit: int = 50):
+        """
+        Newest-first Page of submissions (with any existing grade) for one assignment.
+        Pass the previous page's 'next_cursor' to continue.
+        """
+        try:
+            spec = QuerySpec(limit=limit).order("submitted_at", descending=True).after(cursor)
+            return self.submission_repo.get_grading_queue_page(assignment_id, spec)
+        except Exception as e:
+            self.handle_db_error(e)
+
     # ---------------------------------------------------------
     # 6. INSTRUCTOR: Delete Assignment
     # ---------------------------------------------------------
@@ -319,12 +299,13 @@ class AssignmentService(BaseService):
 
             # 3. Delete
             self.assignment_repo.delete(assignment_id)
+            COURSE_ASSIGNMENTS_CACHE.invalidate(asm.course_id)
             return True
 
         except Exception as e:
             self.handle_db_error(e)
 
-    def get_assignment_detail_for_student(self, user_id: int, assignment_id: int):
+    def get_assignment_detail_for_student(self, user_id: int, assignment_id: int, student_profile_id: int = None):
         """
         Fetches the assignment details AND the student's current submission (if any).
         Returns a dictionary for the View.
@@ -336,7 +317,7 @@ class AssignmentService(BaseService):
                 return None
 
             # 2. Resolve Student Profile ID
-            student_profile_id = self._get_student_profile_id(user_id)
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
 
             # 3. Fetch Submission (if student exists)
             submission = None
@@ -1,10 +1,21 @@
 from core.base_service import BaseService
+from core.cache import ServiceCache
+from core.query_spec import QuerySpec
 from models.course import Course
 
 # Repositories
 from repositories.course_repo import CourseRepository
 from repositories.enrollment_repo import EnrollmentRepository
 
+# Services
+from services.student_service import StudentService
+
+# Course rows change only through this service's write methods below, except
+# enrolled_count, which moves with every enrollment: cached counts may lag by up
+# to the TTL, so live seat counts come from get_catalog_page
+COURSE_CACHE = ServiceCache.region("courses", ttl=300, max_size=1024)
+CATALOG_CACHE = ServiceCache.region("course_catalog", ttl=60, max_size=4)
+
 class CourseService(BaseService):
     """
     Manages Course Resources.
@@ -14,6 +25,7 @@ class CourseService(BaseService):
     def __init__(self):
         self.course_repo = CourseRepository()
         self.enrollment_repo = EnrollmentRepository()
+        self.student_service = StudentService()
 
         
     # ---------------------------------------------------------
@@ -46,7 +58,9 @@ class CourseService(BaseService):
             )
 
             # 4. Save
-            return self.course_repo.create(new_course)
+            saved = self.course_repo.create(new_course)
+            self._invalidate_course(saved.id)
+            return saved
 
         except Exception as e:
             self.handle_db_error(e)
@@ -61,13 +75,19 @@ class CourseService(BaseService):
             if 'description' in data:
                 course.description = data['description']
             
+            old_capacity = course.max_students
             if 'max_students' in data:
                 try:
                     course.max_students = int(data['max_students'])
                 except ValueError:
                     pass 
 
-            self.course_repo.update(course)
+            # New seats go to the waitlist first, in the same transaction as the change
+            with self.unit_of_work():
+                self.course_repo.update(course)
+                if course.max_students > old_capacity:
+                    self.student_service.fill_from_waitlist(course_id)
+            self._invalidate_course(course_id)
             return True
         except Exception as e:
             self.handle_db_error(e)
@@ -120,21 +140,22 @@ class CourseService(BaseService):
             # 3. Update the model and save
             course.instructor_id = instructor_profile_id
             self.course_repo.update(course)
+            self._invalidate_course(course_id)
             return True
         except Exception as e:
             self.handle_db_error(e)
             return False
 
-    def get_unassigned_courses(self):
-        """Returns a list of Course objects where instructor_id is NULL."""
+    def get_unassigned_courses(self, cursor=None, limit: int = 50):
+        """
+        Returns a Page of CourseListRow (id, code, name) where instructor_id is NULL,
+        ordered by code. Pass the previous page's 'next_cursor' to continue.
+        """
         try:
-            # Fetch all courses from the repo
-            all_courses = self.course_repo.get_all()
-            # Filter for those with no instructor
-            return [c for c in all_courses if c.instructor_id is None]
+            spec = QuerySpec(limit=limit).where("instructor_id", op="IS NULL").order("code").after(cursor)
+            return self.course_repo.find_list_page(spec)
         except Exception as e:
             self.handle_db_error(e)
-            return []
         
     def drop_course(self, course_id: int) -> bool:
         """Removes the instructor from the course so it becomes unassigned."""
@@ -143,6 +164,7 @@ class CourseService(BaseService):
             if course:
                 course.instructor_id = None 
                 self.course_repo.update(course) # Save change
+                self._invalidate_course(course_id)
                 return True
             return False
         except Exception as e:
@@ -155,18 +177,14 @@ class CourseService(BaseService):
     def get_all_courses(self):
         """Public Course Catalog."""
         try:
-            return self.course_repo.get_all()
+            return CATALOG_CACHE.get("all", self.course_repo.get_all)
         except Exception as e:
             self.handle_db_error(e)
 
     def search_courses(self, query: str):
-        """Optional: Search by name or code."""
+        """Full-text search on code, name and description; best match first."""
         try:
-            all_courses = self.course_repo.get_all()
-            return [
-                c for c in all_courses 
-                if query.lower() in c.name.lower() or query.lower() in c.code.lower()
-            ]
+            return self.course_repo.search(query)
         except Exception as e:
             self.handle_db_error(e)
 
@@ -175,44 +193,32 @@ class CourseService(BaseService):
         Fetches a single course by ID.
         """
         try:
-            return self.course_repo.get_by_id(course_id)
+            return COURSE_CACHE.get(course_id, lambda: self.course_repo.get_by_id(course_id))
         except Exception as e:
             self.handle_db_error(e)
     
-    def get_all_courses_with_details(self):
+    def get_catalog_page(self, user_id: int, query: str = None, cursor=None, limit: int = 50):
+        """
+        One page of the student catalog with instructor names, seat counts and
+        the student's own enrollment flag, loaded in a single query.
+        With 'query', courses are full-text matched and carry a highlighted 'snippet'.
+        Returns a Page of CatalogCard; pass its 'next_cursor' back for the next page.
+        """
         try:
-            courses = self.get_all_courses()
-            results = []
-            for c in courses:
-                d = c.to_dict() if hasattr(c, 'to_dict') else vars(c)
-                with self.course_repo.get_connection() as conn:
-                    res = conn.execute("""
-                        SELECT u.name 
-                        FROM instructors i 
-                        JOIN users u ON i.user_id = u.id 
-                        WHERE i.id = ?
-                    """, (c.instructor_id,)).fetchone()
-                    d['instructor_name'] = res[0] if res else "Unknown"
-                results.append(d)
-            return results
+            # Searches are ranked by relevance, the full catalog is listed by code
+            spec = QuerySpec(limit=limit).after(cursor)
+            return self.course_repo.get_catalog_page(user_id, spec, query)
         except Exception as e:
             self.handle_db_error(e)
-    
-    def search_courses_with_details(self, query: str):
+
+    def get_all_courses_with_details(self):
+        """All courses as dicts with 'instructor_name', loaded in one query."""
         try:
-            courses = self.search_courses(query)
-            results = []
-            for c in courses:
-                d = c.to_dict() if hasattr(c, 'to_dict') else vars(c)
-                with self.course_repo.get_connection() as conn:
-                    res = conn.execute("""
-                        SELECT u.name 
-                        FROM instructors i 
-                        JOIN users u ON i.user_id = u.id 
-                        WHERE i.id = ?
-                    """, (c.instructor_id,)).fetchone()
-                    d['instructor_name'] = res[0] if res else "Unknown"
-                results.append(d)
-            return results
+            return self.course_repo.get_all_with_instructor_names()
         except Exception as e:
-            self.handle_db_error(e)
\ No newline at end of file
+            self.handle_db_error(e)
+    
+    def _invalidate_course(self, course_id: int):
+        """Called after every course write so cached reads pick up the change."""
+        COURSE_CACHE.invalidate(course_id)
+        CATALOG_CACHE.invalidate()
@@ -0,0 +1,214 @@
+# services/enrollment_queue.py
+"""
+Registration-rush mode: enrollment requests are written by one thread.
+
+When registration opens, hundreds of students hit the same popular courses
+within seconds. Instead of every request resolving its profile and taking
+SQLite's write lock on its own connection, requests are queued and a single
+writer thread:
+
+- takes them in arrival order (first come, first served),
+- drains everything that queued up while it was busy (up to 'max_batch')
+  into ONE transaction, so one commit covers the whole batch,
+- resolves the student profiles its requesters didn't pass in one query,
+- admits each request with StudentService.admit (the same conditional
+  insert and refusal reasons as a direct enrollment), so seats go out in
+  queue order and a course can never be overfilled,
+- resolves each request's Future only after its batch has committed.
+
+Usage:
+    queue = ServiceLocator.get(EnrollmentQueue)
+    queue.enroll(user_id, course_id)                # blocks: True, or raises like StudentService
+    future = queue.submit(user_id, course_id)       # concurrent.futures.Future
+    queue.enroll(user_id, course_id, student_profile_id=Session.student_profile_id)
+"""
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from datetime import datetime
+
+from core.base_service import BaseService
+from database.db_connection import release_thread_connection
+from repositories.student_repo import StudentRepository
+from services.student_service import StudentService
+
+DEFAULT_MAX_BATCH = 128     # Requests per transaction; bounds how long one commit holds the lock
+
+_STOP = object()            # Shutdown sentinel
+
+
+class EnrollmentRequest:
+    """One queued 'enroll user in course' request and the Future its requester waits on."""
+    __slots__ = ("user_id", "course_id", "student_profile_id", "submitted_at", "future")
+
+    def __init__(self, user_id: int, course_id: int, student_profile_id: int = None):
+        self.user_id = user_id
+        self.course_id = course_id
+        self.student_profile_id = student_profile_id
+        self.submitted_at = time.perf_counter()
+        self.future = Future()
+
+
+class EnrollmentQueue(BaseService):
+    """FIFO enrollment queue with a single batching writer thread."""
+
+    def __init__(self, max_batch: int = DEFAULT_MAX_BATCH):
+        if max_batch < 1:
+            raise ValueError("Batch size must be at least 1.")
+        self.max_batch = max_batch
+
+        self.student_repo = StudentRepository()
+        self.student_service = StudentService()
+
+        self._queue = queue.SimpleQueue()
+        self._writer = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+        # --- Metrics ---
+        self._counts = {"submitted": 0, "admitted": 0, "refused": 0, "failed": 0, "batches": 0}
+        self._max_batch_seen = 0
+        self._latencies = deque(maxlen=2000)   # Seconds from submit to commit
+
+    # ---------------------------------------------------------
+    # Requesting
+    # ---------------------------------------------------------
+    def submit(self, user_id: int, course_id: int, student_profile_id: int = None) -> Future:
+        """
+        Queues one enrollment. The Future resolves to True once the seat is committed,
+        or raises ValueError with the reason ("Course is full.", ...) if it was refused.
+        Pass 'student_profile_id' if it is already known; otherwise the writer looks it up.
+        """
+        request = EnrollmentRequest(user_id, course_id, student_profile_id)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Enrollment queue has been shut down.")
+            self._ensure_writer()
+            self._counts["submitted"] += 1
+            # Enqueued under the lock so arrival order is queue order
+            self._queue.put(request)
+        return request.future
+
+    def enroll(self, user_id: int, course_id: int, timeout: float = None, student_profile_id: int = None):
+        """Blocking form of submit(), with the same contract as StudentService.enroll_course."""
+        try:
+            return self.submit(user_id, course_id, student_profile_id).result(timeout)
+        except Exception as e:
+            self.handle_db_error(e)
+
+    # ---------------------------------------------------------
+    # Lifecycle
+    # ---------------------------------------------------------
+    def _ensure_writer(self):
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._write_loop, daemon=True, name="EnrollmentWriter")
+            self._writer.start()
+
+    def shutdown(self, wait: bool = True):
+        """Stops accepting requests; the writer finishes everything already queued."""
+        with self._lock:
+            self._closed = True
+            writer = self._writer
+            if writer is not None:
+                self._queue.put(_STOP)
+        if wait and writer is not None:
+            writer.join()
+
+    # ---------------------------------------------------------
+    # Writer Side
+    # ---------------------------------------------------------
+    def _write_loop(self):
+        try:
+            while True:
+                batch, stop = self._next_batch()
+                if batch:
+                    self._apply(batch)
+                if stop:
+                    return
+        finally:
+            release_thread_connection()
+
+    def _next_batch(self):
+        """Blocks for the next request, then takes whatever else is already waiting."""
+        item = self._queue.get()
+        batch = []
+        while item is not _STOP:
+            # Requesters may have given up (Future.cancel) while queued
+            if item.future.set_running_or_notify_cancel():
+                batch.append(item)
+            if len(batch) >= self.max_batch:
+                return batch, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _apply(self, batch):
+        """Admits one batch in a single transaction, then resolves every Future."""
+        outcomes = []
+        try:
+            with self.unit_of_work():
+                profiles = self.student_repo.get_profile_ids_by_user_ids(
+                    {r.user_id for r in batch if r.student_profile_id is None})
+                now = datetime.now().isoformat()
+                for request in batch:
+                    student_profile_id = request.student_profile_id
+                    if student_profile_id is None:
+                        student_profile_id = profiles.get(request.user_id)
+                    outcomes.append(self._admit(request, student_profile_id, now))
+        except Exception as e:
+            # Nothing from this batch was committed
+            with self._lock:
+                self._counts["batches"] += 1
+                self._counts["failed"] += len(batch)
+            for request in batch:
+                request.future.set_exception(e)
+            return
+
+        committed_at = time.perf_counter()
+        with self._lock:
+            self._counts["batches"] += 1
+            self._max_batch_seen = max(self._max_batch_seen, len(batch))
+            self._latencies.extend(committed_at - r.submitted_at for r in batch)
+            for error in outcomes:
+                self._counts["admitted" if error is None else "refused"] += 1
+        for request, error in zip(batch, outcomes):
+            if error is None:
+                request.future.set_result(True)
+            else:
+                request.future.set_exception(error)
+
+    def _admit(self, request, student_profile_id, now):
+        """Tries one request inside the batch transaction. Returns None or the refusal."""
+        if student_profile_id is None:
+            return ValueError("Student profile not found.")
+        try:
+            self.student_service.admit(student_profile_id, request.course_id, now)
+            return None
+        except ValueError as e:
+            return e
+        except sqlite3.IntegrityError as e:
+            # A constraint or trigger rejected this row only; the batch carries on
+            return ValueError(str(e))
+
+    # ---------------------------------------------------------
+    # Metrics
+    # ---------------------------------------------------------
+    def metrics(self) -> dict:
+        with self._lock:
+            counts = dict(self._counts)
+            max_batch_seen = self._max_batch_seen
+            latencies = sorted(self._latencies)
+        processed = counts["admitted"] + counts["refused"] + counts["failed"]
+        return {
+            "queue_depth": self._queue.qsize(),
+            "max_batch_seen": max_batch_seen,
+            "avg_batch": round(processed / counts["batches"], 2) if counts["batches"] else 0.0,
+            "avg_latency_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            "max_latency_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            **counts,
+        }
@@ -1,10 +1,16 @@
+from datetime import datetime
 from typing import List, Optional
 from core.base_service import BaseService
+from core.cache import ServiceCache
+from core.query_spec import QuerySpec
 from repositories.instructor_repo import InstructorRepository
 from repositories.course_repo import CourseRepository
 # [FIX] We use this import now for Type Hinting
 from models.instructor import Instructor 
 
+# Keyed by user id; invalidated by update_department
+INSTRUCTOR_PROFILE_CACHE = ServiceCache.region("instructor_profiles", ttl=600, max_size=256)
+
 class InstructorService(BaseService):
     """
     Manages instructor-specific business logic.
@@ -19,7 +25,9 @@ class InstructorService(BaseService):
         Resolves a User ID to an Instructor model.
         """
         try:
-            profile: Instructor = self.instructor_repo.get_by_id(user_id)
+            profile: Instructor = INSTRUCTOR_PROFILE_CACHE.get(
+                user_id, lambda: self.instructor_repo.get_by_id(user_id)
+            )
             
             if not profile:
                 return None
@@ -47,6 +55,7 @@ class InstructorService(BaseService):
 
             # 4. Save
             self.instructor_repo.update(instructor)
+            INSTRUCTOR_PROFILE_CACHE.invalidate(instructor_id)
             return instructor
 
         except Exception as e:
@@ -63,40 +72,39 @@ class InstructorService(BaseService):
             self.handle_db_error(e)
             return []
 
+    def get_faculty_page(self, department: str = None, cursor=None, limit: int = 50):
+        """
+        Paged faculty directory ordered by name, optionally for one department.
+        Pass the previous page's 'next_cursor' to continue.
+        """
+        try:
+            spec = QuerySpec(limit=limit).order("name").after(cursor)
+            if department:
+                spec = spec.where("department", department)
+            return self.instructor_repo.find_page(spec)
+        except Exception as e:
+            self.handle_db_error(e)
+
     def get_dashboard_data(self, user_id: int):
         """
         Aggregates profile, courses, and quick stats for the dashboard.
+        Courses are TeachingCourseRow projections; 'pending_grades' counts
+        submissions that have no grade yet.
         """
         try:
             profile: Instructor = self.instructor_repo.get_by_id(user_id)
             if not profile: return {}
 
-            
-            if hasattr(self.course_repo, "get_by_instructor_id"):
-                courses = self.course_repo.get_by_instructor_id(profile.instructor_profile_id)
-            else:
-                # Fallback: Try the name you were using before, but on the correct REPO
-                courses = self.course_repo.get_courses_by_instructor(profile.instructor_profile_id)
-            
-            # --- CALCULATE STATS ---
-            total_students_across_all = 0
-            pending_grades = 0
-            
-            for c in courses:
-                # Count students via repo
-                count = self.course_repo.get_enrollment_count(c.id)
-                # Use the setter we added to the Course model
-                c.enrolled_count = count
-                
-                total_students_across_all += count
-                pending_grades += 5 
-            
+            # One aggregate query: counts and next deadline for every course
+            now = int(datetime.now().timestamp())
+            courses = self.course_repo.get_teaching_overview(profile.instructor_profile_id, now)
+
             stats = {
-                "students": total_students_across_all,
+                "students": sum(c.enrolled_count for c in courses),
                 "courses": len(courses),
-                "pending_grades": pending_grades
+                "pending_grades": sum(c.ungraded_count for c in courses)
             }
-            
+
             return {
                 "profile": profile,
                 "courses": courses,
@@ -1,47 +1,29 @@
 from typing import Optional
 from datetime import datetime, timedelta
 from core.base_service import BaseService
-from models.notification import Notification
+from core.query_spec import QuerySpec
 
 # Repositories
 from repositories.notification_repo import NotificationRepository
-from repositories.enrollment_repo import EnrollmentRepository
 from repositories.course_repo import CourseRepository
 
 class NotificationService(BaseService):
     def __init__(self):
         self.notification_repo = NotificationRepository()
-        self.enrollment_repo = EnrollmentRepository()
         self.course_repo = CourseRepository()
 
-    def notify_course(self, course_id: int, related_id: int):
+    def notify_course(self, course_id: int, related_id: int) -> int:
         """
         Bulk creates notifications for all ACTIVE students in a course.
+        Recipients are resolved and inserted by one INSERT ... SELECT; no per-student
+        objects are built. Returns how many students were notified.
         """
         try:
-            # 1. Get Active User IDs (FIXED)
-            # We now fetch the actual User IDs, not student profile IDs
-            user_ids = self.enrollment_repo.get_enrolled_user_ids(course_id)
-
-            if not user_ids:
-                return # No one to notify
-
-            # 2. Prepare Batch Data
-            notifications_to_send = []
-            now = datetime.now().isoformat()
-            
-            for uid in user_ids:
-                notifications_to_send.append(Notification(
-                    id=None,
-                    user_id=uid, # Correct User ID
-                    announcement_id=related_id,
-                    read_flag=0,
-                    sent_at=now
-                ))
-
-            # 3. Optimized Batch Insert
-            self.notification_repo.create_many(notifications_to_send)
-            
+            return self.notification_repo.create_for_course(
+                course_id=course_id,
+                announcement_id=related_id,
+                sent_at=datetime.now().isoformat()
+            )
         except Exception as e:
             self.handle_db_error(e)
 
@@ -77,4 +59,15 @@ class NotificationService(BaseService):
             return self.notification_repo.get_dashboard_notifications(user_id)
         except Exception as e:
             self.handle_db_error(e)
-            return []
\ No newline at end of file
+            return []
+
+    def get_notifications_page(self, user_id: int, cursor=None, limit: int = 50):
+        """
+        Newest-first Page of NotificationRow (title + message preview) for the inbox.
+        Pass the previous page's 'next_cursor' to continue.
+        """
+        try:
+            spec = QuerySpec(limit=limit).order("sent_at", descending=True).after(cursor)
+            return self.notification_repo.get_dashboard_notifications_page(user_id, spec)
+        except Exception as e:
+            self.handle_db_error(e)
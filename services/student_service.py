@@ -1,4 +1,4 @@
-from datetime import datetime, timedelta
+from datetime import datetime
 from core.base_service import BaseService
 
 # Repositories
@@ -9,10 +9,15 @@ from repositories.student_repo import StudentRepository
 from repositories.notification_repo import NotificationRepository
 from repositories.assignment_repo import AssignmentRepository
 from repositories.submission_repo import SubmissionRepository 
+from repositories.waitlist_repo import WaitlistRepository
+from repositories.announcement_repo import AnnouncementRepository
 
 # Models
 from models.submission import Submission
 from models.enrollment import Enrollment
+from models.waitlist_entry import WaitlistEntry
+from models.announcement import Announcement
+from models.notification import Notification
 
 # Services
 from services.notification_service import NotificationService
@@ -31,14 +36,18 @@ class StudentService(BaseService):
         self.notification_repo = NotificationRepository()
         self.assignment_repo = AssignmentRepository()
         self.submission_repo = SubmissionRepository()
+        self.waitlist_repo = WaitlistRepository()
+        self.announcement_repo = AnnouncementRepository()
         self.notification_service = NotificationService()
 
     # --- HELPER ---
-    def _get_student_profile_id(self, user_id: int) -> int | None:
+    def _get_student_profile_id(self, user_id: int, student_profile_id: int = None) -> int | None:
         """
-        Helper to resolve student profile ID from user ID using the Repository.
+        Helper to resolve student profile ID from user ID.
+        Controllers pass the profile ID resolved at login; other callers are looked up.
         """
-        # We use the method from your StudentRepository to ensure consistency
+        if student_profile_id is not None:
+            return student_profile_id
         return self.student_repo.get_profile_id_by_user_id(user_id)
 
     # =========================================================
@@ -47,16 +56,9 @@ class StudentService(BaseService):
     def get_student_by_user_id(self, user_id):
         """
         Returns the full Student model for a given User ID.
-        INCLUDES A PATCH to prevent 'no attribute student_id' errors.
+        'student.student_id' is an alias of the student profile ID.
         """
-        student = self.student_repo.get_by_id(user_id)
-        
-        if student:
-            
-            if not hasattr(student, 'student_id'):
-                student.student_id = student.student_profile_id
-                
-        return student
+        return self.student_repo.get_by_id(user_id)
 
     def get_students_by_course(self, course_id: int):
         """Fetches the list of students for the instructor's popup."""
@@ -69,96 +71,242 @@ class StudentService(BaseService):
     # =========================================================
     #  2. ENROLLMENT LOGIC
     # =========================================================
-    def enroll_course(self, user_id: int, course_id: int):
+    def enroll_course(self, user_id: int, course_id: int, student_profile_id: int = None):
         try:
-            student_profile_id = self._get_student_profile_id(user_id)
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
             if not student_profile_id:
                 raise ValueError("Student profile not found.")
 
-            if self.enrollment_repo.is_enrolled(user_id, course_id):
-                raise ValueError("Already enrolled in this course.")
-
-            enrollment = Enrollment(
-                id=None,
-                student_id=student_profile_id, 
-                course_id=course_id,
-                date_enrolled=datetime.now().isoformat(),
-                status="enrolled"
-            )
-            
-            self.enrollment_repo.create(enrollment)
+            with self.unit_of_work():
+                self.admit(student_profile_id, course_id)
             return True
         except Exception as e:
             self.handle_db_error(e)
 
-    def drop_course(self, user_id: int, course_id: int):
+    def admit(self, student_profile_id: int, course_id: int, date_enrolled: str = None) -> Enrollment:
+        """
+        Takes a seat for an already resolved student profile, or raises ValueError
+        with the reason it was refused. The single admission rule behind both
+        enroll_course and EnrollmentQueue, so the two paths refuse alike.
+        While students wait for the course, only the head of the line gets a seat.
+        Must run inside a transaction.
+        """
+        enrollment = Enrollment(
+            id=None,
+            student_id=student_profile_id,
+            course_id=course_id,
+            date_enrolled=date_enrolled or datetime.now().isoformat(),
+            status="enrolled"
+        )
+
+        # Capacity check and insert are one statement; only explain a refusal
+        if self.enrollment_repo.create_if_open(enrollment) is not None:
+            # The head of the line took the seat themselves: they stop waiting
+            entry = self.waitlist_repo.get_entry(student_profile_id, course_id)
+            if entry:
+                self.waitlist_repo.delete(entry.id)
+            return enrollment
+
+        state = self.enrollment_repo.get_admission_state(student_profile_id, course_id)
+        if state is None:
+            raise ValueError("Course not found.")
+        if state.is_enrolled:
+            raise ValueError("Already enrolled in this course.")
+        if not state.is_full and state.has_waitlist:
+            raise ValueError("Students are waiting for this course. Join the waitlist.")
+        raise ValueError("Course is full.")
+
+    def drop_course(self, user_id: int, course_id: int, student_profile_id: int = None):
         try:
-            student_profile_id = self._get_student_profile_id(user_id)
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
             if not student_profile_id:
                 raise ValueError("Student profile not found.")
 
-            if not self.enrollment_repo.is_enrolled(user_id, course_id):
-                raise ValueError("You are not enrolled in this course.")
+            # The freed seat goes to the head of the waitlist in the same transaction,
+            # so nobody else can take it in between
+            with self.unit_of_work():
+                if not self.enrollment_repo.is_student_enrolled(student_profile_id, course_id):
+                    raise ValueError("You are not enrolled in this course.")
 
-            return self.enrollment_repo.delete_enrollment(student_profile_id, course_id)
+                dropped = self.enrollment_repo.delete_enrollment(student_profile_id, course_id)
+                if dropped:
+                    self._promote_from_waitlist(course_id)
+            return dropped
+        except Exception as e:
+            self.handle_db_error(e)
+
+    # =========================================================
+    #  WAITLISTS
+    # =========================================================
+    def join_waitlist(self, user_id: int, course_id: int, student_profile_id: int = None) -> int:
+        """
+        Queues the student for a full course. Returns their place in line (1 = next).
+        """
+        try:
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
+            if not student_profile_id:
+                raise ValueError("Student profile not found.")
+
+            with self.unit_of_work():
+                course = self.course_repo.get_by_id(course_id)
+                if not course:
+                    raise ValueError("Course not found.")
+                if self.enrollment_repo.is_student_enrolled(student_profile_id, course_id):
+                    raise ValueError("Already enrolled in this course.")
+                if self.waitlist_repo.get_entry(student_profile_id, course_id):
+                    raise ValueError("Already on the waitlist for this course.")
+                if course.enrolled_count < course.max_students and not self.waitlist_repo.get_head(course_id):
+                    raise ValueError("This course still has open seats. Enroll instead.")
+
+                self.waitlist_repo.create(WaitlistEntry(
+                    id=None,
+                    course_id=course_id,
+                    student_id=student_profile_id,
+                    position=None,
+                    joined_at=datetime.now().isoformat()
+                ))
+                return self.waitlist_repo.get_place(student_profile_id, course_id)
+        except Exception as e:
+            self.handle_db_error(e)
+
+    def leave_waitlist(self, user_id: int, course_id: int, student_profile_id: int = None) -> bool:
+        try:
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
+            if not student_profile_id:
+                raise ValueError("Student profile not found.")
+
+            with self.unit_of_work():
+                entry = self.waitlist_repo.get_entry(student_profile_id, course_id)
+                if not entry:
+                    raise ValueError("You are not on the waitlist for this course.")
+                return self.waitlist_repo.delete(entry.id)
+        except Exception as e:
+            self.handle_db_error(e)
+
+    def get_waitlist_place(self, user_id: int, course_id: int, student_profile_id: int = None):
+        """The student's place in the course's line (1 = next), or None if not waiting."""
+        try:
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
+            if not student_profile_id:
+                return None
+            return self.waitlist_repo.get_place(student_profile_id, course_id)
         except Exception as e:
             self.handle_db_error(e)
 
-    def get_my_courses(self, user_id):
+    def get_my_waitlists(self, user_id: int, student_profile_id: int = None):
+        """Every line the student is waiting in, as WaitlistRow (course, place, joined_at)."""
+        try:
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
+            if not student_profile_id:
+                return []
+            return self.waitlist_repo.get_by_student(student_profile_id)
+        except Exception as e:
+            self.handle_db_error(e)
+
+    def fill_from_waitlist(self, course_id: int) -> list:
+        """
+        Promotes students from the head of the line until the course is full or
+        nobody is waiting (e.g. after its capacity was raised). Must run inside
+        the transaction that freed the seats. Returns the promoted WaitlistHeads.
+        """
+        promoted = []
+        head = self._promote_from_waitlist(course_id)
+        while head is not None:
+            promoted.append(head)
+            head = self._promote_from_waitlist(course_id)
+        return promoted
+
+    def _promote_from_waitlist(self, course_id: int):
+        """
+        Gives a free seat to the head of the course's waitlist and notifies them.
+        Must run inside the transaction that freed the seat. Returns the promoted
+        WaitlistHead, or None if nobody was waiting or there is still no free seat.
+        """
+        while True:
+            head = self.waitlist_repo.get_head(course_id)
+            if head is None:
+                return None
+
+            enrollment = Enrollment(
+                id=None,
+                student_id=head.student_id,
+                course_id=course_id,
+                date_enrolled=datetime.now().isoformat(),
+                status="enrolled"
+            )
+            if self.enrollment_repo.create_if_open(enrollment) is not None:
+                self.waitlist_repo.delete(head.id)
+                self._notify_promoted(head.user_id, course_id)
+                return head
+
+            if not self.enrollment_repo.is_student_enrolled(head.student_id, course_id):
+                # Still no free seat (e.g. capacity was lowered): the line keeps waiting
+                return None
+            # Enrolled some other way in the meantime: drop the stale entry, try the next student
+            self.waitlist_repo.delete(head.id)
+
+    def _notify_promoted(self, user_id: int, course_id: int):
+        """
+        Tells a promoted student they got the seat (announcement + personal notification).
+        The announcement is personal: it keeps its course but stays out of the course feed.
+        """
+        course = self.course_repo.get_by_id(course_id)
+        now = datetime.now().isoformat()
+
+        saved_ann = self.announcement_repo.create(Announcement(
+            id=None,
+            course_id=course_id,
+            title=f"Enrolled from Waitlist: {course.code}",
+            message=f"A seat opened up in {course.code} - {course.name} and you have been enrolled.",
+            created_at=now,
+            is_personal=True
+        ))
+        self.notification_repo.create(Notification(
+            id=None,
+            user_id=user_id,
+            announcement_id=saved_ann.id,
+            read_flag=0,
+            sent_at=now
+        ))
+
+    def get_my_courses(self, user_id, student_profile_id=None):
         """Returns detailed list of enrolled courses."""
         try:
-            student_profile_id = self._get_student_profile_id(user_id)
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
             if not student_profile_id: return []
             
-            courses = self.enrollment_repo.get_courses_by_student(student_profile_id)
-            results = []
-            for c in courses:
-                d = c.to_dict() if hasattr(c, 'to_dict') else vars(c)
-                # Fetch instructor name manually
-                with self.course_repo.get_connection() as conn:
-                    res = conn.execute("""
-                        SELECT u.name FROM instructors i 
-                        JOIN users u ON i.user_id = u.id 
-                        WHERE i.id = ?
-                    """, (c.instructor_id,)).fetchone()
-                    d['instructor_name'] = res[0] if res else "Unknown"
-                results.append(d)
-            return results
+            # Instructor names come from the same query (no lookup per course)
+            return self.enrollment_repo.get_course_details_by_student(student_profile_id)
         except Exception as e:
             self.handle_db_error(e)
 
     # =========================================================
     #  3. GRADES & TRANSCRIPT
     # =========================================================
-    def get_grades(self, user_id):
+    def get_grades(self, user_id, student_profile_id=None):
         """Alias for get_student_grades to match Controller calls."""
-        return self.get_student_grades(user_id)
-
-    def get_student_grades(self, user_id):
-        """Fetches all submissions and combines them with assignment details."""
-        student_profile_id = self._get_student_profile_id(user_id)
-        if not student_profile_id: return []
-
-        submissions = self.submission_repo.get_by_student_id(student_profile_id)
-        results = []
-        for sub in submissions:
-            assign = self.assignment_repo.get_by_id(sub.assignment_id)
-            grade = self.grade_repo.get_by_submission_id(sub.id)
-            
-            results.append({
-                "assignment_title": assign.title if assign else "Unknown",
-                "submitted_at": sub.submitted_at,
-                "status": "Graded" if grade else "Awaiting Grade",
-                "grade": grade.grade_value if grade else "-",
-                "max_score": assign.max_score if assign else 100,
-                "feedback": grade.feedback if grade else ""
-            })
-        return results
-
-    def get_transcript(self, user_id):
+        return self.get_student_grades(user_id, student_profile_id=student_profile_id)
+
+    def get_student_grades(self, user_id, course_id=None, submitted_from=None, submitted_to=None,
+                           student_profile_id=None):
+        """
+        The student's grade ledger (GradeLedgerRow per submission) in one query.
+        Optionally limited to one course and/or a submitted_at date range.
+        """
+        try:
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
+            if not student_profile_id: return []
+
+            return self.grade_repo.get_student_ledger(student_profile_id, course_id,
+                                                      submitted_from, submitted_to)
+        except Exception as e:
+            self.handle_db_error(e)
+            return []
+
+    def get_transcript(self, user_id, student_profile_id=None):
         """Returns formatted transcript data for GPA calculation."""
         try:
-            student_profile_id = self._get_student_profile_id(user_id)
+            student_profile_id = self._get_student_profile_id(user_id, student_profile_id)
             if not student_profile_id: return []
 
             raw_data = self.grade_repo.get_transcript_data(student_profile_id)
@@ -194,41 +342,13 @@ class StudentService(BaseService):
         
         return round(total_weighted / total_credits, 2) if total_credits > 0 else 0.0
 
-    def get_upcoming_deadlines(self, student_profile_id):
-        """Fetches upcoming assignments for the student."""
-        # 1. Get active courses
-        enrollments = self.enrollment_repo.get_by_student_id(student_profile_id)
-        active_ids = [e.course_id for e in enrollments if e.status == 'enrolled']
-        
-        # 2. Get submitted assignments to exclude them
-        subs = self.submission_repo.get_by_student_id(student_profile_id)
-        submitted_ids = {s.assignment_id for s in subs}
-        
-        upcoming = []
-        now = datetime.now()
-        limit = now + timedelta(days=30)
-
-        for cid in active_ids:
-            asses = self.assignment_repo.get_by_course_id(cid)
-            for a in asses:
-                if a.id in submitted_ids: continue
-                
-                try:
-                    due = datetime.fromisoformat(str(a.due_date))
-                    if due.hour == 0 and due.minute == 0:
-                        due = due.replace(hour=23, minute=59, second=59)
-                        
-                    if now < due <= limit:
-                        course = self.course_repo.get_by_id(cid)
-                        upcoming.append({
-                            "title": a.title,
-                            "course_code": course.code if course else "",
-                            "due_date": a.due_date
-                        })
-                except ValueError:
-                    continue
-
-        return sorted(upcoming, key=lambda x: x['due_date'])
+    def get_upcoming_deadlines(self, student_profile_id, days: int = 30):
+        """
+        Unsubmitted assignments due within the next 'days' days, soonest first
+        (DeadlineRow: title, course_code, due_date, due_at, ...). One query.
+        """
+        now = int(datetime.now().timestamp())
+        return self.assignment_repo.get_student_deadlines(student_profile_id, now, now + days * 86400)
 
     def get_dashboard_overview(self, user_id: int):
         """Aggregator that uses the smaller methods above."""
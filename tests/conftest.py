@@ -0,0 +1,126 @@
+"""
+Shared fixtures: a generated 'small' campus (see database/generate_campus.py),
+built once per test session and copied for every test, with the data layer
+pointed at the copy.
+"""
+import shutil
+import sqlite3
+from datetime import date
+
+import pytest
+
+from core.cache import ServiceCache
+from core.session import Session
+from database import db_connection
+from database.generate_campus import generate_campus
+
+
+class Campus:
+    """The test database plus representative users picked from it."""
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with sqlite3.connect(db_path) as conn:
+            # The student with the most coursework and the instructor with the most sections
+            self.student_user_id, self.student_profile_id = conn.execute("""
+                SELECT s.user_id, s.id FROM students s
+                JOIN submissions sub ON sub.student_id = s.id
+                GROUP BY s.id ORDER BY COUNT(*) DESC, s.id LIMIT 1
+            """).fetchone()
+            self.instructor_user_id = conn.execute("""
+                SELECT i.user_id FROM instructors i
+                JOIN courses c ON c.instructor_id = i.id
+                GROUP BY i.id ORDER BY COUNT(*) DESC, i.id LIMIT 1
+            """).fetchone()[0]
+
+    def connect(self):
+        """A direct connection for arranging and checking test data."""
+        return sqlite3.connect(self.db_path)
+
+    def scalar(self, sql, params=()):
+        conn = self.connect()
+        try:
+            return conn.execute(sql, params).fetchone()[0]
+        finally:
+            conn.close()
+
+    def full_course(self, seats=None):
+        """
+        A course with no free seat: its roster is cut to 'seats' students (if given)
+        and its capacity set to the number enrolled. Returns the course id.
+        """
+        conn = self.connect()
+        try:
+            course_id = conn.execute(
+                "SELECT id FROM courses WHERE enrolled_count > 0 ORDER BY id LIMIT 1").fetchone()[0]
+            if seats is not None:
+                conn.execute("""
+                    DELETE FROM enrollments WHERE course_id = ? AND id NOT IN (
+                        SELECT id FROM enrollments WHERE course_id = ? ORDER BY id LIMIT ?)
+                """, (course_id, course_id, seats))
+            conn.execute("UPDATE courses SET max_students = enrolled_count WHERE id = ?", (course_id,))
+            conn.commit()
+            return course_id
+        finally:
+            conn.close()
+
+    def enrolled_users(self, course_id, n=1):
+        """User ids of 'n' students enrolled in the course."""
+        conn = self.connect()
+        try:
+            return [row[0] for row in conn.execute("""
+                SELECT s.user_id FROM enrollments e JOIN students s ON s.id = e.student_id
+                WHERE e.course_id = ? AND e.status = 'enrolled' ORDER BY e.id LIMIT ?
+            """, (course_id, n))]
+        finally:
+            conn.close()
+
+    def outsiders(self, course_id, n=1):
+        """User ids of 'n' students NOT enrolled in the course."""
+        conn = self.connect()
+        try:
+            return [row[0] for row in conn.execute("""
+                SELECT user_id FROM students
+                WHERE id NOT IN (SELECT student_id FROM enrollments WHERE course_id = ?)
+                ORDER BY id LIMIT ?
+            """, (course_id, n))]
+        finally:
+            conn.close()
+
+    def seats(self, course_id):
+        """(enrolled_count column, enrolled rows, max_students) for the course."""
+        conn = self.connect()
+        try:
+            return conn.execute("""
+                SELECT c.enrolled_count,
+                       (SELECT COUNT(*) FROM enrollments e WHERE e.course_id = c.id AND e.status = 'enrolled'),
+                       c.max_students
+                FROM courses c WHERE c.id = ?
+            """, (course_id,)).fetchone()
+        finally:
+            conn.close()
+
+
+@pytest.fixture(scope="session")
+def campus_template(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("campus") / "campus_small.db")
+    generate_campus(path, "small", seed=42, base_date=date.today())
+    return path
+
+
+@pytest.fixture
+def campus(campus_template, tmp_path):
+    """A fresh copy of the small campus, used by every repository and service."""
+    db_path = str(tmp_path / "campus.db")
+    shutil.copy(campus_template, db_path)
+    db_connection.configure_pool(db_path=db_path)
+    ServiceCache.clear()
+    Session.current_user = None
+    # Open this thread's pooled connection now, so its setup PRAGMAs don't count against budgets
+    with db_connection.get_db_connection():
+        pass
+    try:
+        yield Campus(db_path)
+    finally:
+        db_connection.close_pool()
+        ServiceCache.clear()
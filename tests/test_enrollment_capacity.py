@@ -0,0 +1,100 @@
+"""
+Seat counting and the capacity guard (migration 5): enrolled_count follows
+every enrollment write, and no path can put a course over capacity.
+"""
+import sqlite3
+import threading
+from datetime import datetime
+
+import pytest
+
+from database import db_connection
+from services.student_service import StudentService
+
+
+def test_full_course_refuses_enrollment(campus):
+    course_id = campus.full_course()
+    before = campus.seats(course_id)
+
+    with pytest.raises(Exception, match="Course is full."):
+        StudentService().enroll_course(campus.outsiders(course_id)[0], course_id)
+    assert campus.seats(course_id) == before
+
+
+def test_already_enrolled_is_refused(campus):
+    course_id = campus.full_course()
+    student = campus.enrolled_users(course_id)[0]
+
+    with pytest.raises(Exception, match="Already enrolled"):
+        StudentService().enroll_course(student, course_id)
+
+
+def test_enrolled_count_follows_enroll_and_drop(campus):
+    course_id = campus.full_course()
+    conn = campus.connect()
+    conn.execute("UPDATE courses SET max_students = max_students + 1 WHERE id = ?", (course_id,))
+    conn.commit()
+    conn.close()
+    service = StudentService()
+    student = campus.outsiders(course_id)[0]
+    count = campus.seats(course_id)[0]
+
+    service.enroll_course(student, course_id)
+    assert campus.seats(course_id)[:2] == (count + 1, count + 1)
+
+    service.drop_course(student, course_id)
+    assert campus.seats(course_id)[:2] == (count, count)
+
+
+def test_trigger_rejects_raw_insert_into_full_course(campus):
+    course_id = campus.full_course()
+    student_id = campus.scalar(
+        "SELECT id FROM students WHERE id NOT IN (SELECT student_id FROM enrollments WHERE course_id = ?)",
+        (course_id,))
+    conn = campus.connect()
+    try:
+        with pytest.raises(sqlite3.IntegrityError, match="Course is full."):
+            conn.execute(
+                "INSERT INTO enrollments (student_id, course_id, date_enrolled, status) VALUES (?, ?, ?, 'enrolled')",
+                (student_id, course_id, datetime.now().isoformat()))
+    finally:
+        conn.close()
+
+
+def test_concurrent_direct_enrollments_never_overfill(campus):
+    course_id = campus.full_course(seats=0)
+    conn = campus.connect()
+    conn.execute("UPDATE courses SET max_students = 5 WHERE id = ?", (course_id,))
+    conn.commit()
+    conn.close()
+    students = campus.outsiders(course_id, 40)
+    threads = 8
+    db_connection.configure_pool(db_path=campus.db_path, max_size=threads + 2)
+
+    service = StudentService()
+    admitted, refused = [], []
+    lock = threading.Lock()
+
+    def worker(chunk):
+        try:
+            for user_id in chunk:
+                try:
+                    service.enroll_course(user_id, course_id)
+                    outcome, value = admitted, user_id
+                except Exception as e:
+                    outcome, value = refused, str(e)
+                with lock:
+                    outcome.append(value)
+        finally:
+            db_connection.release_thread_connection()
+
+    workers = [threading.Thread(target=worker, args=(students[i::threads],)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    assert len(admitted) == 5
+    # Refused for lack of seats, never by a lock timeout
+    assert refused == ["System Error: Course is full."] * (len(students) - 5)
+    assert campus.seats(course_id) == (5, 5, 5)
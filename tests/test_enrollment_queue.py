@@ -0,0 +1,92 @@
+"""
+EnrollmentQueue: one batching writer admits requests in arrival order and
+never overfills a course, however many threads submit at once.
+"""
+import threading
+
+import pytest
+
+from services.enrollment_queue import EnrollmentQueue
+
+
+@pytest.fixture
+def queue(campus):
+    queue = EnrollmentQueue()
+    yield queue
+    queue.shutdown()
+
+
+def open_course(campus, seats):
+    """An emptied course with 'seats' free seats."""
+    course_id = campus.full_course(seats=0)
+    conn = campus.connect()
+    conn.execute("UPDATE courses SET max_students = ? WHERE id = ?", (seats, course_id))
+    conn.commit()
+    conn.close()
+    return course_id
+
+
+def test_concurrent_requests_never_overfill(campus, queue):
+    course_id = open_course(campus, seats=10)
+    students = campus.outsiders(course_id, 120)
+    threads = 16
+    outcomes = []
+    lock = threading.Lock()
+
+    def worker(chunk):
+        for user_id in chunk:
+            try:
+                queue.enroll(user_id, course_id)
+                outcome = "admitted"
+            except Exception as e:
+                outcome = str(e)
+            with lock:
+                outcomes.append(outcome)
+
+    workers = [threading.Thread(target=worker, args=(students[i::threads],)) for i in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+    assert outcomes.count("admitted") == 10
+    assert outcomes.count("System Error: Course is full.") == len(students) - 10
+    assert campus.seats(course_id) == (10, 10, 10)
+
+    metrics = queue.metrics()
+    assert metrics["admitted"] == 10
+    assert metrics["failed"] == 0
+
+
+def test_seats_go_in_arrival_order(campus, queue):
+    course_id = open_course(campus, seats=3)
+    students = campus.outsiders(course_id, 6)
+
+    futures = [queue.submit(user_id, course_id) for user_id in students]
+    results = []
+    for future in futures:
+        try:
+            results.append(future.result(timeout=10))
+        except ValueError as e:
+            results.append(str(e))
+
+    assert results == [True, True, True] + ["Course is full."] * 3
+
+
+def test_refusal_reasons_match_direct_enrollment(campus, queue):
+    course_id = campus.full_course()
+
+    with pytest.raises(Exception, match="Already enrolled"):
+        queue.enroll(campus.enrolled_users(course_id)[0], course_id)
+    with pytest.raises(Exception, match="Course is full."):
+        queue.enroll(campus.outsiders(course_id)[0], course_id)
+    with pytest.raises(Exception, match="Course not found."):
+        queue.enroll(campus.outsiders(course_id)[0], 999999)
+    with pytest.raises(Exception, match="Student profile not found."):
+        queue.enroll(campus.instructor_user_id, course_id)
+
+
+def test_shutdown_rejects_new_requests(campus, queue):
+    queue.shutdown()
+    with pytest.raises(RuntimeError):
+        queue.submit(campus.student_user_id, 1)
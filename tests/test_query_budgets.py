@@ -0,0 +1,64 @@
+"""
+Query budgets for the hot read paths. An N+1 regression (one query per course,
+per assignment, ...) blows these fixed budgets on the small campus.
+"""
+from core.query_recorder import assert_max_queries
+from services.assignment_service import AssignmentService
+from services.course_service import CourseService
+from services.instructor_service import InstructorService
+from services.student_service import StudentService
+
+
+def test_student_grades(campus):
+    with assert_max_queries(2):
+        grades = StudentService().get_student_grades(campus.student_user_id)
+    assert grades
+
+
+def test_student_grades_with_session_profile(campus):
+    # Controllers pass the profile id resolved at login, which skips the lookup
+    with assert_max_queries(1):
+        grades = StudentService().get_student_grades(
+            campus.student_user_id, student_profile_id=campus.student_profile_id)
+    assert grades
+
+
+def test_all_courses_with_details(campus):
+    with assert_max_queries(1):
+        courses = CourseService().get_all_courses_with_details()
+    assert len(courses) == 40
+    assert all(c["instructor_name"] for c in courses)
+
+
+def test_catalog_page(campus):
+    with assert_max_queries(1):
+        page = CourseService().get_catalog_page(campus.student_user_id)
+    assert len(page) == 40
+
+
+def test_catalog_search(campus):
+    service = CourseService()
+    # The first search also checks once whether the FTS5 index exists
+    service.get_catalog_page(campus.student_user_id, "intro prog")
+    with assert_max_queries(1):
+        page = service.get_catalog_page(campus.student_user_id, "intro prog")
+    assert all(card.snippet for card in page)
+
+
+def test_student_assignments(campus):
+    with assert_max_queries(2):
+        assignments = AssignmentService().get_student_assignments(campus.student_user_id)
+    assert assignments
+
+
+def test_student_assignments_with_session_profile(campus):
+    with assert_max_queries(1):
+        assignments = AssignmentService().get_student_assignments(
+            campus.student_user_id, student_profile_id=campus.student_profile_id)
+    assert assignments
+
+
+def test_instructor_dashboard(campus):
+    with assert_max_queries(2):
+        data = InstructorService().get_dashboard_data(campus.instructor_user_id)
+    assert data["courses"]
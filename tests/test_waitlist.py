@@ -0,0 +1,133 @@
+"""
+Course waitlists: dense positions, promotion when a seat frees up, and free
+seats going to the line before anyone else.
+"""
+import pytest
+
+from repositories.announcement_repo import AnnouncementRepository
+from services.course_service import CourseService
+from services.enrollment_queue import EnrollmentQueue
+from services.student_service import StudentService
+
+
+@pytest.fixture
+def line(campus):
+    """A full course with three students waiting: (course_id, [first, second, third])."""
+    course_id = campus.full_course()
+    waiting = campus.outsiders(course_id, 3)
+    service = StudentService()
+    for place, user_id in enumerate(waiting, start=1):
+        assert service.join_waitlist(user_id, course_id) == place
+    return course_id, waiting
+
+
+def positions(campus, course_id):
+    conn = campus.connect()
+    try:
+        return [row[0] for row in conn.execute(
+            "SELECT position FROM waitlist_entries WHERE course_id = ? ORDER BY position", (course_id,))]
+    finally:
+        conn.close()
+
+
+def is_enrolled(campus, user_id, course_id):
+    return campus.scalar("""
+        SELECT COUNT(*) FROM enrollments e JOIN students s ON s.id = e.student_id
+        WHERE s.user_id = ? AND e.course_id = ? AND e.status = 'enrolled'
+    """, (user_id, course_id)) == 1
+
+
+def test_join_is_refused_while_seats_are_open(campus):
+    course_id = campus.full_course()
+    conn = campus.connect()
+    conn.execute("UPDATE courses SET max_students = max_students + 1 WHERE id = ?", (course_id,))
+    conn.commit()
+    conn.close()
+
+    with pytest.raises(Exception, match="open seats"):
+        StudentService().join_waitlist(campus.outsiders(course_id)[0], course_id)
+
+
+def test_positions_stay_dense_after_mid_line_leave(campus, line):
+    course_id, (first, second, third) = line
+    service = StudentService()
+
+    assert service.leave_waitlist(second, course_id)
+
+    assert positions(campus, course_id) == [1, 2]
+    assert service.get_waitlist_place(first, course_id) == 1
+    assert service.get_waitlist_place(third, course_id) == 2
+    assert service.get_waitlist_place(second, course_id) is None
+
+
+def test_drop_promotes_head_of_line(campus, line):
+    course_id, (first, second, third) = line
+    service = StudentService()
+    before = campus.seats(course_id)
+
+    service.drop_course(campus.enrolled_users(course_id)[0], course_id)
+
+    assert is_enrolled(campus, first, course_id)
+    assert service.get_waitlist_place(first, course_id) is None
+    assert service.get_waitlist_place(second, course_id) == 1
+    assert service.get_waitlist_place(third, course_id) == 2
+    assert campus.seats(course_id) == before
+
+
+def test_promotion_notice_reaches_only_the_promoted_student(campus, line):
+    course_id, (first, _, _) = line
+    feed_before = len(AnnouncementRepository().get_by_course_id(course_id))
+
+    StudentService().drop_course(campus.enrolled_users(course_id)[0], course_id)
+
+    assert len(AnnouncementRepository().get_by_course_id(course_id)) == feed_before
+    assert AnnouncementRepository().get_global() == []
+    announcement_id = campus.scalar(
+        "SELECT announcement_id FROM notifications WHERE user_id = ? ORDER BY id DESC LIMIT 1", (first,))
+    announcement = AnnouncementRepository().get_by_id(announcement_id)
+    assert announcement.title.startswith("Enrolled from Waitlist")
+    assert announcement.course_id == course_id
+    assert announcement.is_personal
+
+
+def test_walk_ins_cannot_take_a_seat_while_students_wait(campus, line):
+    course_id, (first, second, _) = line
+    # A seat frees up without going through the services
+    conn = campus.connect()
+    conn.execute("UPDATE courses SET max_students = max_students + 1 WHERE id = ?", (course_id,))
+    conn.commit()
+    conn.close()
+    walk_in = campus.outsiders(course_id, 4)[-1]
+
+    with pytest.raises(Exception, match="Students are waiting"):
+        StudentService().enroll_course(walk_in, course_id)
+    queue = EnrollmentQueue()
+    try:
+        with pytest.raises(Exception, match="Students are waiting"):
+            queue.enroll(walk_in, course_id)
+        with pytest.raises(Exception, match="Students are waiting"):
+            queue.enroll(second, course_id)
+    finally:
+        queue.shutdown()
+
+    # The head of the line may take it, and stops waiting
+    assert StudentService().enroll_course(first, course_id)
+    assert StudentService().get_waitlist_place(first, course_id) is None
+    assert StudentService().get_waitlist_place(second, course_id) == 1
+
+
+def test_raised_capacity_serves_the_line_first(campus, line):
+    course_id, waiting = line
+    walk_ins = campus.outsiders(course_id, 5)[3:]
+    capacity = campus.seats(course_id)[2]
+
+    CourseService().update_course(course_id, {"max_students": capacity + 4})
+
+    assert all(is_enrolled(campus, user_id, course_id) for user_id in waiting)
+    assert positions(campus, course_id) == []
+
+    service = StudentService()
+    assert service.enroll_course(walk_ins[0], course_id)
+    with pytest.raises(Exception, match="Course is full."):
+        service.enroll_course(walk_ins[1], course_id)
+    assert campus.seats(course_id) == (capacity + 4,) * 3
@@ -118,6 +118,12 @@ class CampusManagerView(BaseView):
                   font=FONTS["button"], relief="flat", padx=20, pady=10, cursor="hand2",
                   command=self.handle_claim_course).pack(side="right")
 
+        # Paging: the table only holds the pages loaded so far
+        self.next_cursor = None
+        self.load_more_btn = ttk.Button(btn_frame, text="Load more", style="Secondary.TButton",
+                                        command=self.load_more_unassigned, state="disabled")
+        self.load_more_btn.pack(side="left")
+
         # Load Initial Data
         self.refresh_unassigned_list()
 
@@ -175,21 +181,34 @@ class CampusManagerView(BaseView):
     def refresh_unassigned_list(self):
         self.controller.load_unassigned_courses(self.render_unassigned_table)
 
+    def load_more_unassigned(self):
+        self.controller.load_unassigned_courses(self.append_unassigned_rows, self.next_cursor)
+
     def render_unassigned_table(self, courses):
         if not hasattr(self, 'tree'): return
 
         # Clear table
         for item in self.tree.get_children():
             self.tree.delete(item)
-            
+
+        self.append_unassigned_rows(courses)
+
+    def append_unassigned_rows(self, courses):
+        """Adds one page of courses below the rows already shown."""
+        if not hasattr(self, 'tree'): return
+
+        self.next_cursor = getattr(courses, "next_cursor", None)
+        self.load_more_btn.config(state="normal" if self.next_cursor else "disabled")
+
         if not courses:
             return
 
-        for i, c in enumerate(courses):
+        start = len(self.tree.get_children())
+        for i, c in enumerate(courses, start):
             # Alternating row colors (Striping)
             tag = "even" if i % 2 == 0 else "odd"
             self.tree.insert("", "end", values=(c.id, c.code, c.name), tags=(tag,))
 
         # Configure the tags for striping
         self.tree.tag_configure("even", background="white")
-        self.tree.tag_configure("odd", background="#F9FAFB") # Very light gray
\ No newline at end of file
+        self.tree.tag_configure("odd", background="#F9FAFB") # Very light gray
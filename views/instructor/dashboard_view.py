@@ -1,3 +1,4 @@
+from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
 from core.base_view import BaseView
@@ -185,12 +186,16 @@ class InstructorDashboardView(BaseView):
         # Safely get attributes or use defaults
         schedule = getattr(course, 'schedule', 'TBA')
         room = getattr(course, 'room', 'Virtual')
-        enrolled = getattr(course, 'enrolled_count', 0)
-        capacity = getattr(course, 'capacity', 40)
+        if course.next_due_at is not None:
+            next_due = f"{course.next_due_title} ({datetime.fromtimestamp(course.next_due_at):%b %d})"
+        else:
+            next_due = "Nothing due"
 
         add_detail("SCHEDULE", schedule, "🕒")
         add_detail("LOCATION", room, "📍")
-        add_detail("ENROLLMENT", f"{enrolled} / {capacity} Students", "👥")
+        add_detail("ENROLLMENT", f"{course.enrolled_count} / {course.max_students} Students", "👥")
+        add_detail("TO GRADE", f"{course.ungraded_count} / {course.submission_count} Submissions", "📥")
+        add_detail("NEXT DUE", next_due, "📅")
 
         # -- Bottom Row: Action Buttons --
         actions = tk.Frame(card, bg="white")
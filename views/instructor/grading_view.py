@@ -89,6 +89,12 @@ class InstructorGradingView(BaseView):
         
         self.sub_tree.bind("<<TreeviewSelect>>", self.on_submission_select)
 
+        # Paging: submissions are loaded one page at a time
+        self.submissions_cursor = None
+        self.load_more_subs_btn = ttk.Button(sub_container, text="Load more", style="Secondary.TButton",
+                                             command=self.load_more_submissions, state="disabled")
+        self.load_more_subs_btn.pack(anchor="e", pady=(5, 0))
+
         # --- SECTION 3: GRADING FORM & WORK DISPLAY (Right) ---
         grade_container = tk.Frame(bottom_frame, bg="white", padx=20, pady=20, relief="raised")
         grade_container.pack(side="right", fill="both", expand=True, ipadx=10)
@@ -159,14 +165,24 @@ class InstructorGradingView(BaseView):
         # Call Controller
         self.controller.load_assignment_submissions(assign_id, self.update_submission_list)
 
+    def load_more_submissions(self):
+        self.controller.load_assignment_submissions(self.current_assignment_id, self.append_submissions,
+                                                    self.submissions_cursor)
+
     def update_submission_list(self, submissions):
         """Callback to populate the bottom-left table."""
         for item in self.sub_tree.get_children():
             self.sub_tree.delete(item)
             
         self.submissions_map = {} 
-        
-        for sub in submissions:
+        self.append_submissions(submissions)
+
+    def append_submissions(self, submissions):
+        """Adds one page of submissions below the rows already shown."""
+        self.submissions_cursor = getattr(submissions, "next_cursor", None)
+        self.load_more_subs_btn.config(state="normal" if self.submissions_cursor else "disabled")
+
+        for sub in submissions or []:
             grade_display = sub['grade_value'] if sub['grade_value'] is not None else "Pending"
             row_id = self.sub_tree.insert("", "end", values=(sub['submission_id'], sub['student_name'], grade_display))
             self.submissions_map[row_id] = sub
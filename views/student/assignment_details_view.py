@@ -144,14 +144,8 @@ class AssignmentDetailsView(BaseView):
         self.txt_desc.config(state="disabled")
 
         # 3. Determine Logic State
-        now = datetime.now()
-        try:
-            due_dt = datetime.fromisoformat(asm.due_date)
-            if due_dt.hour == 0 and due_dt.minute == 0:
-                due_dt = due_dt.replace(hour=23, minute=59, second=59)
-            is_overdue = now > due_dt
-        except ValueError:
-            is_overdue = False
+        # due_at is normalized on write (a date-only due date means end of day)
+        is_overdue = asm.due_at is not None and datetime.now().timestamp() > asm.due_at
 
         # --- UI STATE MACHINE ---
         
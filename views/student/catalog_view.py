@@ -73,7 +73,12 @@ class StudentCatalogView(BaseView):
         self.canvas.bind('<Enter>', self._bind_mousewheel)
         self.canvas.bind('<Leave>', self._unbind_mousewheel)
 
-        # --- 5. Initial Load ---
+        # --- 5. Paging State ---
+        self.current_query = None
+        self.next_cursor = None
+        self.load_more_btn = None
+
+        # --- 6. Initial Load ---
         self.load_all()
 
     # --- SCROLLING LOGIC ---
@@ -120,26 +125,43 @@ class StudentCatalogView(BaseView):
 
     def load_all(self):
         self.search_entry.delete(0, tk.END)
+        self.current_query = None
         self.controller.load_catalog_data(self.display_courses)
 
     def perform_search(self):
-        query = self.search_entry.get().strip()
-        self.controller.load_catalog_data(self.display_courses, query)
+        self.current_query = self.search_entry.get().strip() or None
+        self.controller.load_catalog_data(self.display_courses, self.current_query)
+
+    def load_more(self):
+        self.controller.load_catalog_data(self.append_courses, self.current_query, self.next_cursor)
 
-    def display_courses(self, data):
+    def display_courses(self, page):
         for widget in self.cards_frame.winfo_children():
             widget.destroy()
+        self.load_more_btn = None
+        self.canvas.yview_moveto(0)
 
-        courses = data.get("courses", [])
-        enrolled_ids = data.get("enrolled_ids", [])
-
-        if not courses:
+        if not page:
             tk.Label(self.cards_frame, text="No courses found matching your search.", 
                      font=FONTS["h2"], bg=COLORS["background"], fg=COLORS["placeholder"]).pack(pady=40)
             return
 
-        for course in courses:
-            self.create_course_card(course, course['id'] in enrolled_ids)
+        self.append_courses(page)
+
+    def append_courses(self, page):
+        """Adds one catalog page below the cards already shown."""
+        if self.load_more_btn:
+            self.load_more_btn.destroy()
+            self.load_more_btn = None
+
+        for course in page.items:
+            self.create_course_card(course, course.is_enrolled)
+
+        self.next_cursor = page.next_cursor
+        if self.next_cursor:
+            self.load_more_btn = ttk.Button(self.cards_frame, text="Load more", 
+                                            style="Secondary.TButton", command=self.load_more)
+            self.load_more_btn.pack(pady=(0, 15))
 
     def create_course_card(self, course, is_enrolled):
         card = tk.Frame(self.cards_frame, bg=COLORS["surface"], padx=20, pady=20)
@@ -149,18 +171,21 @@ class StudentCatalogView(BaseView):
         info_frame = tk.Frame(card, bg=COLORS["surface"])
         info_frame.pack(side="left", fill="both", expand=True)
 
-        header_text = f"{course.get('code', 'CODE')} - {course.get('name', 'Course Name')}"
+        header_text = f"{course.code} - {course.name}"
         tk.Label(info_frame, text=header_text, font=FONTS["h2"], 
                  bg=COLORS["surface"], fg=COLORS["primary"], anchor="w").pack(fill="x")
 
-        instructor = course.get("instructor_name", "Unknown Instructor")
-        credits_num = course.get("credits", 3)
-        meta_text = f"👨‍🏫 {instructor}   •   Credits: {credits_num}"
+        instructor = course.instructor_name
+        credits_num = course.credits
+        seats_left = course.remaining_seats
+        meta_text = (f"👨‍🏫 {instructor}   •   Credits: {credits_num}   •   "
+                     f"Seats: {seats_left} of {course.max_students} left")
         
         tk.Label(info_frame, text=meta_text, font=FONTS["small_bold"], 
                  bg=COLORS["surface"], fg=COLORS["placeholder"], anchor="w").pack(fill="x", pady=(5, 5))
 
-        desc = course.get("description", "No description available.")
+        # Search results show the matching passage instead of the description start
+        desc = course.snippet or course.summary or "No description available."
         if len(desc) > 120: 
             desc = desc[:120] + "..."
             
@@ -179,9 +204,18 @@ class StudentCatalogView(BaseView):
             lbl_badge = tk.Label(badge_frame, text="✓ Enrolled", 
                                  font=FONTS["small_bold"], bg="#e8f5e9", fg=COLORS["success"])
             lbl_badge.pack()
+        elif course.waitlist_place is not None:
+            tk.Label(action_frame, text=f"Waitlisted (#{course.waitlist_place})", font=FONTS["small_bold"],
+                     bg=COLORS["surface"], fg=COLORS["placeholder"]).pack()
+        elif seats_left <= 0:
+            tk.Label(action_frame, text="Course Full", font=FONTS["small_bold"],
+                     bg=COLORS["surface"], fg=COLORS["placeholder"]).pack()
+            ttk.Button(action_frame, text="Join Waitlist", style="Secondary.TButton",
+                       command=lambda cid=course.id: self.confirm_waitlist(cid, header_text),
+                       cursor="hand2").pack(pady=(5, 0))
         else:
             btn = ttk.Button(action_frame, text="Enroll Now", style="Primary.TButton",
-                             command=lambda cid=course['id']: self.confirm_enrollment(cid, header_text),
+                             command=lambda cid=course.id: self.confirm_enrollment(cid, header_text),
                              cursor="hand2")
             btn.pack()
 
@@ -189,6 +223,17 @@ class StudentCatalogView(BaseView):
         if messagebox.askyesno("Confirm Enrollment", f"Do you want to enroll in {course_name}?"):
             self.controller.enroll_course(course_id, self.refresh_after_enroll)
 
+    def confirm_waitlist(self, course_id, course_name):
+        if messagebox.askyesno("Join Waitlist",
+                               f"{course_name} is full. Join the waitlist and get the next free seat?"):
+            self.controller.join_waitlist(course_id, self.refresh_after_waitlist)
+
+    def refresh_after_waitlist(self, place):
+        if place:
+            messagebox.showinfo("Waitlist", f"You are #{place} on the waitlist. "
+                                            "You will be enrolled and notified when a seat opens.")
+            self.perform_search()
+
     def refresh_after_enroll(self, success):
         if success:
             messagebox.showinfo("Success", "You have successfully enrolled!")
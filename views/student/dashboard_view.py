@@ -204,25 +204,21 @@ class StudentDashboardView(BaseView):
                 self._create_deadline_row(item)
 
     def _create_deadline_row(self, item):
-        course_code = item.get('course_code', '???')
-        title = item.get('title', 'Assignment')
-        raw_date = item.get('due_date')
+        course_code = item.course_code
+        title = item.title
         
         # Format Date nicely
         display_date = "No Date"
         urgency_color = COLORS["success"] # Default Green
         
-        if raw_date:
-            try:
-                dt_obj = datetime.fromisoformat(str(raw_date).replace(" ", "T")) 
-                display_date = dt_obj.strftime("%b %d, %I:%M %p")
-                
-                # Simple Urgency Logic
-                days_left = (dt_obj - datetime.now()).days
-                if days_left < 0: urgency_color = COLORS["danger"] # Overdue
-                elif days_left < 2: urgency_color = "#f39c12" # Orange (Soon)
-            except:
-                display_date = str(raw_date)
+        if item.due_at is not None:
+            dt_obj = datetime.fromtimestamp(item.due_at)
+            display_date = dt_obj.strftime("%b %d, %I:%M %p")
+            
+            # Simple Urgency Logic
+            days_left = (dt_obj - datetime.now()).days
+            if days_left < 0: urgency_color = COLORS["danger"] # Overdue
+            elif days_left < 2: urgency_color = "#f39c12" # Orange (Soon)
 
         # Container
         row = tk.Frame(self.deadline_container, bg=COLORS["surface"], height=60)
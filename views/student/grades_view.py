@@ -162,20 +162,20 @@ class StudentGradesView(BaseView):
         # 3. Insert new rows
         for index, item in enumerate(grades_data):
             # Parse Data
-            course_code = item.get('course_code', '---')
-            title = item.get('assignment_title', 'Untitled')
+            course_code = item.course_code
+            title = item.assignment_title
             
             # Date Formatting
-            raw_date = str(item.get('submitted_at', ''))
-            date_display = raw_date.replace("T", " ")[:10] if raw_date and raw_date != "None" else "-"
+            raw_date = item.submitted_at
+            date_display = raw_date.replace("T", " ")[:10] if raw_date else "-"
             
             # Grade Formatting
-            grade_val = item.get('grade')
-            max_val = item.get('max_score', 100)
+            grade_val = item.grade
+            max_val = item.max_score
             grade_display = f"{grade_val} / {max_val}" if grade_val is not None else "--"
             
             # Status Logic
-            status = item.get('status', 'Pending').title()
+            status = item.status.title()
             
             # Determine Tag for Color
             tag = "pending"
@@ -204,10 +204,10 @@ class StudentGradesView(BaseView):
             data = self.current_data[index]
 
             # Prepare Message
-            title = data.get('assignment_title', 'Assignment Details')
-            grade = data.get('grade', '--')
-            max_score = data.get('max_score', 100)
-            feedback = data.get('feedback')
+            title = data.assignment_title
+            grade = data.grade if data.grade is not None else '--'
+            max_score = data.max_score
+            feedback = data.feedback
             
             if not feedback:
                 feedback = "No written feedback provided."
@@ -50,7 +50,13 @@ class StudentNotificationsView(BaseView):
         
         # Mark All Read
         ttk.Button(toolbar, text="✓✓ Mark All Read", style="Secondary.TButton",
-                   command=self.mark_all_read).pack(side="left")
+                   command=self.mark_all_read).pack(side="left", padx=(0, 10))
+
+        # Load More (notifications are loaded one page at a time)
+        self.next_cursor = None
+        self.load_more_btn = ttk.Button(toolbar, text="Load more", style="Secondary.TButton",
+                                        command=self.load_more, state="disabled")
+        self.load_more_btn.pack(side="left")
 
         # Back Button (Right)
         tk.Button(toolbar, text="Back to Dashboard", font=FONTS["small"],
@@ -159,36 +165,50 @@ class StudentNotificationsView(BaseView):
                   background=[('selected', COLORS["primary"])],
                   foreground=[('selected', 'white')])
 
+    def load_more(self):
+        self.controller.load_notifications(self.append_list, self.next_cursor)
+
     def update_list(self, notifications):
         """Callback: Updates the treeview with data from Controller."""
         # Clear current list
         for item in self.tree.get_children():
             self.tree.delete(item)
 
+        # self.current_data stores the full objects so we can access them in popups
+        self.current_data = []
+        self.append_list(notifications)
+
+    def append_list(self, notifications):
+        """Adds one page of notifications below the rows already shown."""
+        self.next_cursor = getattr(notifications, "next_cursor", None)
+        self.load_more_btn.config(state="normal" if self.next_cursor else "disabled")
+
         if not notifications:
             return
 
-        # self.current_data stores the full objects so we can access them in popups
-        self.current_data = notifications 
+        start = len(self.current_data)
+        self.current_data.extend(notifications)
 
-        for index, notif in enumerate(notifications):
-            # Safe parsing
-            is_read = notif.get('read_flag', 0)
+        for index, notif in enumerate(notifications, start):
+            is_read = notif.read_flag
             status_text = "Read" if is_read else "Unread"
             tag = 'read' if is_read else 'unread'
             
             # Date Formatting
-            raw_date = str(notif.get('sent_at', ''))
-            display_date = raw_date.replace('T', ' ')[:16]
+            display_date = str(notif.sent_at or '').replace('T', ' ')[:16]
+
+            preview = notif.preview or ''
+            if len(preview) > 120:
+                preview = preview[:120] + "..."
 
             # Insert Row (Store index in iid)
             self.tree.insert(
                 "", "end", 
                 iid=index, 
                 values=(
-                    notif.get('title', 'Notification'), 
+                    notif.title or 'Notification', 
                     display_date, 
-                    notif.get('message', ''), 
+                    preview, 
                     status_text
                 ),
                 tags=(tag,)
@@ -203,7 +223,7 @@ class StudentNotificationsView(BaseView):
 
         index = int(selected[0])
         notif_item = self.current_data[index]
-        notif_id = notif_item.get('notification_id')
+        notif_id = notif_item.notification_id
 
         # Call Controller
         self.controller.mark_notification_read(notif_id, lambda: self.controller.load_notifications(self.update_list))
@@ -214,18 +234,20 @@ class StudentNotificationsView(BaseView):
             self.controller.mark_all_notifications_read(lambda: self.controller.load_notifications(self.update_list))
 
     def on_double_click(self, event):
-        """Shows the full message in a popup."""
+        """Loads the full message (the list only holds a preview) and shows it in a popup."""
         selected = self.tree.selection()
         if not selected:
             return
             
         index = int(selected[0])
         notif = self.current_data[index]
-        
-        # Show Popup
-        messagebox.showinfo(notif.get('title'), f"Date: {notif.get('sent_at')}\n\n{notif.get('message')}")
+        self.controller.load_announcement(notif.announcement_id, lambda ann: self.show_message(notif, ann))
+
+    def show_message(self, notif, announcement):
+        message = announcement.message if announcement else notif.preview
+        messagebox.showinfo(notif.title, f"Date: {notif.sent_at}\n\n{message}")
         
         # Auto-mark as read on open if it's currently unread
-        if notif.get('read_flag') == 0:
-            self.controller.mark_notification_read(notif.get('notification_id'), 
+        if notif.read_flag == 0:
+            self.controller.mark_notification_read(notif.notification_id, 
                                                    lambda: self.controller.load_notifications(self.update_list))
\ No newline at end of file